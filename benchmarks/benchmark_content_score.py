@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+#         PySceneDetect: Python-Based Video Scene Detector
+#   ---------------------------------------------------------------
+#     [  Site:   http://www.scenedetect.scenedetect.com/         ]
+#     [  Docs:   http://manual.scenedetect.scenedetect.com/      ]
+#     [  Github: https://github.com/Breakthrough/PySceneDetect/  ]
+#
+# Copyright (C) 2014-2022 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Micro-benchmark of the ContentDetector frame score calculation.
+
+Compares `calculate_frame_score`, which computes the absolute difference of each channel with
+`cv2.absdiff` into a reusable buffer, against the previous implementation which converted each
+HSV channel to int32 before subtracting them with numpy. Both are run on the same pairs of
+random frames at several resolutions, and the results are checked to be identical.
+
+Usage:
+
+    python benchmarks/benchmark_content_score.py [--repeat N]
+"""
+
+import argparse
+import time
+from typing import Iterable, Tuple
+
+import cv2
+import numpy
+
+from scenedetect.detectors.content_detector import calculate_frame_score
+
+RESOLUTIONS = {
+    '480p': (854, 480),
+    '1080p': (1920, 1080),
+    '4K': (3840, 2160),
+}
+
+
+def calculate_frame_score_int32(current_frame_hsv: Iterable[numpy.ndarray],
+                                last_frame_hsv: Iterable[numpy.ndarray]) -> Tuple[float]:
+    """Previous implementation of `calculate_frame_score`, used as a reference."""
+    current_frame_hsv = [x.astype(numpy.int32) for x in current_frame_hsv]
+    last_frame_hsv = [x.astype(numpy.int32) for x in last_frame_hsv]
+    delta_hsv = [0, 0, 0, 0]
+    for i in range(3):
+        num_pixels = current_frame_hsv[i].shape[0] * current_frame_hsv[i].shape[1]
+        delta_hsv[i] = numpy.sum(
+            numpy.abs(current_frame_hsv[i] - last_frame_hsv[i])) / float(num_pixels)
+    delta_hsv[3] = sum(delta_hsv[0:3]) / 3.0
+    return tuple(delta_hsv)
+
+
+def time_per_call(func, repeat: int) -> float:
+    """Return the fastest time in milliseconds of `repeat` calls to `func`."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = numpy.random.default_rng(0)
+    print('%-8s %14s %14s %9s' % ('size', 'int32 (ms)', 'absdiff (ms)', 'speedup'))
+    for name, (width, height) in RESOLUTIONS.items():
+        frames = [
+            cv2.cvtColor(
+                rng.integers(0, 256, size=(height, width, 3), dtype=numpy.uint8), cv2.COLOR_BGR2HSV)
+            for _ in range(2)
+        ]
+        split_frames = [cv2.split(frame) for frame in frames]
+        delta_buffer = numpy.empty_like(frames[0])
+
+        reference = calculate_frame_score_int32(*split_frames)
+        assert calculate_frame_score(*frames, delta_buffer) == reference
+        assert calculate_frame_score(*split_frames) == reference
+
+        int32_ms = time_per_call(lambda: calculate_frame_score_int32(*split_frames), args.repeat)
+        absdiff_ms = time_per_call(lambda: calculate_frame_score(*frames, delta_buffer),
+                                   args.repeat)
+        print('%-8s %14.2f %14.2f %8.1fx' % (name, int32_ms, absdiff_ms, int32_ms / absdiff_ms))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+#         PySceneDetect: Python-Based Video Scene Detector
+#   ---------------------------------------------------------------
+#     [  Site:   http://www.scenedetect.scenedetect.com/         ]
+#     [  Docs:   http://manual.scenedetect.scenedetect.com/      ]
+#     [  Github: https://github.com/Breakthrough/PySceneDetect/  ]
+#
+# Copyright (C) 2014-2022 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Benchmark of decoding frames in a separate process during scene detection.
+
+Compares `SceneManager.detect_scenes` decoding frames in a background thread (the default)
+against decoding them in a separate process which passes frames through shared memory (when
+`SceneManager.decode_process` is set), with each backend. The cuts found by both are checked to
+be identical. Decoding in a separate process only helps when more than one CPU core is available.
+
+Usage:
+
+    python benchmarks/benchmark_decode_process.py [--video PATH] [--backend NAME] [--frames N]
+"""
+
+import argparse
+import os
+import time
+
+from scenedetect import SceneManager
+from scenedetect.backends import AVAILABLE_BACKENDS
+from scenedetect.detectors import ContentDetector, ThresholdDetector
+
+
+def detect_scenes(path: str, backend: str, decode_process: bool, downscale: int):
+    """Detect scenes in `path`, returning the number of frames processed and the cuts found."""
+    video = AVAILABLE_BACKENDS[backend](path)
+    scene_manager = SceneManager()
+    scene_manager.decode_process = decode_process
+    scene_manager.auto_downscale = False
+    scene_manager.downscale = downscale
+    scene_manager.add_detector(ContentDetector())
+    scene_manager.add_detector(ThresholdDetector())
+    num_frames = scene_manager.detect_scenes(video=video)
+    return num_frames, scene_manager.get_cut_list()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--video', help='Video to use instead of generating one (requires PyAV).')
+    parser.add_argument('--backend', nargs='+', default=list(AVAILABLE_BACKENDS))
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    parser.add_argument('--frames', type=int, default=1800)
+    parser.add_argument('--downscale', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    path = args.video
+    if path is None:
+        from synthetic_video import generate_video, get_temp_video_path
+        path = get_temp_video_path('detect-%dx%d-%d' % (args.width, args.height, args.frames))
+        if not os.path.exists(path):
+            generate_video(path, width=args.width, height=args.height, num_frames=args.frames)
+
+    print('%-8s %-10s %-8s %8s %10s' % ('backend', 'downscale', 'decode', 'frames', 'fps'))
+    for backend in args.backend:
+        for downscale in args.downscale:
+            expected_cuts = None
+            for decode_process in (False, True):
+                best = None
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    num_frames, cuts = detect_scenes(path, backend, decode_process, downscale)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                if expected_cuts is None:
+                    expected_cuts = cuts
+                assert cuts == expected_cuts, 'Cuts differ when decoding in a separate process!'
+                print('%-8s %-10d %-8s %8d %10.1f' %
+                      (backend, downscale, 'process' if decode_process else 'thread', num_frames,
+                       num_frames / best))
+
+
+if __name__ == '__main__':
+    main()
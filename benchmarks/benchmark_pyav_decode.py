@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+#         PySceneDetect: Python-Based Video Scene Detector
+#   ---------------------------------------------------------------
+#     [  Site:   http://www.scenedetect.scenedetect.com/         ]
+#     [  Docs:   http://manual.scenedetect.scenedetect.com/      ]
+#     [  Github: https://github.com/Breakthrough/PySceneDetect/  ]
+#
+# Copyright (C) 2014-2022 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Micro-benchmark of frame decoding throughput with the PyAV backend.
+
+Compares `VideoStreamAv.read`, which keeps a single frame iterator alive between calls, against
+creating a new `container.decode()` generator for every frame (the previous implementation).
+Per-frame overhead matters most at high downscale factors, where each frame is cheap to
+convert, so each case is run at several downscale factors.
+
+Usage:
+
+    python benchmarks/benchmark_pyav_decode.py [--width W] [--height H] [--frames N]
+"""
+
+import argparse
+import math
+import os
+import time
+
+import av
+
+from scenedetect.backends.pyav import VideoStreamAv
+
+from synthetic_video import generate_video, get_temp_video_path
+
+
+def decode_per_frame_generator(path: str, downscale: int) -> int:
+    """Decode all frames by creating a new decode generator for each frame."""
+    container = av.open(path)
+    num_frames = 0
+    while True:
+        try:
+            frame = next(container.decode(video=0))
+        except (StopIteration, av.error.EOFError):
+            break
+        frame.to_ndarray(
+            width=math.ceil(frame.width / downscale),
+            height=math.ceil(frame.height / downscale),
+            format='bgr24')
+        num_frames += 1
+    container.close()
+    return num_frames
+
+
+def decode_video_stream(path: str, downscale: int) -> int:
+    """Decode all frames using `VideoStreamAv.read`."""
+    video = VideoStreamAv(path)
+    video.set_output_downscale(downscale)
+    num_frames = 0
+    while video.read() is not False:
+        num_frames += 1
+    return num_frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--width', type=int, default=640)
+    parser.add_argument('--height', type=int, default=360)
+    parser.add_argument('--frames', type=int, default=1800)
+    parser.add_argument('--downscale', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    path = get_temp_video_path('decode-%dx%d-%d' % (args.width, args.height, args.frames))
+    if not os.path.exists(path):
+        generate_video(path, width=args.width, height=args.height, num_frames=args.frames)
+
+    print('%-10s %-24s %8s %10s' % ('downscale', 'method', 'frames', 'fps'))
+    for downscale in args.downscale:
+        for name, method in (('generator per frame', decode_per_frame_generator),
+                             ('VideoStreamAv.read', decode_video_stream)):
+            best = None
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                num_frames = method(path, downscale)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            print('%-10d %-24s %8d %10.1f' % (downscale, name, num_frames, num_frames / best))
+
+
+if __name__ == '__main__':
+    main()
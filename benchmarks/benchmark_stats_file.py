@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+#
+#         PySceneDetect: Python-Based Video Scene Detector
+#   ---------------------------------------------------------------
+#     [  Site:   http://www.scenedetect.scenedetect.com/         ]
+#     [  Docs:   http://manual.scenedetect.scenedetect.com/      ]
+#     [  Github: https://github.com/Breakthrough/PySceneDetect/  ]
+#
+# Copyright (C) 2014-2022 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Benchmark of saving and loading stats files.
+
+Fills a `StatsManager` with random values for the `ContentDetector` metrics (with some frames
+missing metrics), and times saving/loading it as CSV and in the binary format. The CSV results
+are compared against the previous implementation, which wrote and parsed each row with the `csv`
+module and created a `FrameTimecode` for every row, and the files produced by both are checked
+to be identical.
+
+Usage:
+
+    python benchmarks/benchmark_stats_file.py [--frames N]
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+
+import numpy
+
+from scenedetect.frame_timecode import FrameTimecode
+from scenedetect.stats_manager import StatsManager, COLUMN_NAME_FRAME_NUMBER, COLUMN_NAME_TIMECODE
+
+METRIC_KEYS = ['content_val', 'delta_hue', 'delta_sat', 'delta_lum']
+
+
+def save_to_csv_rows(stats_manager: StatsManager, path: str):
+    """Previous implementation of `StatsManager.save_to_csv`, used as a reference."""
+    metric_keys = sorted(METRIC_KEYS)
+    frame_keys = numpy.flatnonzero(stats_manager.metrics_exist_range(metric_keys[:1], 0, 10**9))
+    with open(path, 'w') as csv_file:
+        csv_writer = csv.writer(csv_file, lineterminator='\n')
+        csv_writer.writerow([COLUMN_NAME_FRAME_NUMBER, COLUMN_NAME_TIMECODE] + metric_keys)
+        for frame_key in frame_keys.tolist():
+            frame_timecode = stats_manager._base_timecode + frame_key
+            csv_writer.writerow(
+                [frame_timecode.get_frames() +
+                 1, frame_timecode.get_timecode()] +
+                [str(metric) for metric in stats_manager.get_metrics(frame_key, metric_keys)])
+
+
+def load_from_csv_rows(path: str) -> StatsManager:
+    """Previous implementation of `StatsManager.load_from_csv`, used as a reference."""
+    stats_manager = StatsManager()
+    with open(path, 'r') as csv_file:
+        csv_reader = csv.reader(csv_file, lineterminator='\n')
+        metric_keys = next(csv_reader)[2:]
+        for row in csv_reader:
+            metric_dict = {}
+            for i, metric_str in enumerate(row[2:]):
+                if metric_str and metric_str != 'None':
+                    metric_dict[metric_keys[i]] = float(metric_str)
+            stats_manager.set_metrics(int(row[0]) - 1, metric_dict)
+    return stats_manager
+
+
+def timed(func, *args):
+    """Return the result of calling `func` and the time it took in seconds."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--frames', type=int, default=500000)
+    args = parser.parse_args()
+
+    rng = numpy.random.default_rng(0)
+    values = rng.random((args.frames, len(METRIC_KEYS))) * 255.0
+    stats_manager = StatsManager(FrameTimecode(0, 24000 / 1001))
+    stats_manager.register_metrics(METRIC_KEYS)
+    for frame_num, frame_values in enumerate(values.tolist()):
+        # The first frame has no ContentDetector metrics, so leave some frames empty.
+        if frame_num % 1000:
+            stats_manager.set_metrics(frame_num, dict(zip(METRIC_KEYS, frame_values)))
+    # Frames where only some metrics are set are written as None.
+    stats_manager.set_metrics(args.frames, {'content_val': 1.0})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = os.path.join(temp_dir, 'stats.csv')
+        reference_path = os.path.join(temp_dir, 'reference.csv')
+        binary_path = os.path.join(temp_dir, 'stats.stats')
+
+        _, reference_save = timed(save_to_csv_rows, stats_manager, reference_path)
+        _, csv_save = timed(stats_manager.save_to_csv, csv_path)
+        _, binary_save = timed(stats_manager.save_to_binary, binary_path)
+        with open(csv_path, 'rb') as csv_file, open(reference_path, 'rb') as reference_file:
+            assert csv_file.read() == reference_file.read()
+
+        reference, reference_load = timed(load_from_csv_rows, csv_path)
+        loaded_csv = StatsManager()
+        _, csv_load = timed(loaded_csv.load, csv_path)
+        loaded_binary = StatsManager()
+        _, binary_load = timed(loaded_binary.load, binary_path)
+        for loaded in (loaded_csv, loaded_binary):
+            for metric_key in METRIC_KEYS:
+                assert numpy.array_equal(
+                    loaded.get_metric_range(metric_key, 0, args.frames + 1),
+                    reference.get_metric_range(metric_key, 0, args.frames + 1),
+                    equal_nan=True)
+
+        print('%d frames (CSV: %.1f MB, binary: %.1f MB)' %
+              (args.frames, os.path.getsize(csv_path) / 1e6, os.path.getsize(binary_path) / 1e6))
+    print('%-6s %14s %14s %14s' % ('', 'rows (s)', 'csv (s)', 'binary (s)'))
+    print('%-6s %14.3f %14.3f %14.3f' % ('save', reference_save, csv_save, binary_save))
+    print('%-6s %14.3f %14.3f %14.3f' % ('load', reference_load, csv_load, binary_load))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+#         PySceneDetect: Python-Based Video Scene Detector
+#   ---------------------------------------------------------------
+#     [  Site:   http://www.scenedetect.scenedetect.com/         ]
+#     [  Docs:   http://manual.scenedetect.scenedetect.com/      ]
+#     [  Github: https://github.com/Breakthrough/PySceneDetect/  ]
+#
+# Copyright (C) 2014-2022 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+"""Helpers to generate synthetic inputs for the benchmarks in this folder.
+
+Generated videos consist of solid colour scenes with a moving box, with a hard cut every
+`scene_length` frames, so they can be produced anywhere PyAV is installed without having to
+download any test footage.
+"""
+
+from fractions import Fraction
+import os
+import tempfile
+from typing import Optional
+
+import av
+import numpy
+
+DEFAULT_CODEC = 'libx264'
+"""Codec used to encode synthetic videos. H.264 is used as it is the most common input."""
+
+
+def generate_frame(frame_num: int, width: int, height: int, scene_length: int) -> numpy.ndarray:
+    """Generate a BGR frame for the given frame number. Frames within the same scene share a
+    background colour, and contain a box that moves a few pixels every frame."""
+    scene = frame_num // scene_length
+    rng = numpy.random.default_rng(scene)
+    frame = numpy.empty((height, width, 3), dtype=numpy.uint8)
+    frame[:] = rng.integers(0, 255, 3, dtype=numpy.uint8)
+    box_size = max(1, min(width, height) // 4)
+    x = (frame_num * 4) % max(1, width - box_size)
+    y = (frame_num * 2) % max(1, height - box_size)
+    frame[y:y + box_size, x:x + box_size] = 255 - frame[0, 0]
+    return frame
+
+
+def generate_video(path: str,
+                   width: int = 640,
+                   height: int = 360,
+                   num_frames: int = 900,
+                   frame_rate: Fraction = Fraction(30000, 1001),
+                   scene_length: int = 90,
+                   gop_size: int = 250,
+                   codec: str = DEFAULT_CODEC) -> str:
+    """Encode a synthetic video to `path`.
+
+    Arguments:
+        path: Output path. The container format is derived from the extension.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        num_frames: Number of frames to encode.
+        frame_rate: Frame rate of the output video.
+        scene_length: Number of frames between each hard cut.
+        gop_size: Maximum number of frames between keyframes.
+        codec: Name of the codec to encode with.
+
+    Returns:
+        The output path.
+    """
+    container = av.open(path, 'w')
+    stream = container.add_stream(codec, rate=frame_rate)
+    stream.width = width
+    stream.height = height
+    stream.pix_fmt = 'yuv420p'
+    stream.options = {'g': str(gop_size)}
+    for frame_num in range(num_frames):
+        frame = av.VideoFrame.from_ndarray(
+            generate_frame(frame_num, width, height, scene_length), format='bgr24')
+        for packet in stream.encode(frame):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+    return path
+
+
+def get_temp_video_path(name: str, directory: Optional[str] = None) -> str:
+    """Get a path to write a synthetic video to, in the system temporary folder by default."""
+    if directory is None:
+        directory = tempfile.gettempdir()
+    return os.path.join(directory, 'pyscenedetect-benchmark-%s.mp4' % name)
@@ -172,7 +172,8 @@ def detect(video_path: str,
         detector: A `SceneDetector` instance (see :py:mod:`scenedetect.detectors` for a full list
             of detectors).
         stats_file_path: Path to save per-frame metrics to for statistical analysis or to
-            determine a better threshold value.
+            determine a better threshold value. Saved in the binary format if the path ends in
+            `.stats`, or as CSV otherwise.
         show_progress: Show a progress bar with estimated time remaining. Default is False.
 
     Returns:
@@ -190,6 +191,5 @@ def detect(video_path: str,
     scene_manager.add_detector(detector)
     scene_manager.detect_scenes(video=video, show_progress=show_progress)
     if not scene_manager.stats_manager is None:
-        scene_manager.stats_manager.save_to_csv(
-            path=stats_file_path, base_timecode=video.base_timecode)
+        scene_manager.stats_manager.save(path=stats_file_path)
     return scene_manager.get_scene_list()
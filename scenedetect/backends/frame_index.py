@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+#
+#         PySceneDetect: Python-Based Video Scene Detector
+#   ---------------------------------------------------------------
+#     [  Site:   http://www.scenedetect.scenedetect.com/         ]
+#     [  Docs:   http://manual.scenedetect.scenedetect.com/      ]
+#     [  Github: https://github.com/Breakthrough/PySceneDetect/  ]
+#
+# Copyright (C) 2014-2022 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+""":py:class:`FrameIndex` maps frame numbers of a video to presentation timestamps and the
+nearest keyframe, allowing frame-accurate seeking with the minimum amount of decoding.
+
+An index is built by demuxing every packet of the video stream (no frames are decoded), and is
+cached on disk so subsequent uses only need to load it:
+
+.. code:: python
+
+    from scenedetect.backends.frame_index import FrameIndex
+    index = FrameIndex.open('video.mp4')
+    print(index.num_frames, index.get_keyframe(1000))
+
+Indexes are stored in the user cache folder by default, and are keyed by the size, modification
+time, and a hash of several blocks of the video file, so they are rebuilt if the video changes.
+"""
+
+from logging import getLogger
+import os
+import os.path
+from typing import AnyStr, Optional
+
+#pylint: disable=c-extension-no-member
+import av
+from appdirs import user_cache_dir
+import numpy as np
+
+from scenedetect.platform import get_file_fingerprint
+
+logger = getLogger('pyscenedetect')
+
+INDEX_VERSION: int = 1
+"""Version of the index file format. Indexes saved with a different version are rebuilt."""
+
+INDEX_CACHE_DIR: str = os.path.join(user_cache_dir("PySceneDetect", False), 'index')
+"""Default folder indexes are saved to/loaded from."""
+
+
+class FrameIndexUnavailable(Exception):
+    """Raised when an index cannot be built for a video (e.g. packets are missing timestamps)."""
+
+
+def get_index_key(path: AnyStr) -> str:
+    """Get the key used to identify the index of a video file. The key is based on the size and
+    modification time of the file, as well as a hash of several evenly spaced blocks from it (see
+    :py:func:`scenedetect.platform.get_file_fingerprint`).
+
+    Arguments:
+        path: Path to video file.
+
+    Returns:
+        Hex digest uniquely identifying the current contents of the video file.
+    """
+    return get_file_fingerprint(path, prefix=b'%d:' % INDEX_VERSION)
+
+
+class FrameIndex:
+    """Presentation timestamp, keyframe flag, and packet size of every frame in a video stream,
+    in presentation order (i.e. the first entry corresponds to the first frame).
+
+    Timestamps are in units of the video stream's time base."""
+
+    def __init__(self, pts: np.ndarray, keyframe: np.ndarray, packet_size: np.ndarray):
+        """
+        Arguments:
+            pts: Presentation timestamp of each frame, in ascending order.
+            keyframe: True for each frame that is a keyframe, False otherwise.
+            packet_size: Size of the packet containing each frame, in bytes.
+        """
+        assert len(pts) == len(keyframe) == len(packet_size)
+        self.pts = pts
+        self.keyframe = keyframe
+        self.packet_size = packet_size
+        self._keyframe_nums = np.flatnonzero(keyframe)
+
+    @property
+    def num_frames(self) -> int:
+        """Number of frames in the video stream."""
+        return len(self.pts)
+
+    @property
+    def keyframe_nums(self) -> np.ndarray:
+        """Frame numbers of every keyframe (0-based), in ascending order."""
+        return self._keyframe_nums
+
+    def get_frame(self, pts: int) -> int:
+        """Get the frame number (0-based) with the given presentation timestamp. If no frame
+        has exactly the given timestamp, the last frame before it is returned."""
+        return max(0, int(np.searchsorted(self.pts, pts, side='right')) - 1)
+
+    def get_keyframe(self, frame_num: int) -> int:
+        """Get the frame number of the last keyframe at or before `frame_num` (both 0-based).
+        Returns 0 if there are no keyframes before `frame_num`."""
+        i = int(np.searchsorted(self._keyframe_nums, frame_num, side='right')) - 1
+        return int(self._keyframe_nums[i]) if i >= 0 else 0
+
+    @staticmethod
+    def build(path: AnyStr) -> 'FrameIndex':
+        """Build an index of the first video stream of a video by demuxing every packet.
+
+        Arguments:
+            path: Path to video file.
+
+        Raises:
+            FrameIndexUnavailable: The video has packets without a presentation timestamp.
+        """
+        pts, keyframe, packet_size = [], [], []
+        with av.open(path) as container:
+            stream = container.streams.video[0]
+            for packet in container.demux(stream):
+                # The last packet is empty and only used to flush the decoder.
+                if packet.size == 0:
+                    continue
+                if packet.pts is None:
+                    raise FrameIndexUnavailable('Video has packets without timestamps.')
+                pts.append(packet.pts)
+                keyframe.append(packet.is_keyframe)
+                packet_size.append(packet.size)
+        # Packets are stored in decode order, whereas frames are numbered in presentation order.
+        order = np.argsort(np.array(pts, dtype=np.int64), kind='stable')
+        return FrameIndex(
+            pts=np.array(pts, dtype=np.int64)[order],
+            keyframe=np.array(keyframe, dtype=bool)[order],
+            packet_size=np.array(packet_size, dtype=np.int32)[order])
+
+    @staticmethod
+    def load(path: AnyStr) -> 'FrameIndex':
+        """Load an index previously written with :py:meth:`save`."""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['version']) != INDEX_VERSION:
+                raise ValueError('Unsupported index version.')
+            return FrameIndex(
+                pts=data['pts'], keyframe=data['keyframe'], packet_size=data['packet_size'])
+
+    def save(self, path: AnyStr) -> None:
+        """Save the index to the given path (a `.npz` file)."""
+        with open(path, 'wb') as index_file:
+            np.savez(
+                index_file,
+                version=np.array(INDEX_VERSION),
+                pts=self.pts,
+                keyframe=self.keyframe,
+                packet_size=self.packet_size)
+
+    @staticmethod
+    def open(path: AnyStr, index_dir: Optional[AnyStr] = None) -> 'FrameIndex':
+        """Load the index of a video from `index_dir`, or build and save it if it does not exist
+        or the video has been modified since it was built.
+
+        Arguments:
+            path: Path to video file.
+            index_dir: Folder to store indexes in. If not set, uses :py:data:`INDEX_CACHE_DIR`.
+
+        Raises:
+            FrameIndexUnavailable: An index cannot be built for the video.
+        """
+        if index_dir is None:
+            index_dir = INDEX_CACHE_DIR
+        index_path = os.path.join(index_dir, '%s.npz' % get_index_key(path))
+        if os.path.exists(index_path):
+            try:
+                index = FrameIndex.load(index_path)
+                logger.debug('Loaded frame index: %s', index_path)
+                return index
+            except (OSError, ValueError, KeyError) as ex:
+                logger.warning('Failed to load frame index, rebuilding: %s', str(ex))
+        logger.info('Building frame index for %s', path)
+        index = FrameIndex.build(path)
+        try:
+            os.makedirs(index_dir, exist_ok=True)
+            index.save(index_path)
+            logger.debug('Saved frame index: %s', index_path)
+        except OSError as ex:
+            logger.warning('Failed to save frame index: %s', str(ex))
+        return index
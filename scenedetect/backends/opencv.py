@@ -17,15 +17,16 @@ Uses string identifier ``'opencv'``.
 
 from logging import getLogger
 import math
-from typing import Tuple, Union, Optional
+from typing import Any, Dict, Tuple, Union, Optional
 import os.path
 
 import cv2
-from numpy import ndarray
+from numpy import empty, ndarray
 
 from scenedetect.frame_timecode import FrameTimecode, MAX_FPS_DELTA
 from scenedetect.platform import get_file_name
-from scenedetect.video_stream import VideoStream, SeekError, VideoOpenFailure, FrameRateUnavailable
+from scenedetect.video_stream import (VideoStream, SeekError, VideoOpenFailure,
+                                      FrameRateUnavailable, PIXEL_FORMAT_BGR, PIXEL_FORMAT_GRAY)
 
 logger = getLogger('pyscenedetect')
 
@@ -88,6 +89,9 @@ class VideoStreamCv2(VideoStream):
         self._max_decode_attempts = max_decode_attempts
         self._decode_failures = 0
         self._warning_displayed = False
+        self._output_format = PIXEL_FORMAT_BGR
+        # Frame decoded before converting it into a batch, if `_output_format` is not BGR.
+        self._bgr_frame: Optional[ndarray] = None
 
         self._open_capture(framerate)
 
@@ -113,6 +117,12 @@ class VideoStreamCv2(VideoStream):
     BACKEND_NAME = 'opencv'
     """Unique name used to identify this backend."""
 
+    @property
+    def open_options(self) -> Dict[str, Any]:
+        """Keyword arguments, other than the path and framerate, which open the video again with
+        the same backend-specific options (e.g. in another process)."""
+        return {'max_decode_attempts': self._max_decode_attempts}
+
     @property
     def frame_rate(self) -> float:
         """Framerate in frames/sec."""
@@ -241,6 +251,21 @@ class VideoStreamCv2(VideoStream):
         self._cap.release()
         self._open_capture(self._frame_rate)
 
+    def set_output_format(self, pixel_format: str = PIXEL_FORMAT_BGR) -> bool:
+        """Convert frames returned by `read` to the given pixel format. OpenCV always decodes
+        frames to BGR, so each frame is converted with a single call to `cv2.cvtColor`.
+
+        Arguments:
+            pixel_format: Either `PIXEL_FORMAT_BGR` or `PIXEL_FORMAT_GRAY`.
+
+        Returns:
+            True if `pixel_format` is supported, False otherwise.
+        """
+        if pixel_format not in (PIXEL_FORMAT_BGR, PIXEL_FORMAT_GRAY):
+            return False
+        self._output_format = pixel_format
+        return True
+
     def read(self, decode: bool = True, advance: bool = True) -> Union[ndarray, bool]:
         """ Return next frame (or current if advance = False), or False if end of video.
 
@@ -278,9 +303,53 @@ class VideoStreamCv2(VideoStream):
         # Need to make sure we actually grabbed a frame before calling retrieve.
         if decode and self._has_grabbed:
             _, frame = self._cap.retrieve()
+            if self._output_format == PIXEL_FORMAT_GRAY:
+                return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
             return frame
         return self._has_grabbed
 
+    def read_batch(self, num_frames: int, out: Optional[ndarray] = None) -> Union[ndarray, bool]:
+        """ Read up to `num_frames` consecutive frames, stacked into a single array with shape
+        (N, height, width, channels). Frames are decoded (or converted, if the output format is
+        not BGR) directly into the batch without being copied. Fewer frames are returned if the
+        end of the video is reached.
+
+        Arguments:
+            num_frames: Maximum number of frames to read.
+            out: Array with shape (num_frames, height, width, channels) to store the frames in,
+                to avoid allocating a new one for each batch. If not set, one is allocated.
+
+        Returns:
+            Array of the frames that were read (a view of `out` if set), or False if the end of
+            the video was reached before reading any frames.
+
+        Raises:
+            ValueError: The size of a frame does not match the size of the batch.
+        """
+        num_read = 0
+        while num_read < num_frames and self.read(decode=False):
+            if self._output_format == PIXEL_FORMAT_GRAY:
+                _, self._bgr_frame = self._cap.retrieve(self._bgr_frame)
+                frame_shape = self._bgr_frame.shape[:2]
+                if out is None:
+                    out = empty((num_frames,) + frame_shape, dtype=self._bgr_frame.dtype)
+                if frame_shape != out.shape[1:]:
+                    raise ValueError('Size of frame does not match the size of the batch.')
+                cv2.cvtColor(self._bgr_frame, cv2.COLOR_BGR2GRAY, dst=out[num_read])
+            elif out is None:
+                _, frame = self._cap.retrieve()
+                out = empty((num_frames,) + frame.shape, dtype=frame.dtype)
+                out[0] = frame
+            else:
+                # Decodes into `out` if the frame has the same size, otherwise returns a new one.
+                _, frame = self._cap.retrieve(out[num_read])
+                if frame.shape != out.shape[1:]:
+                    raise ValueError('Size of frame does not match the size of the batch.')
+            num_read += 1
+        if num_read == 0:
+            return False
+        return out[:num_read]
+
     #
     # Private Methods
     #
@@ -16,15 +16,18 @@ Uses string identifier ``'pyav'``.
 """
 
 from logging import getLogger
-from typing import AnyStr, BinaryIO, Optional, Tuple, Union
+import math
+from typing import Any, AnyStr, BinaryIO, Dict, Optional, Tuple, Union
 
 #pylint: disable=c-extension-no-member
 import av
 from numpy import ndarray
 
+from scenedetect.backends.frame_index import FrameIndex, FrameIndexUnavailable
 from scenedetect.frame_timecode import FrameTimecode, MAX_FPS_DELTA
 from scenedetect.platform import get_file_name
-from scenedetect.video_stream import VideoStream, VideoOpenFailure, FrameRateUnavailable
+from scenedetect.video_stream import (VideoStream, VideoOpenFailure, FrameRateUnavailable,
+                                      PIXEL_FORMAT_BGR, PIXEL_FORMAT_GRAY)
 
 logger = getLogger('pyscenedetect')
 
@@ -50,6 +53,9 @@ class VideoStreamAv(VideoStream):
         name: Optional[str] = None,
         threading_mode: Optional[str] = None,
         suppress_output: bool = False,
+        keyframes_only: bool = False,
+        use_index: bool = False,
+        index_dir: Optional[str] = None,
     ):
         """Open a video by path.
 
@@ -72,6 +78,17 @@ class VideoStreamAv(VideoStream):
                 `av.logging.restore_default_callback()` before any other library calls. If True
                 the application may deadlock if threading_mode is set. See the PyAV documentation
                 for details: https://pyav.org/docs/stable/overview/caveats.html#sub-interpeters
+            keyframes_only: If True, only keyframes are decoded and returned by `read`. All other
+                packets are discarded without being decoded, which allows quickly scanning through
+                long videos at the expense of accuracy. Seeking will move to the first keyframe at
+                or after the target position.
+            use_index: If True, builds an index of every frame by demuxing the video (see
+                :py:class:`FrameIndex <scenedetect.backends.frame_index.FrameIndex>`), which is
+                used to seek with the minimum amount of decoding, and to obtain the exact duration
+                and frame number of each frame. Indexes are cached so they only need to be built
+                once per video. Only supported if `path_or_io` is a path.
+            index_dir: Folder to store indexes in if `use_index` is set. If not set, uses the
+                user cache folder (see :py:data:`scenedetect.backends.frame_index.INDEX_CACHE_DIR`).
 
         Raises:
             OSError: file could not be found or access was denied
@@ -90,7 +107,23 @@ class VideoStreamAv(VideoStream):
         self._name = '' if name is None else name
         self._path = ''
         self._frame = None
+        # Iterator over decoded frames, re-created whenever the container is seeked or re-opened.
+        self._decoder = None
         self._reopened = True
+        self._output_downscale = 1
+        self._output_format = PIXEL_FORMAT_BGR
+        self._keyframes_only = keyframes_only
+        self._fast_skip = False
+        # Last value assigned to the codec context's `skip_frame`, reset when re-opened.
+        self._skip_frame = None
+        self._index: Optional[FrameIndex] = None
+        self._open_options = {
+            'threading_mode': threading_mode,
+            'suppress_output': suppress_output,
+            'keyframes_only': keyframes_only,
+            'use_index': use_index,
+            'index_dir': index_dir,
+        }
 
         if threading_mode:
             threading_mode = threading_mode.upper()
@@ -133,6 +166,15 @@ class VideoStreamAv(VideoStream):
             assert framerate >= MAX_FPS_DELTA
             self._frame_rate: float = framerate
 
+        if use_index:
+            if self._path:
+                try:
+                    self._index = FrameIndex.open(self._path, index_dir)
+                except FrameIndexUnavailable as ex:
+                    logger.warning('Unable to use frame index: %s', str(ex))
+            else:
+                logger.warning('Unable to use frame index: input must be a path.')
+
         # Calculate duration after we have set the framerate.
         self._duration_frames = self._get_duration()
 
@@ -185,6 +227,8 @@ class VideoStreamAv(VideoStream):
         to the presentation time 0.  Returns 0 even if `frame_number` is 1."""
         if self._frame is None:
             return self.base_timecode
+        if self._index is not None and self._frame.pts is not None:
+            return FrameTimecode(self._index.get_frame(self._frame.pts), self.frame_rate)
         return FrameTimecode(round(self._frame.time * self.frame_rate), self.frame_rate)
 
     @property
@@ -204,6 +248,22 @@ class VideoStreamAv(VideoStream):
             return self.position.frame_num + 1
         return 0
 
+    @property
+    def index(self) -> Optional[FrameIndex]:
+        """Index of the frames in the video if `use_index` was set, None otherwise."""
+        return self._index
+
+    @property
+    def open_options(self) -> Dict[str, Any]:
+        """Keyword arguments, other than the path and framerate, which open the video again with
+        the same backend-specific options (e.g. in another process)."""
+        return dict(self._open_options)
+
+    @property
+    def keyframes_only(self) -> bool:
+        """True if only keyframes are decoded, False otherwise."""
+        return self._keyframes_only
+
     @property
     def aspect_ratio(self) -> float:
         """Pixel aspect ratio as a float (1.0 represents square pixels)."""
@@ -237,25 +297,93 @@ class VideoStreamAv(VideoStream):
         target = (self.base_timecode + target)
         if target >= 1:
             target = target - 1
+        if self._index is not None and not beginning:
+            self._seek_with_index(target.frame_num)
+            return
         target_pts = self._video_stream.start_time + int(
             (self.base_timecode + target).get_seconds() / self._video_stream.time_base)
         self._frame = None
         self._container.seek(target_pts, stream=self._video_stream)
-        if not beginning:
-            self.read(decode=False, advance=True)
-        while self.position < target:
-            if self.read(decode=False, advance=True) is False:
-                break
+        self._decoder = None
+        # Frames must not be dropped by the decoder while seeking, otherwise we could overshoot.
+        fast_skip = self._fast_skip
+        self._fast_skip = False
+        try:
+            if not beginning:
+                self.read(decode=False, advance=True)
+            while self.position < target:
+                if self.read(decode=False, advance=True) is False:
+                    break
+        finally:
+            self._fast_skip = fast_skip
 
     def reset(self):
         """ Close and re-open the VideoStream (should be equivalent to calling `seek(0)`). """
         self._container.close()
         self._frame = None
+        self._decoder = None
+        self._skip_frame = None
         try:
             self._container = av.open(self._path if self._path else self._io)
         except Exception as ex:
             raise VideoOpenFailure() from ex
 
+    def set_output_downscale(self, factor: int = 1) -> bool:
+        """Downscale frames returned by `read` by the given integer factor. Scaling is done by
+        ffmpeg (swscale) in the same pass as the conversion to BGR, which is considerably faster
+        than converting each frame at full resolution.
+
+        Nearest-neighbour sampling is used, which closely matches taking every `factor`-th pixel
+        of full resolution frames (as :py:class:`SceneManager
+        <scenedetect.scene_manager.SceneManager>` does for backends which do not support this).
+        Frame metrics still differ slightly, more so if the frame size is not a multiple of
+        `factor`, since pixels are then sampled at fractional positions.
+
+        Arguments:
+            factor: Integer factor to downscale frames by. Set to 1 to disable.
+
+        Returns:
+            True, as this backend supports downscaling frames during decoding.
+
+        Raises:
+            ValueError: `factor` is less than 1.
+        """
+        if factor < 1:
+            raise ValueError("Downscale factor must be a positive integer >= 1!")
+        self._output_downscale = int(factor)
+        return True
+
+    def set_output_format(self, pixel_format: str = PIXEL_FORMAT_BGR) -> bool:
+        """Convert frames returned by `read` to the given pixel format. Conversion is done by
+        ffmpeg (swscale) in the same pass as any downscaling. For `PIXEL_FORMAT_GRAY`, only the
+        luma plane of most videos needs to be copied, instead of converting every pixel to BGR.
+
+        Arguments:
+            pixel_format: Either `PIXEL_FORMAT_BGR` or `PIXEL_FORMAT_GRAY`.
+
+        Returns:
+            True if `pixel_format` is supported, False otherwise.
+        """
+        if pixel_format not in (PIXEL_FORMAT_BGR, PIXEL_FORMAT_GRAY):
+            return False
+        self._output_format = pixel_format
+        return True
+
+    def set_fast_skip(self, enabled: bool = False) -> bool:
+        """Skip decoding of non-reference frames when calling `read` with `decode` = False.
+        The decoder discards these frames as soon as they are demuxed, so `read` may advance by
+        more than one frame at a time while skipping. Frames are decoded normally again as soon
+        as `read` is called with `decode` = True.
+
+        Arguments:
+            enabled: True to skip non-reference frames, False to decode all frames.
+
+        Returns:
+            True, as this backend supports skipping frames without decoding them.
+        """
+        self._fast_skip = enabled
+        return True
+
     def read(self, decode: bool = True, advance: bool = True) -> Union[ndarray, bool]:
         """ Return next frame (or current if advance = False), or False if end of video.
 
@@ -272,7 +400,12 @@ class VideoStreamAv(VideoStream):
         if advance:
             try:
                 last_frame = self._frame
-                self._frame = next(self._container.decode(video=0))
+                self._set_skip_frame(decode)
+                if self._decoder is None:
+                    self._decoder = (
+                        self._decode_keyframes()
+                        if self._keyframes_only else self._container.decode(video=0))
+                self._frame = next(self._decoder)
             except av.error.EOFError:
                 self._frame = last_frame
                 if self._handle_eof():
@@ -282,7 +415,13 @@ class VideoStreamAv(VideoStream):
                 return False
             has_advanced = True
         if decode:
-            return self._frame.to_ndarray(format='bgr24')
+            if self._output_downscale > 1:
+                return self._frame.to_ndarray(
+                    width=math.ceil(self._frame.width / self._output_downscale),
+                    height=math.ceil(self._frame.height / self._output_downscale),
+                    format=self._output_format,
+                    interpolation='POINT')
+            return self._frame.to_ndarray(format=self._output_format)
         return has_advanced
 
     #
@@ -299,11 +438,55 @@ class VideoStreamAv(VideoStream):
         """PyAV `av.codec.context.CodecContext` being used."""
         return self._video_stream.codec_context
 
+    def _seek_with_index(self, frame_num: int):
+        """Seek so that `frame_num` (0-based) is the current frame using the frame index. Seeks
+        to the nearest keyframe at or before the target, unless the target can be reached with
+        less decoding by continuing to decode from the current frame."""
+        frame_num = min(frame_num, self._index.num_frames - 1)
+        keyframe = self._index.get_keyframe(frame_num)
+        # If no frame has been decoded yet, we're at the beginning of the video.
+        current = self.position.frame_num if self._frame is not None else -1
+        if not keyframe - 1 <= current <= frame_num:
+            self._frame = None
+            self._container.seek(int(self._index.pts[keyframe]), stream=self._video_stream)
+            self._decoder = None
+        # Frames must not be dropped by the decoder while seeking, otherwise we could overshoot.
+        fast_skip = self._fast_skip
+        self._fast_skip = False
+        try:
+            while self._frame is None or self.position.frame_num < frame_num:
+                if self.read(decode=False, advance=True) is False:
+                    break
+        finally:
+            self._fast_skip = fast_skip
+
+    def _set_skip_frame(self, decode: bool):
+        """Set which frames the decoder should discard for the next call to `read`."""
+        if self._keyframes_only:
+            skip_frame = 'NONKEY'
+        elif self._fast_skip and not decode:
+            skip_frame = 'NONREF'
+        else:
+            skip_frame = 'DEFAULT'
+        if skip_frame != self._skip_frame:
+            self._codec_context.skip_frame = skip_frame
+            self._skip_frame = skip_frame
+
+    def _decode_keyframes(self):
+        """Generator which only decodes keyframes. All other packets are discarded without being
+        sent to the decoder. The final (empty) packet is used to flush the decoder."""
+        for packet in self._container.demux(self._video_stream):
+            if packet.is_keyframe or packet.size == 0:
+                yield from packet.decode()
+
     def _get_duration(self) -> int:
         """Get video duration as number of frames based on the video and set framerate."""
         # See https://pyav.org/docs/develop/api/time.html for details on how ffmpeg/PyAV
         # handle time calculations internally and which time base to use.
         assert self.frame_rate is not None, "Frame rate must be set before calling _get_duration!"
+        # The index has an entry for every frame, so it gives the exact duration.
+        if self._index is not None:
+            return self._index.num_frames
         # See if we can obtain the number of frames directly from the stream itself.
         if self._video_stream.frames > 0:
             return self._video_stream.frames
@@ -333,7 +516,7 @@ class VideoStreamAv(VideoStream):
 
         Re-open video if the threading mode is AUTO and we didn't decode all of the frames."""
         # Don't re-open the video if we already did, or if we already decoded all the frames.
-        if self._reopened or self.frame_number >= self.duration:
+        if self._reopened or self._keyframes_only or self.frame_number >= self.duration:
             return False
         self._reopened = True
         # Don't re-open the video if we can't seek or aren't in AUTO/FRAME thread_type mode.
@@ -349,5 +532,7 @@ class VideoStreamAv(VideoStream):
             raise
         self._container.close()
         self._container = container
+        self._decoder = None
+        self._skip_frame = None
         self.seek(last_frame)
         return True
@@ -22,7 +22,7 @@ a `CliContext`, finally performing scene detection by passing the `CliContext` t
 """
 
 import logging
-from typing import AnyStr, Optional
+from typing import AnyStr, Optional, Tuple
 
 import click
 
@@ -158,6 +158,34 @@ def _print_help_header() -> None:
     ' Reduces processing speed at expense of accuracy.%s' %
     USER_CONFIG.get_help_string("global", "frame-skip"),
 )
+@click.option(
+    '--keyframes-only',
+    is_flag=True,
+    flag_value=True,
+    help='Only decode keyframes, discarding all other frames without decoding them. Greatly'
+    ' reduces processing time at the expense of accuracy, as cuts can only be detected on'
+    ' keyframes. Requires the pyav backend (-b pyav), and cannot be used with -s/--stats.%s' %
+    (USER_CONFIG.get_help_string('backend-pyav', 'keyframes-only')),
+)
+@click.option(
+    '--prefilter',
+    is_flag=True,
+    flag_value=True,
+    help='Only decode frames near likely scene changes, found from the size of each packet and'
+    ' the placement of keyframes without decoding the video. Much faster, but some scene changes'
+    ' may be missed. Requires PyAV to be installed (any backend can be used). Ignored if'
+    ' -fs/--frame-skip is set.%s' % (USER_CONFIG.get_help_string('global', 'prefilter')),
+)
+@click.option(
+    '--workers',
+    '-w',
+    metavar='N',
+    type=click.INT,
+    default=None,
+    help='Number of processes to use for scene detection. The input video is split into N'
+    ' segments which are decoded in parallel. Only supported for video files when -fs/--frame-skip'
+    ' is 0.%s' % USER_CONFIG.get_help_string("global", "workers"),
+)
 @click.option(
     '--min-scene-len',
     '-m',
@@ -190,7 +218,25 @@ def _print_help_header() -> None:
     help='Path to stats file (.csv) for writing frame metrics to. If the file exists, any'
     ' metrics will be processed, otherwise a new file will be created. Can be used to determine'
     ' optimal values for various scene detector options, and to cache frame calculations in order'
-    ' to speed up multiple detection runs.',
+    ' to speed up multiple detection runs. Files ending in .stats are written in a compact binary'
+    ' format instead of CSV.',
+)
+@click.option(
+    '--stats-cache',
+    is_flag=True,
+    flag_value=True,
+    help='Cache the frame metrics of each video processed, so detecting scenes in the same video'
+    ' again (e.g. with a different threshold) does not require recalculating them. The cache'
+    ' folder can be set with the stats-cache-dir config option. Ignored if -fs/--frame-skip is'
+    ' set.%s' % (USER_CONFIG.get_help_string('global', 'stats-cache')),
+)
+@click.option(
+    '--stats-only',
+    is_flag=True,
+    flag_value=True,
+    help='Detect scenes only from the frame metrics in the -s/--stats file (or --stats-cache)'
+    ' without decoding the video, which is much faster when trying different detector options.'
+    ' Every frame must have the metrics required by each detector.',
 )
 @click.option(
     '--verbosity',
@@ -244,10 +290,15 @@ def scenedetect_cli(
     framerate: Optional[float],
     downscale: Optional[int],
     frame_skip: Optional[int],
+    keyframes_only: bool,
+    prefilter: bool,
+    workers: Optional[int],
     min_scene_len: Optional[str],
     drop_short_scenes: bool,
     merge_last_scene: bool,
     stats: Optional[AnyStr],
+    stats_cache: bool,
+    stats_only: bool,
     verbosity: Optional[str],
     logfile: Optional[AnyStr],
     quiet: bool,
@@ -273,6 +324,9 @@ def scenedetect_cli(
         stats_file=stats,
         downscale=downscale,
         frame_skip=frame_skip,
+        keyframes_only=keyframes_only,
+        prefilter=prefilter,
+        workers=workers,
         min_scene_len=min_scene_len,
         drop_short_scenes=drop_short_scenes,
         merge_last_scene=merge_last_scene,
@@ -281,6 +335,8 @@ def scenedetect_cli(
         logfile=logfile,
         config=config,
         stats=stats,
+        stats_cache=stats_cache,
+        stats_only=stats_only,
         verbosity=verbosity,
     )
 
@@ -427,6 +483,17 @@ def time_command(
     ' Refers to frame metric content_val in stats file.%s' %
     (USER_CONFIG.get_help_string("detect-content", "threshold")),
 )
+@click.option(
+    '--auto-threshold',
+    '-a',
+    metavar='VAL',
+    type=click.STRING,
+    default=None,
+    help='Choose the threshold from the content_val of every frame once they are all processed,'
+    ' instead of using -t/--threshold. VAL can be a percentile of the frame scores (e.g. 99%%),'
+    ' or a target number of cuts per minute (e.g. 10/min).%s' %
+    (USER_CONFIG.get_help_string("detect-content", "auto-threshold", show_default=False)),
+)
 @click.option(
     '--luma-only',
     '-l',
@@ -435,6 +502,17 @@ def time_command(
     help='Only consider luma/brightness channel (useful for greyscale videos).%s' %
     (USER_CONFIG.get_help_string("detect-content", "luma-only")),
 )
+@click.option(
+    '--weights',
+    metavar='HUE SAT LUM',
+    type=click.FLOAT,
+    nargs=3,
+    default=None,
+    help='Weights of the change in hue, saturation, and luma used to calculate the frame score.'
+    ' If only luma has a non-zero weight, frames are not converted to HSV, which is faster.'
+    ' Ignored if -l/--luma-only is set.%s' %
+    (USER_CONFIG.get_help_string('detect-content', 'weights')),
+)
 @click.option(
     '--min-scene-len',
     '-m',
@@ -451,7 +529,9 @@ def time_command(
 def detect_content_command(
     ctx: click.Context,
     threshold: Optional[float],
+    auto_threshold: Optional[str],
     luma_only: bool,
+    weights: Optional[Tuple[float, float, float]],
     min_scene_len: Optional[str],
 ):
     """Perform content detection algorithm on input video.
@@ -459,11 +539,15 @@ def detect_content_command(
     detect-content
 
     detect-content --threshold 27.5
+
+    detect-content --auto-threshold 10/min
     """
     assert isinstance(ctx.obj, CliContext)
     ctx.obj.handle_detect_content(
         threshold=threshold,
+        auto_threshold=auto_threshold,
         luma_only=luma_only,
+        weights=weights,
         min_scene_len=min_scene_len,
     )
 
@@ -507,6 +591,17 @@ def detect_content_command(
     help='Only consider luma/brightness channel (useful for greyscale videos).%s' %
     (USER_CONFIG.get_help_string('detect-adaptive', 'luma-only')),
 )
+@click.option(
+    '--weights',
+    metavar='HUE SAT LUM',
+    type=click.FLOAT,
+    nargs=3,
+    default=None,
+    help='Weights of the change in hue, saturation, and luma used to calculate the frame score.'
+    ' If only luma has a non-zero weight, frames are not converted to HSV, which is faster.'
+    ' Ignored if -l/--luma-only is set.%s' %
+    (USER_CONFIG.get_help_string('detect-adaptive', 'weights')),
+)
 @click.option(
     '--min-scene-len',
     '-m',
@@ -526,6 +621,7 @@ def detect_adaptive_command(
     min_delta_hsv: Optional[float],
     frame_window: Optional[int],
     luma_only: bool,
+    weights: Optional[Tuple[float, float, float]],
     min_scene_len: Optional[str],
 ):
     """Perform adaptive detection algorithm on input video.
@@ -541,6 +637,7 @@ def detect_adaptive_command(
         min_delta_hsv=min_delta_hsv,
         frame_window=frame_window,
         luma_only=luma_only,
+        weights=weights,
         min_scene_len=min_scene_len,
     )
 
@@ -557,6 +654,16 @@ def detect_adaptive_command(
     ' a new scene. Refers to frame metric delta_rgb in stats file.%s' %
     (USER_CONFIG.get_help_string('detect-threshold', 'threshold')),
 )
+@click.option(
+    '--auto-threshold',
+    '-a',
+    metavar='PERCENT',
+    type=click.STRING,
+    default=None,
+    help='Choose the threshold from the delta_rgb of every frame once they are all processed,'
+    ' instead of using -t/--threshold. PERCENT is a percentile of the frame metrics (e.g. 5%%).%s' %
+    (USER_CONFIG.get_help_string('detect-threshold', 'auto-threshold', show_default=False)),
+)
 @click.option(
     '--fade-bias',
     '-f',
@@ -577,6 +684,15 @@ def detect_adaptive_command(
     ' last fade-out position to the end of the video.%s' %
     (USER_CONFIG.get_help_string('detect-threshold', 'add-last-scene')),
 )
+@click.option(
+    '--luma-only',
+    is_flag=True,
+    flag_value=True,
+    help='Use the average luma (Y) of each frame instead of the average of the R, G, and B values.'
+    ' Frames are decoded in greyscale when the backend supports it, which is faster. Refers to'
+    ' frame metric delta_luma in stats file.%s' %
+    (USER_CONFIG.get_help_string('detect-threshold', 'luma-only')),
+)
 @click.option(
     '--min-scene-len',
     '-m',
@@ -593,8 +709,10 @@ def detect_adaptive_command(
 def detect_threshold_command(
     ctx: click.Context,
     threshold: Optional[float],
+    auto_threshold: Optional[str],
     fade_bias: Optional[float],
     add_last_scene: bool,
+    luma_only: bool,
     min_scene_len: Optional[str],
 ):
     """Perform threshold detection algorithm on input video.
@@ -602,13 +720,17 @@ def detect_threshold_command(
     detect-threshold
 
     detect-threshold --threshold 15
+
+    detect-threshold --auto-threshold 5%
     """
     assert isinstance(ctx.obj, CliContext)
 
     ctx.obj.handle_detect_threshold(
         threshold=threshold,
+        auto_threshold=auto_threshold,
         fade_bias=fade_bias,
         add_last_scene=add_last_scene,
+        luma_only=luma_only,
         min_scene_len=min_scene_len,
     )
 
@@ -731,6 +853,102 @@ def list_scenes_command(
     )
 
 
+@click.command('sweep')
+@click.option(
+    '--threshold',
+    '-t',
+    metavar='VALUES',
+    type=click.STRING,
+    default=None,
+    help='Comma-separated list of threshold values to try, e.g. 20,25,30. Ranges can be specified'
+    ' as START:STOP:STEP, e.g. 20:40:2.5 (STOP is included). If not set, only the threshold of the'
+    ' detector is used.',
+)
+@click.option(
+    '--min-scene-len',
+    '-m',
+    metavar='VALUES',
+    type=click.STRING,
+    default=None,
+    help='Comma-separated list of minimum scene lengths to try, in the same format as'
+    ' -t/--threshold. Each value can be in frames, seconds, or a timecode. If not set, only the'
+    ' minimum scene length of the detector is used.',
+)
+@click.option(
+    '--ground-truth',
+    '-g',
+    metavar='FILE',
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True, resolve_path=False),
+    default=None,
+    help='File containing the expected cuts, separated by commas or newlines, to calculate the'
+    ' precision and recall of each combination of values. Each cut can be in frames, seconds, or'
+    ' a timecode.',
+)
+@click.option(
+    '--tolerance',
+    metavar='TIMECODE',
+    type=click.STRING,
+    default=None,
+    help='Maximum distance between a detected cut and the expected cut it matches when'
+    ' calculating precision and recall.%s' % (USER_CONFIG.get_help_string('sweep', 'tolerance')),
+)
+@click.option(
+    '--output',
+    '-o',
+    metavar='DIR',
+    type=click.Path(exists=False, dir_okay=True, writable=True, resolve_path=False),
+    help='Output directory to save results to. Overrides global option -o/--output if set.%s' %
+    (USER_CONFIG.get_help_string('sweep', 'output', show_default=False)),
+)
+@click.option(
+    '--filename',
+    '-f',
+    metavar='NAME',
+    default=None,
+    type=click.STRING,
+    help='Filename format to use for the results CSV file. You can use the $VIDEO_NAME macro in'
+    ' the file name. Note that you may have to wrap the name using single quotes.%s' %
+    (USER_CONFIG.get_help_string('sweep', 'filename')),
+)
+@click.option(
+    '--no-output-file',
+    '-n',
+    is_flag=True,
+    flag_value=True,
+    help='Disable writing results CSV file to disk. If set, -o/--output and -f/--filename are'
+    ' ignored.%s' % (USER_CONFIG.get_help_string('sweep', 'no-output-file')),
+)
+@click.pass_context
+def sweep_command(
+    ctx: click.Context,
+    threshold: Optional[str],
+    min_scene_len: Optional[str],
+    ground_truth: Optional[AnyStr],
+    tolerance: Optional[str],
+    output: Optional[AnyStr],
+    filename: Optional[AnyStr],
+    no_output_file: bool,
+):
+    """Try every combination of threshold and minimum scene length for detect-content or
+    detect-adaptive, using the frame metrics calculated while detecting scenes, and print the
+    number of cuts found with each. Default filename is $VIDEO_NAME-Sweep.csv.
+
+    sweep --threshold 20:40:5 --min-scene-len 0.5s,1s
+
+    sweep --threshold 2,3,4 --ground-truth cuts.txt
+    """
+    assert isinstance(ctx.obj, CliContext)
+    ctx.obj.handle_sweep(
+        threshold=threshold,
+        min_scene_len=min_scene_len,
+        ground_truth=ground_truth,
+        tolerance=tolerance,
+        output=output,
+        filename=filename,
+        no_output_file=no_output_file,
+    )
+
+
 @click.command('split-video')
 @click.option(
     '--output',
@@ -1017,6 +1235,7 @@ _add_cli_command(scenedetect_cli, export_html_command)
 _add_cli_command(scenedetect_cli, list_scenes_command)
 _add_cli_command(scenedetect_cli, save_images_command)
 _add_cli_command(scenedetect_cli, split_video_command)
+_add_cli_command(scenedetect_cli, sweep_command)
 
 # Detection Algorithms
 _add_cli_command(scenedetect_cli, detect_content_command)
@@ -75,8 +75,10 @@ CONFIG_MAP: ConfigDict = {
         'max-decode-attempts': 5,
     },
     'backend-pyav': {
+        'keyframes-only': False,
         'suppress-output': False,
         'threading-mode': 'auto',
+        'use-index': False,
     },
     'detect-adaptive': {
         'frame-window': 2,
@@ -84,15 +86,20 @@ CONFIG_MAP: ConfigDict = {
         'min-delta-hsv': RangeValue(15.0, min_val=0.0, max_val=255.0),
         'min-scene-len': TimecodeValue(0),
         'threshold': RangeValue(3.0, min_val=0.0, max_val=255.0),
+        'weights': '1.0 1.0 1.0',
     },
     'detect-content': {
+        'auto-threshold': '',
         'luma-only': False,
         'min-scene-len': TimecodeValue(0),
         'threshold': RangeValue(27.0, min_val=0.0, max_val=255.0),
+        'weights': '1.0 1.0 1.0',
     },
     'detect-threshold': {
         'add-last-scene': True,
+        'auto-threshold': '',
         'fade-bias': RangeValue(0, min_val=-100.0, max_val=100.0),
+        'luma-only': False,
         'min-scene-len': TimecodeValue(0),
         'threshold': RangeValue(12.0, min_val=0.0, max_val=255.0),
     },
@@ -117,7 +124,11 @@ CONFIG_MAP: ConfigDict = {
         'merge-last-scene': False,
         'min-scene-len': TimecodeValue('0.6s'),
         'output': '',
+        'prefilter': False,
+        'stats-cache': False,
+        'stats-cache-dir': '',
         'verbosity': 'info',
+        'workers': 1,
     },
     'save-images': {
         'output': '',
@@ -143,6 +154,12 @@ CONFIG_MAP: ConfigDict = {
         'quiet': False,
         'rate-factor': RangeValue(22, min_val=0, max_val=100),
     },
+    'sweep': {
+        'filename': '$VIDEO_NAME-Sweep.csv',
+        'no-output-file': False,
+        'output': '',
+        'tolerance': TimecodeValue(2),
+    },
 }
 """Mapping of valid configuration file parameters and their default values or placeholders.
 The types of these values are used when decoding the configuration file. Valid choices for
@@ -18,7 +18,7 @@ This module contains :py:class:`CliContext` which encapsulates the command-line
 from __future__ import print_function
 import logging
 import os
-from typing import AnyStr, Optional
+from typing import AnyStr, Callable, List, Optional, Tuple, Union
 
 import click
 
@@ -27,8 +27,11 @@ from scenedetect.cli.config import ConfigRegistry, ConfigLoadFailure, CHOICE_MAP
 from scenedetect.frame_timecode import FrameTimecode, MAX_FPS_DELTA
 import scenedetect.detectors
 from scenedetect.platform import get_and_create_path, get_cv2_imwrite_params, init_logger
+from scenedetect.prefilter import Prefilter
+from scenedetect.scene_detector import AutoThreshold, SceneDetector
 from scenedetect.scene_manager import SceneManager
-from scenedetect.stats_manager import StatsManager
+from scenedetect.stats_cache import StatsCache
+from scenedetect.stats_manager import StatsManager, StatsFileCorrupt
 from scenedetect.video_stream import VideoStream, VideoOpenFailure, FrameRateUnavailable
 from scenedetect.video_splitter import is_mkvmerge_available, is_ffmpeg_available
 
@@ -61,6 +64,56 @@ def parse_timecode(value: str,
         ) from ex
 
 
+def _parse_sweep_values(value: str, parse_value: Callable[[str], Union[int, float]],
+                        param_hint: str) -> List[Union[int, float]]:
+    """Parses a comma-separated list of values for the `sweep` command. Each item can be a single
+    value, or a range of values as START:STOP:STEP (STOP is included).
+
+    Raises:
+        click.BadParameter
+    """
+    values = set()
+    for item in value.split(','):
+        try:
+            parts = [parse_value(part.strip()) for part in item.split(':')]
+        except (ValueError, click.BadParameter) as ex:
+            raise click.BadParameter('Invalid value: %s' % item, param_hint=param_hint) from ex
+        if len(parts) == 1:
+            values.add(parts[0])
+            continue
+        if len(parts) != 3 or parts[2] <= 0 or parts[1] < parts[0]:
+            raise click.BadParameter(
+                'Ranges must be START:STOP:STEP, where STEP > 0 and STOP >= START: %s' % item,
+                param_hint=param_hint)
+        start, stop, step = parts
+        # Round to avoid floating point error accumulating in the values.
+        values.update(
+            round(start + i * step, 6) for i in range(int((stop - start) / step + 1e-6) + 1))
+    return sorted(values)
+
+
+def _load_expected_cuts(path: AnyStr, frame_rate: float) -> List[FrameTimecode]:
+    """Loads a list of cuts for the `sweep` command, separated by commas or newlines. Each cut
+    can be in frames, seconds, or a timecode. Lines starting with # are ignored.
+
+    Raises:
+        click.BadParameter
+    """
+    cuts = []
+    with open(path, 'rt') as cut_file:
+        for line in cut_file:
+            if line.lstrip().startswith('#'):
+                continue
+            for value in line.replace(',', ' ').split():
+                try:
+                    cuts.append(FrameTimecode(timecode=value, fps=frame_rate))
+                except ValueError as ex:
+                    raise click.BadParameter(
+                        'Invalid cut in %s: %s' % (path, value),
+                        param_hint='-g/--ground-truth') from ex
+    return cuts
+
+
 def contains_sequence_or_url(video_path: str) -> bool:
     """Checks if the video path is a URL or image sequence."""
     return '%' in video_path or '://' in video_path
@@ -111,15 +164,19 @@ class CliContext:
         self.video_stream: VideoStream = None
         self.scene_manager: SceneManager = None
         self.stats_manager: StatsManager = None
+        self.detectors: List[SceneDetector] = [] # Added by detect-* commands.
 
         # Main `scenedetect` Options
         self.output_directory: str = None        # -o/--output
         self.quiet_mode: bool = None             # -q/--quiet or -v/--verbosity quiet
         self.stats_file_path: str = None         # -s/--stats
+        self.stats_cache: StatsCache = None      # --stats-cache
+        self.stats_only: bool = None             # --stats-only
         self.drop_short_scenes: bool = None      # --drop-short-scenes
         self.merge_last_scene: bool = None       # --merge-last-scene
         self.min_scene_len: FrameTimecode = None # -m/--min-scene-len
         self.frame_skip: int = None              # -fs/--frame-skip
+        self.workers: int = None                 # -w/--workers
 
         # `time` Command Options
         self.time: bool = False
@@ -163,6 +220,16 @@ class CliContext:
         self.image_width: int = None          # export-html -w/--image-width
         self.image_height: int = None         # export-html -h/--image-height
 
+        # `sweep` Command Options
+        self.sweep: bool = False
+        self.sweep_thresholds: List[float] = None            # sweep -t/--threshold
+        self.sweep_min_scene_lens: List[int] = None          # sweep -m/--min-scene-len
+        self.sweep_expected_cuts: List[FrameTimecode] = None # sweep -g/--ground-truth
+        self.sweep_tolerance: int = None                     # sweep --tolerance
+        self.sweep_directory: str = None                     # sweep -o/--output
+        self.sweep_name_format: str = None                   # sweep -f/--filename
+        self.sweep_output: bool = None                       # sweep -n/--no-output-file
+
         # Internal variables
         self._check_input_open_failed = False # Used to avoid excessive log messages
 
@@ -178,6 +245,9 @@ class CliContext:
         stats_file: Optional[AnyStr],
         downscale: Optional[int],
         frame_skip: int,
+        keyframes_only: bool,
+        prefilter: bool,
+        workers: Optional[int],
         min_scene_len: str,
         drop_short_scenes: bool,
         merge_last_scene: bool,
@@ -186,6 +256,8 @@ class CliContext:
         logfile: Optional[AnyStr],
         config: Optional[AnyStr],
         stats: Optional[AnyStr],
+        stats_cache: bool,
+        stats_only: bool,
         verbosity: Optional[str],
     ):
         """Parse all global options/arguments passed to the main scenedetect command,
@@ -235,6 +307,12 @@ class CliContext:
                 'Combining the -s/--stats and -fs/--frame-skip options is not supported.',
                 param_hint='frame skip + stats file')
 
+        keyframes_only = keyframes_only or self.config.get_value("backend-pyav", "keyframes-only")
+        if stats is not None and keyframes_only:
+            raise click.BadParameter(
+                'Combining the -s/--stats and --keyframes-only options is not supported.',
+                param_hint='keyframes only + stats file')
+
         # Handle the case where -i/--input was not specified (e.g. for the `help` command).
         if input_path is None:
             return
@@ -243,7 +321,8 @@ class CliContext:
         self._open_video_stream(
             input_path=input_path,
             framerate=framerate,
-            backend=self.config.get_value("global", "backend", backend, ignore_default=True))
+            backend=self.config.get_value("global", "backend", backend, ignore_default=True),
+            keyframes_only=keyframes_only)
 
         self.output_directory = output if output else self.config.get_value("global", "output")
         if self.output_directory:
@@ -257,14 +336,27 @@ class CliContext:
         self.merge_last_scene = merge_last_scene or self.config.get_value(
             "global", "merge-last-scene")
         self.frame_skip = self.config.get_value("global", "frame-skip", frame_skip)
+        self.workers = self.config.get_value("global", "workers", workers)
+        if self.workers < 1:
+            raise click.BadParameter(
+                'Number of workers must be at least 1.', param_hint='-w/--workers')
 
         # Create StatsManager if --stats is specified.
         if stats_file:
             self.stats_file_path = get_and_create_path(stats_file, self.output_directory)
             self.stats_manager = StatsManager()
 
+        if stats_cache or self.config.get_value("global", "stats-cache"):
+            stats_cache_dir = self.config.get_value("global", "stats-cache-dir")
+            self.stats_cache = StatsCache(stats_cache_dir if stats_cache_dir else None)
+            logger.debug('Using stats cache: %s', self.stats_cache.cache_dir)
+
+        self.stats_only = stats_only
+        if self.stats_only:
+            self._load_stats_file()
+
         logger.debug('Initializing SceneManager.')
-        self.scene_manager = SceneManager(self.stats_manager)
+        self.scene_manager = SceneManager(self.stats_manager, self.stats_cache)
         if downscale is None and self.config.is_default("global", "downscale"):
             self.scene_manager.auto_downscale = True
         else:
@@ -275,13 +367,20 @@ class CliContext:
             except ValueError as ex:
                 logger.debug(str(ex))
                 raise click.BadParameter(str(ex), param_hint='downscale factor')
+        if prefilter or self.config.get_value("global", "prefilter"):
+            if self.frame_skip > 0:
+                logger.warning('Prefilter is ignored when frame skip is set.')
+            else:
+                self.scene_manager.prefilter = Prefilter()
 
         self.options_processed = True
 
     def handle_detect_content(
         self,
         threshold: Optional[float],
+        auto_threshold: Optional[str],
         luma_only: bool,
+        weights: Optional[Tuple[float, float, float]],
         min_scene_len: Optional[str],
     ):
         """Handle detect-content command options."""
@@ -300,13 +399,23 @@ class CliContext:
             min_scene_len = parse_timecode(min_scene_len, self.video_stream.frame_rate).frame_num
 
         threshold = self.config.get_value("detect-content", "threshold", threshold)
+        auto_threshold = self._get_auto_threshold("detect-content", auto_threshold)
         luma_only = luma_only or self.config.get_value("detect-content", "luma-only")
+        weights = self._get_weights("detect-content", weights)
         logger.debug(
-            'Adding detector: ContentDetector(threshold=%f, min_scene_len=%d, luma_only=%s)',
-            threshold, min_scene_len, luma_only)
-        self._add_detector(
-            scenedetect.detectors.ContentDetector(
-                threshold=threshold, min_scene_len=min_scene_len, luma_only=luma_only))
+            'Adding detector: ContentDetector(threshold=%f, min_scene_len=%d, luma_only=%s,'
+            ' weights=%s, auto_threshold=%s)', threshold, min_scene_len, luma_only, weights,
+            auto_threshold)
+        try:
+            detector = scenedetect.detectors.ContentDetector(
+                threshold=threshold,
+                min_scene_len=min_scene_len,
+                luma_only=luma_only,
+                weights=weights,
+                auto_threshold=auto_threshold)
+        except ValueError as ex:
+            raise click.BadParameter(str(ex), param_hint='--weights') from ex
+        self._add_detector(detector)
 
         self.options_processed = options_processed_orig
 
@@ -316,6 +425,7 @@ class CliContext:
         min_delta_hsv: Optional[float],
         frame_window: Optional[int],
         luma_only: bool,
+        weights: Optional[Tuple[float, float, float]],
         min_scene_len: Optional[str],
     ):
         """Handle detect-adaptive command options."""
@@ -337,28 +447,35 @@ class CliContext:
         min_delta_hsv = self.config.get_value("detect-adaptive", "min-delta-hsv", min_delta_hsv)
         frame_window = self.config.get_value("detect-adaptive", "frame-window", frame_window)
         luma_only = luma_only or self.config.get_value("detect-adaptive", "luma-only")
+        weights = self._get_weights("detect-adaptive", weights)
 
         logger.debug(
             'Adding detector: AdaptiveDetector(threshold=%f, min_delta_hsv=%f,'
-            ' min_scene_len=%d, luma_only=%s, frame_window=%d)', threshold, min_delta_hsv,
-            min_scene_len, luma_only, frame_window)
+            ' min_scene_len=%d, luma_only=%s, frame_window=%d, weights=%s)', threshold,
+            min_delta_hsv, min_scene_len, luma_only, frame_window, weights)
 
-        self._add_detector(
-            scenedetect.detectors.AdaptiveDetector(
+        try:
+            detector = scenedetect.detectors.AdaptiveDetector(
                 adaptive_threshold=threshold,
                 min_scene_len=min_scene_len,
                 min_delta_hsv=min_delta_hsv,
                 luma_only=luma_only,
                 window_width=frame_window,
-            ))
+                weights=weights,
+            )
+        except ValueError as ex:
+            raise click.BadParameter(str(ex), param_hint='--weights') from ex
+        self._add_detector(detector)
 
         self.options_processed = options_processed_orig
 
     def handle_detect_threshold(
         self,
         threshold: Optional[float],
+        auto_threshold: Optional[str],
         fade_bias: Optional[float],
         add_last_scene: bool,
+        luma_only: bool,
         min_scene_len: Optional[str],
     ):
         """Handle detect-threshold command options."""
@@ -377,15 +494,21 @@ class CliContext:
             min_scene_len = parse_timecode(min_scene_len, self.video_stream.frame_rate).frame_num
 
         threshold = self.config.get_value("detect-threshold", "threshold", threshold)
+        auto_threshold = self._get_auto_threshold("detect-threshold", auto_threshold)
+        if auto_threshold is not None and auto_threshold.percentile is None:
+            raise click.BadParameter(
+                'Only a percentile (e.g. 5%) is supported by detect-threshold.',
+                param_hint='-a/--auto-threshold')
         fade_bias = self.config.get_value("detect-threshold", "fade-bias", fade_bias)
         # TODO(v1.0): This cannot be disabled right now.
         add_last_scene = add_last_scene or self.config.get_value("detect-threshold",
                                                                  "add-last-scene")
+        luma_only = luma_only or self.config.get_value("detect-threshold", "luma-only")
 
         logger.debug(
             'Adding detector: ThresholdDetector(threshold=%f, fade_bias=%f,'
-            ' min_scene_len=%d, add_last_scene=%s)', threshold, fade_bias, min_scene_len,
-            add_last_scene)
+            ' min_scene_len=%d, add_last_scene=%s, auto_threshold=%s, luma_only=%s)', threshold,
+            fade_bias, min_scene_len, add_last_scene, auto_threshold, luma_only)
 
         self._add_detector(
             scenedetect.detectors.ThresholdDetector(
@@ -393,6 +516,8 @@ class CliContext:
                 fade_bias=fade_bias,
                 min_scene_len=min_scene_len,
                 add_final_scene=add_last_scene,
+                auto_threshold=auto_threshold,
+                luma_only=luma_only,
             ))
 
         self.options_processed = options_processed_orig
@@ -461,6 +586,53 @@ class CliContext:
 
         self.options_processed = options_processed_orig
 
+    def handle_sweep(
+        self,
+        threshold: Optional[str],
+        min_scene_len: Optional[str],
+        ground_truth: Optional[AnyStr],
+        tolerance: Optional[str],
+        output: Optional[AnyStr],
+        filename: Optional[AnyStr],
+        no_output_file: bool,
+    ):
+        """Handle `sweep` command options."""
+        self._check_input_open()
+        options_processed_orig = self.options_processed
+        self.options_processed = False
+        if self.sweep:
+            self._on_duplicate_command('sweep')
+        if self.frame_skip:
+            raise click.BadParameter(
+                'Combining the sweep command and -fs/--frame-skip option is not supported.',
+                param_hint='sweep + frame skip')
+
+        frame_rate = self.video_stream.frame_rate
+        if threshold is not None:
+            self.sweep_thresholds = _parse_sweep_values(threshold, float, '-t/--threshold')
+        if min_scene_len is not None:
+            self.sweep_min_scene_lens = _parse_sweep_values(
+                min_scene_len, lambda value: parse_timecode(value, frame_rate).frame_num,
+                '-m/--min-scene-len')
+        if ground_truth is not None:
+            self.sweep_expected_cuts = _load_expected_cuts(ground_truth, frame_rate)
+        self.sweep_tolerance = parse_timecode(
+            self.config.get_value('sweep', 'tolerance', tolerance), frame_rate).frame_num
+
+        no_output_file = no_output_file or self.config.get_value('sweep', 'no-output-file')
+        self.sweep_directory = self.config.get_value('sweep', 'output', output, ignore_default=True)
+        self.sweep_name_format = self.config.get_value('sweep', 'filename', filename)
+        self.sweep_output = not no_output_file
+
+        # Frame metrics must be kept after detecting scenes to evaluate other parameters with.
+        if self.scene_manager.stats_manager is None:
+            self.scene_manager.stats_manager = StatsManager()
+        self.stats_manager = self.scene_manager.stats_manager
+
+        self.sweep = True
+
+        self.options_processed = options_processed_orig
+
     def handle_split_video(
         self,
         output: Optional[AnyStr],
@@ -720,6 +892,31 @@ class CliContext:
                 init_logger(
                     log_level=curr_verbosity, show_stdout=not self.quiet_mode, log_file=logfile)
 
+    def _load_stats_file(self) -> None:
+        """Load the -s/--stats file (if any) to detect scenes from with --stats-only.
+
+        Raises:
+            click.BadParameter: There are no frame metrics to detect scenes from, or the stats
+                file could not be loaded.
+        """
+        if self.frame_skip:
+            raise click.BadParameter(
+                'Combining the --stats-only and -fs/--frame-skip options is not supported.',
+                param_hint='stats only + frame skip')
+        if self.stats_file_path is None or not os.path.exists(self.stats_file_path):
+            if self.stats_cache is None:
+                raise click.BadParameter(
+                    'An existing stats file (-s/--stats) or --stats-cache is required.',
+                    param_hint='--stats-only')
+            return
+        logger.info('Loading frame metrics from stats file: %s',
+                    os.path.basename(self.stats_file_path))
+        try:
+            self.stats_manager.load(self.stats_file_path)
+        except StatsFileCorrupt as ex:
+            raise click.BadParameter(
+                'Failed to load stats file: %s' % str(ex), param_hint='-s/--stats')
+
     def _add_detector(self, detector):
         """ Add Detector: Adds a detection algorithm to the CliContext's SceneManager. """
         self._check_input_open()
@@ -729,6 +926,7 @@ class CliContext:
             raise click.BadParameter(
                 message='Cannot specify detection algorithm twice.',
                 param_hint=detector.cli_name) from ex
+        self.detectors.append(detector)
 
     def _check_input_open(self) -> None:
         """Ensure self.video_stream was initialized (i.e. -i/--input was specified),
@@ -745,8 +943,59 @@ class CliContext:
             self.options_processed = False
             raise click.Abort()
 
-    def _open_video_stream(self, input_path: AnyStr, framerate: Optional[float],
-                           backend: Optional[str]):
+    def _get_auto_threshold(self, command: str,
+                            auto_threshold: Optional[str]) -> Optional[AutoThreshold]:
+        """Get the -a/--auto-threshold of `command`, parsing it from the config file if it was
+        not set on the command line. Values ending in % are a percentile of the frame scores, and
+        values ending in /min are a number of cuts per minute.
+
+        Raises:
+            click.BadParameter: The value is invalid.
+        """
+        value = self.config.get_value(command, "auto-threshold", auto_threshold)
+        if not value:
+            return None
+        value = value.strip().lower()
+        try:
+            if value.endswith('%'):
+                return AutoThreshold(percentile=float(value[:-1]))
+            if value.endswith('/min'):
+                return AutoThreshold(
+                    cuts_per_minute=float(value[:-len('/min')]),
+                    frame_rate=self.video_stream.frame_rate)
+        except ValueError as ex:
+            raise click.BadParameter(str(ex), param_hint='-a/--auto-threshold') from ex
+        raise click.BadParameter(
+            'Value must be a percentile (e.g. 99%%) or cuts per minute (e.g. 10/min): %s' % value,
+            param_hint='-a/--auto-threshold')
+
+    def _get_weights(self, command: str,
+                     weights: Optional[Tuple[float, float, float]]) -> Tuple[float, float, float]:
+        """Get the frame score weights for `command`, parsing them from the config file if they
+        were not set on the command line.
+
+        Raises:
+            click.BadParameter: The weights from the config file are invalid.
+        """
+        if weights:
+            return tuple(weights)
+        weights_str = self.config.get_value(command, "weights")
+        try:
+            weights = tuple(float(weight) for weight in weights_str.replace(',', ' ').split())
+        except ValueError:
+            weights = ()
+        if len(weights) != 3:
+            raise click.BadParameter(
+                'Invalid weights in config file: %s. Must be 3 numbers (hue, saturation, luma).' %
+                weights_str,
+                param_hint='--weights')
+        return weights
+
+    def _open_video_stream(self,
+                           input_path: AnyStr,
+                           framerate: Optional[float],
+                           backend: Optional[str],
+                           keyframes_only: bool = False):
         if '%' in input_path and backend != 'opencv':
             raise click.BadParameter(
                 'The OpenCV backend (`--backend opencv`) must be used to process image sequences.',
@@ -761,6 +1010,10 @@ class CliContext:
                     raise click.BadParameter(
                         'Specified backend %s is not available on this system!' % backend,
                         param_hint='-b/--backend')
+            if keyframes_only and backend != 'pyav':
+                raise click.BadParameter(
+                    'The PyAV backend (`--backend pyav`) must be used to only decode keyframes.',
+                    param_hint='--keyframes-only')
             # Open the video with the specified backend, loading any required config settings.
             if backend == 'pyav':
                 self.video_stream = open_video(
@@ -769,6 +1022,8 @@ class CliContext:
                     backend=backend,
                     threading_mode=self.config.get_value('backend-pyav', 'threading-mode'),
                     suppress_output=self.config.get_value('backend-pyav', 'suppress-output'),
+                    keyframes_only=keyframes_only,
+                    use_index=self.config.get_value('backend-pyav', 'use-index'),
                 )
             elif backend == 'opencv':
                 self.video_stream = open_video(
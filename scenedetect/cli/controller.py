@@ -22,9 +22,12 @@ import time
 from typing import Dict, List, Tuple, Optional
 
 from scenedetect.cli.context import CliContext, check_split_video_requirements
+from scenedetect.detectors import ContentDetector
 from scenedetect.frame_timecode import FrameTimecode
 from scenedetect.platform import get_and_create_path
 from scenedetect.scene_manager import save_images, write_scene_list, write_scene_list_html
+from scenedetect.stats_manager import BINARY_STATS_FILE_EXTENSION
+from scenedetect.sweep import sweep_detector, write_sweep_results
 from scenedetect.video_splitter import split_video_mkvmerge, split_video_ffmpeg
 
 logger = logging.getLogger('pyscenedetect')
@@ -53,13 +56,38 @@ def run_scenedetect(context: CliContext):
         logger.debug('Seeking to start time...')
         context.video_stream.seek(target=context.start_time)
 
+    # Write frame metrics to CSV stats files while detecting scenes, so they are not lost if
+    # processing is interrupted, and don't need to be kept in memory.
+    stream_stats = context.stats_file_path is not None and not context.stats_only and not (
+        context.stats_file_path.lower().endswith(BINARY_STATS_FILE_EXTENSION))
+    if stream_stats:
+        logger.info('Writing frame metrics to stats file: %s',
+                    os.path.basename(context.stats_file_path))
+        # Metrics must be kept in memory if they are saved to the stats cache or swept after
+        # detection.
+        context.stats_manager.open_stream(
+            context.stats_file_path,
+            evict=context.scene_manager.stats_cache is None and not context.sweep)
+
     logger.info('Detecting scenes...')
-    num_frames = context.scene_manager.detect_scenes(
-        video=context.video_stream,
-        duration=context.duration,
-        end_time=context.end_time,
-        frame_skip=context.frame_skip,
-        show_progress=not context.quiet_mode)
+    try:
+        num_frames = context.scene_manager.detect_scenes(
+            video=context.video_stream,
+            duration=context.duration,
+            end_time=context.end_time,
+            frame_skip=context.frame_skip,
+            show_progress=not context.quiet_mode,
+            workers=context.workers,
+            stats_only=context.stats_only)
+    except ValueError as ex:
+        # Frame metrics required by --stats-only are missing.
+        if not context.stats_only:
+            raise
+        logger.error(str(ex))
+        return
+    finally:
+        if stream_stats:
+            context.stats_manager.close_stream()
 
     # Handle case where video failure is most likely due to multiple audio tracks (#179).
     if num_frames <= 0 and context.video_stream.BACKEND_NAME == 'opencv':
@@ -86,6 +114,9 @@ def run_scenedetect(context: CliContext):
     cut_list = context.scene_manager.get_cut_list()
     scene_list = context.scene_manager.get_scene_list(start_in_scene=True)
 
+    # Handle sweep command.
+    _sweep(context, scene_list)
+
     # Handle --merge-last-scene.
     if context.merge_last_scene and context.min_scene_len is not None and context.min_scene_len > 0:
         if len(scene_list) > 1 and (scene_list[-1][1] - scene_list[-1][0]) < context.min_scene_len:
@@ -121,15 +152,74 @@ def run_scenedetect(context: CliContext):
 def _save_stats(context: CliContext) -> None:
     """Handles saving the statsfile if -s/--stats was specified."""
     if context.stats_file_path is not None:
+        # With --stats-only the stats file is the input, so it is never rewritten.
+        if context.stats_only:
+            logger.debug('Detecting from stats file only, skipping update of the stats file.')
         # We check if the save is required in order to reduce unnecessary log messages.
-        if context.stats_manager.is_save_required():
+        elif context.stats_manager.is_save_required():
             logger.info('Saving frame metrics to stats file: %s',
                         os.path.basename(context.stats_file_path))
-            context.stats_manager.save_to_csv(csv_file=context.stats_file_path)
+            context.stats_manager.save(path=context.stats_file_path)
         else:
             logger.debug('No frame metrics updated, skipping update of the stats file.')
 
 
+def _sweep(context: CliContext, scene_list: List[Tuple[FrameTimecode, FrameTimecode]]) -> None:
+    """Handles the `sweep` command."""
+    if not context.sweep or not scene_list:
+        return
+    detectors = [
+        detector for detector in context.detectors if isinstance(detector, ContentDetector)
+    ]
+    if len(detectors) != 1:
+        logger.error('The sweep command requires exactly one of detect-content or'
+                     ' detect-adaptive to be specified.')
+        return
+    detector = detectors[0]
+    try:
+        results = sweep_detector(
+            detector,
+            context.stats_manager,
+            start_frame=scene_list[0][0].get_frames(),
+            end_frame=scene_list[-1][1].get_frames(),
+            thresholds=context.sweep_thresholds,
+            min_scene_lens=context.sweep_min_scene_lens,
+            expected_cuts=context.sweep_expected_cuts,
+            tolerance=context.sweep_tolerance)
+    except ValueError as ex:
+        logger.error(str(ex))
+        return
+
+    has_scores = context.sweep_expected_cuts is not None
+    logger.info(
+        """Sweep Results (%s):
+-------------------------------------------------------------------
+ | Threshold | Min Scene Len |   Cuts   |%s
+-------------------------------------------------------------------
+%s
+-------------------------------------------------------------------
+""",
+        type(detector).__name__, ' Precision |  Recall  | F1 Score |' if has_scores else '',
+        '\n'.join([
+            ' | %9g | %13d | %8d |%s' %
+            (result.threshold, result.min_scene_len, result.num_cuts, ' %9.3f | %8.3f | %8.3f |' %
+             (result.precision, result.recall, result.f1_score) if has_scores else '')
+            for result in results
+        ]))
+
+    if context.sweep_output:
+        sweep_filename = Template(
+            context.sweep_name_format).safe_substitute(VIDEO_NAME=context.video_stream.name)
+        if not sweep_filename.lower().endswith('.csv'):
+            sweep_filename += '.csv'
+        sweep_path = get_and_create_path(
+            sweep_filename, context.sweep_directory
+            if context.sweep_directory is not None else context.output_directory)
+        logger.info('Writing sweep results to CSV file:\n  %s', sweep_path)
+        with open(sweep_path, 'wt') as sweep_file:
+            write_sweep_results(sweep_file, results)
+
+
 def _list_scenes(context: CliContext, scene_list: List[Tuple[FrameTimecode, FrameTimecode]],
                  cut_list: List[FrameTimecode]) -> None:
     """Handles the `list-scenes` command."""
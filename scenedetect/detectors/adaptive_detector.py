@@ -18,6 +18,7 @@ camera motions.
 This detector is available from the command-line as the `detect-adaptive` command.
 """
 
+from collections import deque
 from logging import getLogger
 
 # PySceneDetect Library Imports
@@ -33,6 +34,7 @@ class AdaptiveDetector(ContentDetector):
     """
 
     ADAPTIVE_RATIO_KEY_TEMPLATE = "adaptive_ratio{luma_only} (w={window_width})"
+    WEIGHTED_ADAPTIVE_RATIO_KEY_TEMPLATE = "adaptive_ratio (h={h:g} s={s:g} l={l:g} w={window_width})"
 
     def __init__(self,
                  adaptive_threshold=3.0,
@@ -40,6 +42,7 @@ class AdaptiveDetector(ContentDetector):
                  min_scene_len=15,
                  min_delta_hsv=15.0,
                  window_width=2,
+                 weights=None,
                  video_manager=None):
         """
         Arguments:
@@ -51,42 +54,64 @@ class AdaptiveDetector(ContentDetector):
                 scene. This is calculated the same way that `detect-content` calculates frame score.
             window_width: Size of window (number of frames) before and after each frame to average together in'
                 order to detect deviations from the mean.
+            weights: Weights of the change in (hue, saturation, luma) used to calculate the
+                content_val of each frame (see `ContentDetector`). Ignored if `luma_only` is set.
             video_manager: [DEPRECATED] DO NOT USE. For backwards compatibility only.
         """
         # TODO: Remove `video_manager`.
         if video_manager is not None:
             logger.error('video_manager is deprecated, use video instead.')
 
-        super().__init__()
-        self.min_scene_len = min_scene_len                                              # minimum length of any given scene, in frames (int) or FrameTimecode
+        super().__init__(luma_only=luma_only, weights=weights)
+        self.min_scene_len = min_scene_len                                                           # minimum length of any given scene, in frames (int) or FrameTimecode
         self.adaptive_threshold = adaptive_threshold
         self.min_delta_hsv = min_delta_hsv
         self.window_width = window_width
-        self._luma_only = luma_only
-        self._adaptive_ratio_key = AdaptiveDetector.ADAPTIVE_RATIO_KEY_TEMPLATE.format(
-            window_width=window_width, luma_only='' if not luma_only else '_lum')
-
-        self._first_frame = None
-        self._last_frame = None
+        if self.weights in (ContentDetector.DEFAULT_WEIGHTS, ContentDetector.LUMA_ONLY_WEIGHTS):
+            self._adaptive_ratio_key = AdaptiveDetector.ADAPTIVE_RATIO_KEY_TEMPLATE.format(
+                window_width=window_width,
+                luma_only='' if self.weights == ContentDetector.DEFAULT_WEIGHTS else '_lum')
+        else:
+            self._adaptive_ratio_key = AdaptiveDetector.WEIGHTED_ADAPTIVE_RATIO_KEY_TEMPLATE.format(
+                window_width=window_width, h=self.weights[0], s=self.weights[1], l=self.weights[2])
+
+        # Frame numbers and content_val of the last 2 * window_width + 1 frames. Once full, the
+        # frame in the middle of the window is checked for a cut.
+        self._buffer = deque(maxlen=2 * window_width + 1)
+        self._last_cut = None
 
     def get_metrics(self):
         # type: () -> List[str]
         """ Combines base ContentDetector metric keys with the AdaptiveDetector one. """
         return super().get_metrics() + [self._adaptive_ratio_key]
 
+    def get_input_metrics(self):
+        # type: () -> List[str]
+        """ Only the ContentDetector metric keys, as the adaptive_ratio is calculated from them. """
+        return super().get_metrics()
+
+    @property
+    def event_buffer_length(self) -> int:
+        """Cuts and the adaptive_ratio metric are produced `window_width + 1` frames after the
+        frame they are for."""
+        return self.window_width + 1
+
     def stats_manager_required(self):
         # type: () -> bool
-        """ Overload to indicate that this detector requires a StatsManager.
+        """ Overload to indicate that this detector does not require a StatsManager.
 
         Returns:
-            True as AdaptiveDetector requires stats.
+            False, as the content_val of each frame in the window is kept by the detector.
         """
-        return True
+        return False
 
     def process_frame(self, frame_num, frame_img):
         # type: (int, numpy.ndarray) -> List[int]
-        """ Similar to ThresholdDetector, but using the HSV colour space DIFFERENCE instead
-        of single-frame RGB/grayscale intensity (thus cannot detect slow fades with this method).
+        """ Calculates the content_val of the current frame, and checks if the frame
+        `window_width + 1` frames before it is a cut. If a single frame has a high `content_val`
+        while the frames around it are low, we can be sure it's fast cut. If several frames in
+        a row have high `content_val`, it probably isn't a cut -- it could be fast camera
+        movement or a change in lighting that lasts for more than a single frame.
 
         Arguments:
             frame_num (int): Frame number of frame that is being passed.
@@ -96,97 +121,66 @@ class AdaptiveDetector(ContentDetector):
                 (inhereted from the base SceneDetector class) returns True.
 
         Returns:
-            Empty list
+            List containing the frame number of the cut, if one was detected.
         """
+        return self._process_frame_score(frame_num, self._get_frame_score(frame_num, frame_img))
 
-        # Call the process_frame function of ContentDetector but ignore any
-        # returned cuts
-        if self.is_processing_required(frame_num):
-            super().process_frame(frame_num=frame_num, frame_img=frame_img)
+    def _process_frame_score(self, frame_num, content_val):
+        # type: (int, Optional[float]) -> List[int]
+        """ Adds the content_val of the current frame to the window, after checking if the frame
+        in the middle of the window is a cut. """
+        cut_list = []
+        # The window is checked before adding the current frame, so the last frame of the
+        # video is never part of a window (same as when this was done in post_process).
+        if len(self._buffer) == self._buffer.maxlen:
+            cut = self._check_window()
+            if cut is not None:
+                cut_list.append(cut)
+
+        # The first frame has no content_val as there is nothing to compare it with.
+        if content_val is not None:
+            self._buffer.append((frame_num, content_val))
+
+        return cut_list
+
+    def _check_window(self):
+        # type: () -> Optional[int]
+        """ Calculates the adaptive_ratio of the frame in the middle of the window, returning
+        its frame number if it is a cut, or None otherwise. """
+        window_width = self.window_width
+        frame_num, content_val = self._buffer[window_width]
+        # If the content_val of the frame is more than adaptive_threshold times the mean
+        # content_val of the frames around it, then we mark it as a cut.
+        denominator = 0
+        for i, (_, window_val) in enumerate(self._buffer):
+            if i != window_width:
+                denominator += window_val
+        denominator = denominator / (2.0 * window_width)
+        denominator_is_zero = abs(denominator) < 0.00001
+
+        if not denominator_is_zero:
+            adaptive_ratio = content_val / denominator
+        elif denominator_is_zero and content_val >= self.min_delta_hsv:
+            # if we would have divided by zero, set adaptive_ratio to the max (255.0)
+            adaptive_ratio = 255.0
+        else:
+            # avoid dividing by zero by setting adaptive_ratio to zero if content_val
+            # is still very low
+            adaptive_ratio = 0.0
 
-        if self._first_frame is None:
-            self._first_frame = frame_num
-        self._last_frame = frame_num
+        if self.stats_manager is not None:
+            self.stats_manager.set_metrics(frame_num, {self._adaptive_ratio_key: adaptive_ratio})
 
-        return []
+        # Check to see if adaptive_ratio exceeds the adaptive_threshold as well as there
+        # being a large enough content_val to trigger a cut, respecting min_scene_len.
+        if (adaptive_ratio >= self.adaptive_threshold and content_val >= self.min_delta_hsv
+                and (self._last_cut is None or (frame_num - self._last_cut) >= self.min_scene_len)):
+            self._last_cut = frame_num
+            return frame_num
+        return None
 
     def get_content_val(self, frame_num):
         """
-        Returns the average content change for a frame.
+        Returns the average content change for a frame. Requires a StatsManager.
         """
-        metric_key = (
-            ContentDetector.FRAME_SCORE_KEY if not self._luma_only else ContentDetector.DELTA_V_KEY)
-        return self.stats_manager.get_metrics(frame_num, [metric_key])[0]
-
-    def post_process(self, _):
-        """
-        After an initial run through the video to detect content change
-        between each frame, we try to identify fast cuts as short peaks in the
-        `content_val` value. If a single frame has a high `content-val` while
-        the frames around it are low, we can be sure it's fast cut. If several
-        frames in a row have high `content-val`, it probably isn't a cut -- it
-        could be fast camera movement or a change in lighting that lasts for
-        more than a single frame.
-        """
-        cut_list = []
-        if self._first_frame is None:
-            return []
-        adaptive_threshold = self.adaptive_threshold
-        window_width = self.window_width
-        last_cut = None
-
-        assert self.stats_manager is not None
-
-        if self.stats_manager is not None:
-            # Loop through the stats, building the adaptive_ratio metric
-            for frame_num in range(self._first_frame + window_width + 1,
-                                   self._last_frame - window_width):
-                # If the content-val of the frame is more than
-                # adaptive_threshold times the mean content_val of the
-                # frames around it, then we mark it as a cut.
-                denominator = 0
-                for offset in range(-window_width, window_width + 1):
-                    if offset == 0:
-                        continue
-                    else:
-                        denominator += self.get_content_val(frame_num + offset)
-
-                denominator = denominator / (2.0 * window_width)
-                denominator_is_zero = abs(denominator) < 0.00001
-
-                if not denominator_is_zero:
-                    adaptive_ratio = self.get_content_val(frame_num) / denominator
-                elif denominator_is_zero and self.get_content_val(frame_num) >= self.min_delta_hsv:
-                    # if we would have divided by zero, set adaptive_ratio to the max (255.0)
-                    adaptive_ratio = 255.0
-                else:
-                    # avoid dividing by zero by setting adaptive_ratio to zero if content_val
-                    # is still very low
-                    adaptive_ratio = 0.0
-
-                self.stats_manager.set_metrics(frame_num,
-                                               {self._adaptive_ratio_key: adaptive_ratio})
-
-            # Loop through the frames again now that adaptive_ratio has been calculated to detect
-            # cuts using adaptive_ratio
-            for frame_num in range(self._first_frame + window_width + 1,
-                                   self._last_frame - window_width):
-                # Check to see if adaptive_ratio exceeds the adaptive_threshold as well as there
-                # being a large enough content_val to trigger a cut
-                if (self.stats_manager.get_metrics(
-                        frame_num, [self._adaptive_ratio_key])[0] >= adaptive_threshold
-                        and self.get_content_val(frame_num) >= self.min_delta_hsv):
-
-                    if last_cut is None:
-                        # No previously detected cuts
-                        cut_list.append(frame_num)
-                        last_cut = frame_num
-                    elif (frame_num - last_cut) >= self.min_scene_len:
-                        # Respect the min_scene_len parameter
-                        cut_list.append(frame_num)
-                        last_cut = frame_num
-
-            return cut_list
-
-        # Stats manager must be used for this detector
-        return []
+        return self.stats_manager.get_metrics(frame_num, [self.frame_score_key])[0]
@@ -16,22 +16,29 @@ against a set threshold/score, which if exceeded, triggers a scene cut.
 This detector is available from the command-line as the `detect-content` command.
 """
 
-from typing import Iterable, List, Tuple
+from logging import getLogger
+from typing import Iterable, List, Optional, Tuple, Union
 
 import numpy
 import cv2
 
-from scenedetect.scene_detector import SceneDetector
+from scenedetect.scene_detector import AutoThreshold, SceneDetector
 
+logger = getLogger('pyscenedetect')
 
-def calculate_frame_score(current_frame_hsv: Iterable[numpy.ndarray],
-                          last_frame_hsv: Iterable[numpy.ndarray]) -> Tuple[float]:
-    """Calculates score between two adjacent frames in the HSV colourspace. Frames should be
-    split, e.g. cv2.split(cv2.cvtColor(frame_data, cv2.COLOR_BGR2HSV)).
+
+def calculate_frame_score(current_frame_hsv: Union[numpy.ndarray, Iterable[numpy.ndarray]],
+                          last_frame_hsv: Union[numpy.ndarray, Iterable[numpy.ndarray]],
+                          delta_buffer: Optional[numpy.ndarray] = None) -> Tuple[float]:
+    """Calculates score between two adjacent frames in the HSV colourspace. Frames can either be
+    3-channel HSV images, e.g. cv2.cvtColor(frame_data, cv2.COLOR_BGR2HSV), or split into each
+    channel, e.g. cv2.split(cv2.cvtColor(frame_data, cv2.COLOR_BGR2HSV)).
 
     Arguments:
         curr_frame_hsv: Current frame.
         last_frame_hsv: Previous frame.
+        delta_buffer: Optional uint8 array with the same shape as a 3-channel HSV frame, used
+            to store the absolute difference between frames to avoid allocating a new one.
 
     Returns:
 
@@ -39,18 +46,45 @@ def calculate_frame_score(current_frame_hsv: Iterable[numpy.ndarray],
         across all components, e.g. (avg_h, avg_s, avg_v, avg_all).
 
     """
-    current_frame_hsv = [x.astype(numpy.int32) for x in current_frame_hsv]
-    last_frame_hsv = [x.astype(numpy.int32) for x in last_frame_hsv]
-    delta_hsv = [0, 0, 0, 0]
-    for i in range(3):
-        num_pixels = current_frame_hsv[i].shape[0] * current_frame_hsv[i].shape[1]
-        delta_hsv[i] = numpy.sum(
-            numpy.abs(current_frame_hsv[i] - last_frame_hsv[i])) / float(num_pixels)
-
-    delta_hsv[3] = sum(delta_hsv[0:3]) / 3.0
+    if not isinstance(current_frame_hsv, numpy.ndarray):
+        current_frame_hsv = cv2.merge(list(current_frame_hsv))
+    if not isinstance(last_frame_hsv, numpy.ndarray):
+        last_frame_hsv = cv2.merge(list(last_frame_hsv))
+    if delta_buffer is None or delta_buffer.shape != current_frame_hsv.shape:
+        delta_buffer = None
+    # Sums of uint8 values are exact in double precision, so the result is identical to summing
+    # the difference of each channel as integers.
+    delta = cv2.absdiff(current_frame_hsv, last_frame_hsv, dst=delta_buffer)
+    num_pixels = float(current_frame_hsv.shape[0] * current_frame_hsv.shape[1])
+    delta_hsv = [channel_sum / num_pixels for channel_sum in cv2.sumElems(delta)[:3]]
+    delta_hsv.append(sum(delta_hsv[0:3]) / 3.0)
     return tuple(delta_hsv)
 
 
+def select_cuts(candidates: numpy.ndarray, last_cut: Optional[int],
+                min_scene_len: int) -> numpy.ndarray:
+    """Select the cuts from every frame which passes a threshold, where each cut must be at least
+    `min_scene_len` frames after the previous one (the same way `ContentDetector` does).
+
+    Arguments:
+        candidates: Sorted frame numbers which pass the threshold.
+        last_cut: Frame number the first cut must be `min_scene_len` frames after, if any.
+        min_scene_len: Minimum number of frames between cuts.
+
+    Returns:
+        Frame numbers of the cuts.
+    """
+    cuts = []
+    i = 0 if last_cut is None else numpy.searchsorted(candidates, last_cut + min_scene_len)
+    # Jump straight to the next candidate far enough from the previous cut, so this only loops
+    # once per cut instead of once per frame.
+    while i < len(candidates):
+        cut = int(candidates[i])
+        cuts.append(cut)
+        i = numpy.searchsorted(candidates, cut + max(min_scene_len, 1))
+    return numpy.array(cuts, dtype=numpy.int64)
+
+
 class ContentDetector(SceneDetector):
     """Detects fast cuts using changes in colour and intensity between frames.
 
@@ -62,27 +96,96 @@ class ContentDetector(SceneDetector):
     FRAME_SCORE_KEY = 'content_val'
     DELTA_H_KEY, DELTA_S_KEY, DELTA_V_KEY = ('delta_hue', 'delta_sat', 'delta_lum')
     METRIC_KEYS = [FRAME_SCORE_KEY, DELTA_H_KEY, DELTA_S_KEY, DELTA_V_KEY]
-
-    def __init__(self, threshold: float = 27.0, min_scene_len: int = 15, luma_only: bool = False):
+    WEIGHTED_FRAME_SCORE_KEY_TEMPLATE = 'content_val (h={h:g} s={s:g} l={l:g})'
+
+    DEFAULT_WEIGHTS = (1.0, 1.0, 1.0)
+    """Default weights of the (hue, saturation, luma) components of the frame score."""
+    LUMA_ONLY_WEIGHTS = (0.0, 0.0, 1.0)
+    """Weights used when `luma_only` is set."""
+
+    def __init__(self,
+                 threshold: float = 27.0,
+                 min_scene_len: int = 15,
+                 luma_only: bool = False,
+                 weights: Optional[Tuple[float, float, float]] = None,
+                 auto_threshold: Optional[AutoThreshold] = None):
         """
         Arguments:
             threshold: Threshold the average change in pixel intensity must exceed to trigger a cut.
+                Ignored if `auto_threshold` is set.
             min_scene_len: Once a cut is detected, this many frames must pass before a new one can
                 be added to the scene list.
             luma_only: If True, only considers changes in the luminance channel of the video. The
-                default is False, which considers changes in hue, saturation, and luma.
+                default is False, which considers changes in hue, saturation, and luma. Frames are
+                not converted to HSV in this mode. Equivalent to setting `weights` to (0, 0, 1).
+            weights: Weights of the change in (hue, saturation, luma) used to calculate the frame
+                score, which is their weighted average. Channels with a weight of 0 are not stored
+                as metrics. If only luma has a non-zero weight, frames are not converted to HSV
+                (as with `luma_only`). If not set, all channels have the same weight. Ignored if
+                `luma_only` is set.
+            auto_threshold: If set, `threshold` is chosen from the frame scores of all frames,
+                and cuts are only found once all frames are processed (in `post_process`).
+
+        Raises:
+            ValueError: `weights` does not have 3 non-negative values, or they are all 0.
         """
         super().__init__()
         self.threshold = threshold
         # Minimum length of any given scene, in frames (int) or FrameTimecode
         self.min_scene_len = min_scene_len
         self.luma_only = luma_only
-        self.last_frame = None
+        if luma_only:
+            weights = ContentDetector.LUMA_ONLY_WEIGHTS
+        elif weights is None:
+            weights = ContentDetector.DEFAULT_WEIGHTS
+        weights = tuple(float(weight) for weight in weights)
+        if len(weights) != 3 or any(weight < 0.0 for weight in weights) or sum(weights) <= 0.0:
+            raise ValueError('weights must be 3 non-negative values, at least one of which is > 0!')
+        self.weights = weights
+        self._channels = [i for i, weight in enumerate(weights) if weight > 0.0]
+        delta_keys = (self.DELTA_H_KEY, self.DELTA_S_KEY, self.DELTA_V_KEY)
+        if weights == ContentDetector.DEFAULT_WEIGHTS:
+            self._frame_score_key = self.FRAME_SCORE_KEY
+            self._metric_keys = list(self.METRIC_KEYS)
+        elif len(self._channels) == 1:
+            # The frame score is the change in the only channel used.
+            self._frame_score_key = delta_keys[self._channels[0]]
+            self._metric_keys = [self._frame_score_key]
+        else:
+            self._frame_score_key = self.WEIGHTED_FRAME_SCORE_KEY_TEMPLATE.format(
+                h=weights[0], s=weights[1], l=weights[2])
+            self._metric_keys = [self._frame_score_key] + [delta_keys[i] for i in self._channels]
+        # Luma (the V channel in HSV) is max(B, G, R), so it can be calculated without
+        # converting the whole frame to HSV.
+        self._only_luma_channel = self._channels == [2]
         self.last_scene_cut = None
+        # HSV (or luma) image of the previous frame, or None if it was not converted because
+        # the metrics of the current frame were already available.
         self.last_hsv = None
+        self._has_previous_frame = False
+        # Frames are converted into alternating buffers so the previous frame is preserved.
+        self._hsv_buffers = [None, None]
+        self._hsv_index = 0
+        self._bgr_planes = None
+        self._delta_buffer = None
+        # Buffers used when processing a batch of frames (see `process_frames`).
+        self._batch_hsv = None
+        self._batch_planes = None
+        self._batch_delta = None
+        self.auto_threshold = auto_threshold
+        # First frame number processed, and the frame numbers and scores of every frame with a
+        # score, if using `auto_threshold`.
+        self._start_frame = None
+        self._frame_nums = []
+        self._frame_scores = []
 
     def get_metrics(self):
-        return ContentDetector.METRIC_KEYS
+        return list(self._metric_keys)
+
+    @property
+    def frame_score_key(self) -> str:
+        """Metric key of the frame score compared against `threshold`."""
+        return self._frame_score_key
 
     def is_processing_required(self, frame_num):
         if self.stats_manager is None:
@@ -90,22 +193,72 @@ class ContentDetector(SceneDetector):
         # Note this will always return True on the last frame of a video, but that's fine
         # as the only side-effect is the frame being decoded. We still don't perform the
         # calculations for that frame in `process_frame` if the last frame's metrics exist.
-        return not self.stats_manager.metrics_exist(frame_num, ContentDetector.METRIC_KEYS) or (
-            not self.stats_manager.metrics_exist(frame_num + 1, ContentDetector.METRIC_KEYS))
+        return not self.stats_manager.metrics_exist(frame_num, self._metric_keys) or (
+            not self.stats_manager.metrics_exist(frame_num + 1, self._metric_keys))
+
+    def _convert_to_hsv(self, frame_num: int, frame_img: numpy.ndarray) -> numpy.ndarray:
+        """Convert `frame_img` to HSV (or only luma if no other channels are used) into whichever
+        buffer does not hold `last_hsv`, or get it from the `frame_cache` if it is shared with
+        other detectors."""
+        if self.frame_cache is not None and self.frame_cache.holds(frame_num, frame_img):
+            return self.frame_cache.luma() if self._only_luma_channel else self.frame_cache.hsv()
+        self._hsv_index ^= 1
+        hsv_buffer = self._hsv_buffers[self._hsv_index]
+        shape = frame_img.shape[:2] if self._only_luma_channel else frame_img.shape
+        if hsv_buffer is None or hsv_buffer.shape != shape:
+            hsv_buffer = numpy.empty(shape, dtype=numpy.uint8)
+            self._hsv_buffers[self._hsv_index] = hsv_buffer
+        if self._only_luma_channel:
+            if self._bgr_planes is None or self._bgr_planes[0].shape != shape:
+                self._bgr_planes = [numpy.empty(shape, dtype=numpy.uint8) for _ in range(3)]
+            cv2.split(frame_img, self._bgr_planes)
+            cv2.max(self._bgr_planes[0], self._bgr_planes[1], dst=hsv_buffer)
+            cv2.max(hsv_buffer, self._bgr_planes[2], dst=hsv_buffer)
+        else:
+            cv2.cvtColor(frame_img, cv2.COLOR_BGR2HSV, dst=hsv_buffer)
+        return hsv_buffer
 
-    def _calculate_frame_score(self, frame_num: int, curr_hsv: List[numpy.ndarray],
-                               last_hsv: List[numpy.ndarray]) -> float:
-        delta_h, delta_s, delta_v, delta_content = calculate_frame_score(curr_hsv, last_hsv)
+    def _calculate_frame_score(self, frame_num: int, curr_hsv: numpy.ndarray,
+                               last_hsv: numpy.ndarray) -> float:
+        if self._delta_buffer is None or self._delta_buffer.shape != curr_hsv.shape:
+            self._delta_buffer = numpy.empty_like(curr_hsv)
 
-        if self.stats_manager is not None:
-            self.stats_manager.set_metrics(
-                frame_num, {
-                    self.FRAME_SCORE_KEY: delta_content,
+        if self._only_luma_channel:
+            delta = cv2.absdiff(curr_hsv, last_hsv, dst=self._delta_buffer)
+            deltas = (cv2.sumElems(delta)[0] / float(curr_hsv.shape[0] * curr_hsv.shape[1]),)
+        else:
+            deltas = calculate_frame_score(curr_hsv, last_hsv, self._delta_buffer)[:3]
+        return self._set_frame_score(frame_num, deltas)
+
+    def _set_frame_score(self, frame_num: int, deltas: Tuple[float, ...]) -> float:
+        """Set the metrics of `frame_num` from the average change in each channel (h, s, v), or
+        only in luma (v) if no other channels are used.
+
+        Returns:
+            Frame score calculated from `deltas`.
+        """
+        if self._only_luma_channel:
+            metrics = {self.DELTA_V_KEY: deltas[0]}
+        else:
+            delta_h, delta_s, delta_v = deltas
+            if self._frame_score_key == self.FRAME_SCORE_KEY:
+                metrics = {
+                    self.FRAME_SCORE_KEY: sum(deltas) / 3.0,
                     self.DELTA_H_KEY: delta_h,
                     self.DELTA_S_KEY: delta_s,
                     self.DELTA_V_KEY: delta_v
-                })
-        return delta_content if not self.luma_only else delta_v
+                }
+            elif len(self._channels) == 1:
+                metrics = {self._frame_score_key: deltas[self._channels[0]]}
+            else:
+                delta_keys = (self.DELTA_H_KEY, self.DELTA_S_KEY, self.DELTA_V_KEY)
+                metrics = {delta_keys[i]: deltas[i] for i in self._channels}
+                metrics[self._frame_score_key] = sum(
+                    self.weights[i] * deltas[i] for i in self._channels) / sum(self.weights)
+
+        if self.stats_manager is not None:
+            self.stats_manager.set_metrics(frame_num, metrics)
+        return metrics[self._frame_score_key]
 
     def process_frame(self, frame_num: int, frame_img: numpy.ndarray) -> List[int]:
         """ Similar to ThresholdDetector, but using the HSV colour space DIFFERENCE instead
@@ -121,57 +274,191 @@ class ContentDetector(SceneDetector):
             List of frames where scene cuts have been detected. There may be 0
             or more frames in the list, and not necessarily the same as frame_num.
         """
+        return self._process_frame_score(frame_num, self._get_frame_score(frame_num, frame_img))
+
+    def process_frames(self, start_frame_num: int, frames: numpy.ndarray) -> List[int]:
+        """Calculates the frame scores of a batch of frames at once. All frames are converted to
+        HSV with a single call, and the difference between each pair of adjacent frames in the
+        batch is calculated together. Processes each frame in turn if the frame score of any
+        frame in the batch is already in the StatsManager.
+
+        Arguments:
+            start_frame_num: Frame number of the first frame in the batch.
+            frames: Array of frames with shape (N, height, width, channels).
+
+        Returns:
+            List of frames where scene cuts have been detected.
+        """
+        if len(frames) == 0:
+            return []
+        if self.stats_manager is not None and self.stats_manager.metrics_exist_range(
+            [self._frame_score_key], start_frame_num, start_frame_num + len(frames)).any():
+            return super().process_frames(start_frame_num, frames)
+        cut_list = []
+        for i, frame_score in enumerate(self._get_frame_scores(start_frame_num, frames)):
+            cut_list += self._process_frame_score(start_frame_num + i, frame_score)
+        return cut_list
+
+    def _process_frame_score(self, frame_num: int, frame_score: Optional[float]) -> List[int]:
+        """Detect cuts using the frame score of `frame_num` (None for the first frame).
+
+        Returns:
+            List of frames where scene cuts have been detected.
+        """
         cut_list = []
-        _unused = ''
 
         # Initialize last scene cut point at the beginning of the frames of interest.
         if self.last_scene_cut is None:
             self.last_scene_cut = frame_num
 
+        # The threshold isn't known until all frames are processed, see `post_process`.
+        if self.auto_threshold is not None:
+            if self._start_frame is None:
+                self._start_frame = frame_num
+            if frame_score is not None:
+                self._frame_nums.append(frame_num)
+                self._frame_scores.append(frame_score)
+            return cut_list
+
+        # We consider any frame over the threshold a new scene, but only if
+        # the minimum scene length has been reached (otherwise it is ignored).
+        if frame_score is not None and frame_score >= self.threshold and (
+            (frame_num - self.last_scene_cut) >= self.min_scene_len):
+            cut_list.append(frame_num)
+            self.last_scene_cut = frame_num
+
+        return cut_list
+
+    def _get_frame_score(self, frame_num: int,
+                         frame_img: Optional[numpy.ndarray]) -> Optional[float]:
+        """Get the frame score of `frame_num`, loading it from the StatsManager if it exists, or
+        calculating it from `frame_img` otherwise.
+
+        Must be called for every frame in order, as the HSV image of the previous frame is kept.
+
+        Returns:
+            Frame score, or None if there is no previous frame to compare with.
+        """
+        curr_hsv = None
+        frame_score = None
         # We can only start detecting once we have a frame to compare with.
-        if self.last_frame is not None:
+        if self._has_previous_frame:
             # We obtain the change in average of HSV (frame_score), (h)ue only,
             # (s)aturation only, and (l)uminance only.  These are refered to in a statsfile
             # as their respective metric keys.
-            metric_key = (
-                ContentDetector.DELTA_V_KEY if self.luma_only else ContentDetector.FRAME_SCORE_KEY)
+            metric_key = self._frame_score_key
             if (self.stats_manager is not None
                     and self.stats_manager.metrics_exist(frame_num, [metric_key])):
                 frame_score = self.stats_manager.get_metrics(frame_num, [metric_key])[0]
-            else:
-                curr_hsv = cv2.split(cv2.cvtColor(frame_img, cv2.COLOR_BGR2HSV))
-                last_hsv = self.last_hsv
-                if not last_hsv:
-                    last_hsv = cv2.split(cv2.cvtColor(self.last_frame, cv2.COLOR_BGR2HSV))
-
-                frame_score = self._calculate_frame_score(frame_num, curr_hsv, last_hsv)
-
-                self.last_hsv = curr_hsv
-
-            # We consider any frame over the threshold a new scene, but only if
-            # the minimum scene length has been reached (otherwise it is ignored).
-            if frame_score >= self.threshold and (
-                (frame_num - self.last_scene_cut) >= self.min_scene_len):
-                cut_list.append(frame_num)
-                self.last_scene_cut = frame_num
-
-            if self.last_frame is not None and self.last_frame is not _unused:
-                del self.last_frame
-
-        # If we have the next frame computed, don't copy the current frame
-        # into last_frame since we won't use it on the next call anyways.
-        if (self.stats_manager is not None
-                and self.stats_manager.metrics_exist(frame_num + 1, self.get_metrics())):
-            self.last_frame = _unused
+            elif self.last_hsv is not None and frame_img is not None:
+                curr_hsv = self._convert_to_hsv(frame_num, frame_img)
+                frame_score = self._calculate_frame_score(frame_num, curr_hsv, self.last_hsv)
+
+        self._has_previous_frame = True
+        # If we have the next frame computed, don't convert the current frame since we won't
+        # use it on the next call anyways. If frame_img is None, all metrics were loaded from
+        # the StatsManager.
+        if frame_img is None or (self.stats_manager is not None
+                                 and self.stats_manager.metrics_exist(frame_num + 1,
+                                                                      self._metric_keys)):
+            self.last_hsv = None
         else:
-            self.last_frame = frame_img.copy()
+            self.last_hsv = curr_hsv if curr_hsv is not None else self._convert_to_hsv(
+                frame_num, frame_img)
 
-        return cut_list
+        return frame_score
 
-    # TODO(#250): Based on the parameters passed to the ContentDetector constructor,
-    # ensure that the last scene meets the minimum length requirement, otherwise it
-    # should be merged with the previous scene.
+    def _get_frame_scores(self, start_frame_num: int,
+                          frames: numpy.ndarray) -> List[Optional[float]]:
+        """Calculate the frame score of each frame in a batch, none of which may have metrics in
+        the StatsManager. Like `_get_frame_score`, the batch must follow the last frame processed.
 
-    #def post_process(self, frame_num):
-    #    """
-    #    return []
+        Returns:
+            Frame score of each frame, where the first is None if there is no previous frame.
+        """
+        num_frames, height, width = frames.shape[:3]
+        batch_hsv = self._convert_batch_to_hsv(frames)
+        frame_scores = [None]
+        if self.last_hsv is not None:
+            frame_scores[0] = self._calculate_frame_score(start_frame_num, batch_hsv[0],
+                                                          self.last_hsv)
+        if num_frames > 1:
+            # Compare every other frame with the one before it, as a single image of all frames
+            # stacked vertically. The frame scores are identical to calculating them for one
+            # frame at a time.
+            curr_hsv = batch_hsv[1:].reshape((num_frames - 1) * height, width, -1)
+            last_hsv = batch_hsv[:-1].reshape(curr_hsv.shape)
+            if self._batch_delta is None or self._batch_delta.size < curr_hsv.size:
+                self._batch_delta = numpy.empty(curr_hsv.size, dtype=numpy.uint8)
+            delta = cv2.absdiff(
+                curr_hsv, last_hsv, dst=self._batch_delta[:curr_hsv.size].reshape(curr_hsv.shape))
+            delta = delta.reshape(num_frames - 1, height, width, -1)
+            num_pixels = float(height * width)
+            for i in range(num_frames - 1):
+                deltas = [channel_sum / num_pixels for channel_sum in cv2.sumElems(delta[i])]
+                frame_scores.append(
+                    self._set_frame_score(start_frame_num + 1 + i, deltas[:delta.shape[3]]))
+        self._has_previous_frame = True
+        # Keep the last frame for the next batch, since the batch buffer will be reused.
+        self._hsv_index ^= 1
+        last_hsv = self._hsv_buffers[self._hsv_index]
+        if last_hsv is None or last_hsv.shape != batch_hsv.shape[1:]:
+            last_hsv = numpy.empty(batch_hsv.shape[1:], dtype=numpy.uint8)
+            self._hsv_buffers[self._hsv_index] = last_hsv
+        numpy.copyto(last_hsv, batch_hsv[-1])
+        self.last_hsv = last_hsv
+        return frame_scores
+
+    def _convert_batch_to_hsv(self, frames: numpy.ndarray) -> numpy.ndarray:
+        """Convert a batch of frames to HSV (or only luma if no other channels are used) as a
+        single image of all frames stacked vertically."""
+        num_frames, height, width = frames.shape[:3]
+        shape = frames.shape[:3] if self._only_luma_channel else frames.shape
+        if (self._batch_hsv is None or self._batch_hsv.shape[1:] != shape[1:]
+                or len(self._batch_hsv) < num_frames):
+            self._batch_hsv = numpy.empty(shape, dtype=numpy.uint8)
+        batch_hsv = self._batch_hsv[:num_frames]
+        image = frames.reshape(num_frames * height, width, frames.shape[3])
+        if self._only_luma_channel:
+            luma = batch_hsv.reshape(num_frames * height, width)
+            if self._batch_planes is None or self._batch_planes[0].shape != luma.shape:
+                self._batch_planes = [numpy.empty(luma.shape, dtype=numpy.uint8) for _ in range(3)]
+            cv2.split(image, self._batch_planes)
+            cv2.max(self._batch_planes[0], self._batch_planes[1], dst=luma)
+            cv2.max(luma, self._batch_planes[2], dst=luma)
+        else:
+            cv2.cvtColor(
+                image, cv2.COLOR_BGR2HSV, dst=batch_hsv.reshape(num_frames * height, width, 3))
+        return batch_hsv
+
+    def post_process(self, frame_num: int) -> List[int]:
+        """If `auto_threshold` is set, calculates the threshold from the scores of every frame
+        processed, and returns all of the cuts found with it.
+
+        Returns:
+            List of frames where scene cuts have been detected.
+        """
+        # TODO(#250): Based on the parameters passed to the ContentDetector constructor,
+        # ensure that the last scene meets the minimum length requirement, otherwise it
+        # should be merged with the previous scene.
+        if self.auto_threshold is None or self._start_frame is None:
+            return []
+        num_frames = frame_num + 1 - self._start_frame
+        frame_nums = numpy.array(self._frame_nums, dtype=numpy.int64)
+        frame_scores = numpy.array(self._frame_scores, dtype=numpy.float64)
+        self._start_frame, self._frame_nums, self._frame_scores = None, [], []
+
+        def get_cuts(threshold: float) -> numpy.ndarray:
+            return select_cuts(frame_nums[frame_scores >= threshold], self.last_scene_cut,
+                               self.min_scene_len)
+
+        threshold = self.auto_threshold.calculate(
+            frame_scores, num_frames, count_cuts=lambda threshold: len(get_cuts(threshold)))
+        if threshold is None:
+            return []
+        self.threshold = threshold
+        logger.info('Threshold set to %.2f using %s.', threshold, self.auto_threshold)
+        cuts = get_cuts(threshold).tolist()
+        if cuts:
+            self.last_scene_cut = cuts[-1]
+        return cuts
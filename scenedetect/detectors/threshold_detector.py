@@ -17,11 +17,13 @@ This detector is available from the command-line as the `detect-threshold` comma
 """
 
 from logging import getLogger
-from typing import List
+from typing import List, Optional
 
+import cv2
 import numpy
 
-from scenedetect.scene_detector import SceneDetector
+from scenedetect.scene_detector import AutoThreshold, SceneDetector
+from scenedetect.video_stream import PIXEL_FORMAT_BGR, PIXEL_FORMAT_GRAY
 
 logger = getLogger('pyscenedetect')
 
@@ -34,16 +36,17 @@ def compute_frame_average(frame: numpy.ndarray) -> float:
     """Computes the average pixel value/intensity for all pixels in a frame.
 
     The value is computed by adding up the 8-bit R, G, and B values for
-    each pixel, and dividing by the number of pixels multiplied by 3.
+    each pixel, and dividing by the number of pixels multiplied by 3. Frames
+    with a single channel (e.g. greyscale) are averaged the same way.
 
     Arguments:
         frame: Frame representing the RGB pixels to average.
 
     Returns:
-        Average pixel intensity across all 3 channels of `frame`
+        Average pixel intensity across all channels of `frame`
     """
-    num_pixel_values = float(frame.shape[0] * frame.shape[1] * frame.shape[2])
-    avg_pixel_value = numpy.sum(frame[:, :, :]) / num_pixel_values
+    num_pixel_values = float(frame.size)
+    avg_pixel_value = numpy.sum(frame) / num_pixel_values
     return avg_pixel_value
 
 
@@ -60,6 +63,7 @@ class ThresholdDetector(SceneDetector):
     """
 
     THRESHOLD_VALUE_KEY = 'delta_rgb'
+    LUMA_VALUE_KEY = 'delta_luma'
 
     def __init__(
         self,
@@ -68,6 +72,8 @@ class ThresholdDetector(SceneDetector):
         fade_bias: float = 0.0,
         add_final_scene: bool = False,
         block_size=None,
+        auto_threshold: Optional[AutoThreshold] = None,
+        luma_only: bool = False,
     ):
         """
         Arguments:
@@ -82,6 +88,16 @@ class ThresholdDetector(SceneDetector):
             add_final_scene:  Boolean indicating if the video ends on a fade-out to
                 generate an additional scene at this timecode.
             block_size: [DEPRECATED] DO NOT USE. For backwards compatibility.
+            auto_threshold: If set, `threshold` is chosen from the average intensity of all
+                frames, and cuts are only found once all frames are processed (in
+                `post_process`). Only `AutoThreshold.percentile` is supported.
+            luma_only: If True, use the average luma (Y) of each frame instead of the average of
+                the R, G, and B values. Frames are then requested from the video backend in
+                greyscale when possible, which is a third of the size. The metric is stored in
+                the stats file as `delta_luma` instead of `delta_rgb`.
+
+        Raises:
+            ValueError: `auto_threshold` uses `cuts_per_minute`.
         """
         # TODO: Remove `block_size`.
         if block_size is not None:
@@ -101,11 +117,25 @@ class ThresholdDetector(SceneDetector):
             'frame': 0,  # frame number where the last detected fade is
             'type': None  # type of fade, can be either 'in' or 'out'
         }
-        self._metric_keys = [ThresholdDetector.THRESHOLD_VALUE_KEY]
+
+        self._luma_only = luma_only
+        self._metric_keys = [
+            ThresholdDetector.LUMA_VALUE_KEY if luma_only else ThresholdDetector.THRESHOLD_VALUE_KEY
+        ]
+
+        if auto_threshold is not None and auto_threshold.percentile is None:
+            raise ValueError('ThresholdDetector only supports a percentile auto_threshold.')
+        self.auto_threshold = auto_threshold
+        # Frame numbers and average intensity of every frame processed, if using `auto_threshold`.
+        self._frame_nums = []
+        self._frame_averages = []
 
     def get_metrics(self) -> List[str]:
         return self._metric_keys
 
+    def input_format(self) -> str:
+        return PIXEL_FORMAT_GRAY if self._luma_only else PIXEL_FORMAT_BGR
+
     def process_frame(self, frame_num: int, frame_img: numpy.ndarray) -> List[int]:
         """
         Args:
@@ -118,17 +148,6 @@ class ThresholdDetector(SceneDetector):
             or more frames in the list, and not necessarily the same as frame_num.
         """
 
-        # Initialize last scene cut point at the beginning of the frames of interest.
-        if self.last_scene_cut is None:
-            self.last_scene_cut = frame_num
-
-        # Compare the # of pixels under threshold in current_frame & last_frame.
-        # If absolute value of pixel intensity delta is above the threshold,
-        # then we trigger a new scene cut/break.
-
-        # List of cuts to return.
-        cut_list = []
-
         # The metric used here to detect scene breaks is the percent of pixels
         # less than or equal to the threshold; however, since this differs on
         # user-supplied values, we supply the average pixel intensity as this
@@ -136,10 +155,85 @@ class ThresholdDetector(SceneDetector):
         if (self.stats_manager is not None) and (self.stats_manager.metrics_exist(
                 frame_num, self._metric_keys)):
             frame_avg = self.stats_manager.get_metrics(frame_num, self._metric_keys)[0]
+        elif frame_img is None:
+            # Frames which were not decoded (e.g. skipped by a prefilter) are ignored.
+            return []
         else:
-            frame_avg = compute_frame_average(frame_img)
+            frame_avg = self._get_frame_average(frame_num, frame_img)
             if self.stats_manager is not None:
                 self.stats_manager.set_metrics(frame_num, {self._metric_keys[0]: frame_avg})
+        return self._add_frame_average(frame_num, frame_avg)
+
+    def process_frames(self, start_frame_num: int, frames: numpy.ndarray) -> List[int]:
+        """Calculates the average pixel intensity of a batch of frames at once. Processes each
+        frame in turn if the average of any frame in the batch is already in the StatsManager.
+
+        Arguments:
+            start_frame_num: Frame number of the first frame in the batch.
+            frames: Array of frames with shape (N, height, width, channels), or (N, height, width)
+                if the frames are greyscale.
+
+        Returns:
+            List of frames where scene cuts have been detected.
+        """
+        num_frames = len(frames)
+        if num_frames == 0:
+            return []
+        if self.stats_manager is not None and self.stats_manager.metrics_exist_range(
+                self._metric_keys, start_frame_num, start_frame_num + num_frames).any():
+            return super().process_frames(start_frame_num, frames)
+        if self._luma_only and frames.ndim == 4:
+            frames = cv2.cvtColor(
+                frames.reshape(-1, frames.shape[2], frames.shape[3]),
+                cv2.COLOR_BGR2GRAY).reshape(frames.shape[:3])
+        # Sums of uint8 values are exact, so this is identical to `compute_frame_average`.
+        frame_sums = frames.reshape(num_frames, -1).sum(axis=1, dtype=numpy.uint64)
+        frame_averages = frame_sums / float(frames[0].size)
+        cut_list = []
+        for i, frame_avg in enumerate(frame_averages.tolist()):
+            if self.stats_manager is not None:
+                self.stats_manager.set_metrics(start_frame_num + i,
+                                               {self._metric_keys[0]: frame_avg})
+            cut_list += self._add_frame_average(start_frame_num + i, frame_avg)
+        return cut_list
+
+    def _get_frame_average(self, frame_num: int, frame_img: numpy.ndarray) -> float:
+        """Calculate the average intensity of `frame_img`, or of its luma if `luma_only` is set
+        and the frame is not already greyscale."""
+        if self.frame_cache is not None and self.frame_cache.holds(frame_num, frame_img):
+            if self._luma_only and frame_img.ndim == 3:
+                return compute_frame_average(self.frame_cache.grey())
+            return self.frame_cache.mean()
+        if self._luma_only and frame_img.ndim == 3:
+            frame_img = cv2.cvtColor(frame_img, cv2.COLOR_BGR2GRAY)
+        return compute_frame_average(frame_img)
+
+    def _add_frame_average(self, frame_num: int, frame_avg: float) -> List[int]:
+        """Detect fades using the average intensity `frame_avg` of the frame `frame_num`, or keep
+        it until all frames are processed if using `auto_threshold`."""
+        # The threshold isn't known until all frames are processed, see `post_process`.
+        if self.auto_threshold is not None:
+            self._frame_nums.append(frame_num)
+            self._frame_averages.append(frame_avg)
+            return []
+        return self._process_frame_average(frame_num, frame_avg)
+
+    def _process_frame_average(self, frame_num: int, frame_avg: float) -> List[int]:
+        """Detect fades using the average intensity `frame_avg` of the frame `frame_num`.
+
+        Returns:
+            List[int]: List of frames where scene cuts have been detected.
+        """
+        # Initialize last scene cut point at the beginning of the frames of interest.
+        if self.last_scene_cut is None:
+            self.last_scene_cut = frame_num
+
+        # Compare the # of pixels under threshold in current_frame & last_frame.
+        # If absolute value of pixel intensity delta is above the threshold,
+        # then we trigger a new scene cut/break.
+
+        # List of cuts to return.
+        cut_list = []
 
         if self.processed_frame:
             if self.last_fade['type'] == 'in' and frame_avg < self.threshold:
@@ -176,10 +270,20 @@ class ThresholdDetector(SceneDetector):
         exact frame where the fade-out crossed the detection threshold.
         """
 
+        cut_times = []
+        # If using `auto_threshold`, the frames are processed now that the threshold is known.
+        if self.auto_threshold is not None and self._frame_nums:
+            threshold = self.auto_threshold.calculate(
+                numpy.array(self._frame_averages, dtype=numpy.float64), len(self._frame_nums))
+            self.threshold = int(threshold)
+            logger.info('Threshold set to %d using %s.', self.threshold, self.auto_threshold)
+            for avg_frame_num, frame_avg in zip(self._frame_nums, self._frame_averages):
+                cut_times += self._process_frame_average(avg_frame_num, frame_avg)
+            self._frame_nums, self._frame_averages = [], []
+
         # If the last fade detected was a fade out, we add a corresponding new
         # scene break to indicate the end of the scene.  This is only done for
         # fade-outs, as a scene cut is already added when a fade-in is found.
-        cut_times = []
         if self.last_fade['type'] == 'out' and self.add_final_scene and (
             (self.last_scene_cut is None and frame_num >= self.min_scene_len) or
             (frame_num - self.last_scene_cut) >= self.min_scene_len):
@@ -20,6 +20,7 @@ DLLs on Windows and getting uniform line-terminating csv reader/writer objects
 are also included in this module.
 """
 
+import hashlib
 import logging
 import os
 import os.path
@@ -120,6 +121,32 @@ def get_and_create_path(file_path: AnyStr, output_directory: Optional[AnyStr] =
     return file_path
 
 
+_FINGERPRINT_BLOCK_SIZE: int = 64 * 1024
+_FINGERPRINT_BLOCK_COUNT: int = 4
+
+
+def get_file_fingerprint(path: AnyStr, prefix: bytes = b'') -> str:
+    """Get a key identifying the current contents of a file, without reading all of it. The key
+    is based on the size and modification time of the file, as well as a hash of several evenly
+    spaced blocks from it.
+
+    Arguments:
+        path: Path to file.
+        prefix: Extra data to include in the key (e.g. a file format version).
+
+    Returns:
+        Hex digest uniquely identifying the current contents of the file.
+    """
+    stat = os.stat(path)
+    key = hashlib.sha1()
+    key.update(prefix + b'%d:%d:' % (stat.st_size, stat.st_mtime_ns))
+    with open(path, 'rb') as file:
+        for i in range(_FINGERPRINT_BLOCK_COUNT):
+            file.seek((stat.st_size * i) // _FINGERPRINT_BLOCK_COUNT)
+            key.update(file.read(_FINGERPRINT_BLOCK_SIZE))
+    return key.hexdigest()
+
+
 ##
 ## Logging
 ##
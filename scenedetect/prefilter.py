@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+#
+#         PySceneDetect: Python-Based Video Scene Detector
+#   ---------------------------------------------------------------
+#     [  Site:   http://www.scenedetect.scenedetect.com/         ]
+#     [  Docs:   http://manual.scenedetect.scenedetect.com/      ]
+#     [  Github: https://github.com/Breakthrough/PySceneDetect/  ]
+#
+# Copyright (C) 2014-2022 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+""" ``scenedetect.prefilter`` Module
+
+This module finds frames which are likely to be scene changes using only compressed-domain
+signals, which are obtained by demuxing a video without decoding any frames:
+
+ * Encoders insert keyframes at scene changes, in addition to placing them at a regular
+   interval. Keyframes which come before the regular interval has elapsed are candidates.
+
+ * The first frame of a new scene cannot be predicted well from the frames before it, so its
+   packet is usually several times larger than those of the frames around it.
+
+Setting :py:attr:`SceneManager.prefilter <scenedetect.scene_manager.SceneManager.prefilter>`
+to a :py:class:`Prefilter` makes the SceneManager only decode frames within a few frames of
+each candidate, skipping the rest of the video by seeking. Detectors which compare each frame
+with the ones before it (:py:class:`ContentDetector <scenedetect.detectors.ContentDetector>`
+and :py:class:`AdaptiveDetector <scenedetect.detectors.AdaptiveDetector>`) then produce an
+approximate scene list at a fraction of the cost of decoding every frame:
+
+.. code:: python
+
+    from scenedetect import open_video, SceneManager, ContentDetector
+    from scenedetect.prefilter import Prefilter
+    video = open_video('video.mp4')
+    scene_manager = SceneManager()
+    scene_manager.add_detector(ContentDetector())
+    scene_manager.prefilter = Prefilter()
+    scene_manager.detect_scenes(video)
+
+Candidates are found from the :py:class:`FrameIndex
+<scenedetect.backends.frame_index.FrameIndex>` of the video, which requires PyAV. The index is
+cached on disk, and is shared with `VideoStreamAv` when using an index to seek.
+"""
+
+from logging import getLogger
+import os.path
+from typing import AnyStr, List, Optional, Tuple
+import warnings
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+from scenedetect.video_stream import VideoStream
+
+try:
+    from scenedetect.backends.frame_index import FrameIndex, FrameIndexUnavailable
+except ImportError:
+    FrameIndex = None
+
+logger = getLogger('pyscenedetect')
+
+DEFAULT_SIZE_RATIO: float = 3.0
+"""Default ratio of the packet size of a frame to the sizes of the frames around it for the
+frame to be a candidate."""
+
+DEFAULT_MARGIN: int = 5
+"""Default number of frames decoded on either side of each candidate."""
+
+BASELINE_WINDOW: int = 15
+"""Number of frames on either side of each frame whose packet sizes are compared with it."""
+
+_SCORE_CHUNK_SIZE: int = 65536
+"""Number of frames to score at once, to bound memory use for long videos."""
+
+
+def score_frames(index: 'FrameIndex', window: int = BASELINE_WINDOW) -> np.ndarray:
+    """Score each frame by the size of its packet relative to the median size of the packets of
+    the frames within `window` frames of it. Keyframes are excluded, since they are always much
+    larger than the frames around them, unless every frame is a keyframe (e.g. intra-only
+    codecs such as MJPEG).
+
+    Arguments:
+        index: Index of the video.
+        window: Number of frames on either side of each frame to compare it with.
+
+    Returns:
+        Score of each frame. Keyframes (unless every frame is one) score 0.
+    """
+    sizes = index.packet_size.astype(np.float64)
+    exclude_keyframes = not index.keyframe.all()
+    baseline_sizes = sizes.copy()
+    if exclude_keyframes:
+        baseline_sizes[index.keyframe] = np.nan
+    padded = np.pad(baseline_sizes, window, mode='constant', constant_values=np.nan)
+    baseline = np.empty_like(sizes)
+    for start in range(0, len(sizes), _SCORE_CHUNK_SIZE):
+        end = min(start + _SCORE_CHUNK_SIZE, len(sizes))
+        # Each row is a view of the 2 * window + 1 sizes centered on a frame.
+        windows = as_strided(
+            padded[start:],
+            shape=(end - start, 2 * window + 1),
+            strides=(padded.strides[0], padded.strides[0]),
+            writeable=False)
+        with warnings.catch_warnings():
+            # Windows containing only keyframes have no median.
+            warnings.simplefilter('ignore', RuntimeWarning)
+            baseline[start:end] = np.nanmedian(windows, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = sizes / baseline
+    scores[~np.isfinite(scores)] = 0.0
+    if exclude_keyframes:
+        scores[index.keyframe] = 0.0
+    return scores
+
+
+def find_candidates(index: 'FrameIndex',
+                    size_ratio: float = DEFAULT_SIZE_RATIO,
+                    window: int = BASELINE_WINDOW) -> np.ndarray:
+    """Find frames which are likely to be scene changes: keyframes which were inserted before the
+    regular keyframe interval, and frames with a score of at least `size_ratio` (see
+    :py:func:`score_frames`).
+
+    Arguments:
+        index: Index of the video.
+        size_ratio: Minimum score of frames which are candidates.
+        window: Number of frames on either side of each frame to compare it with.
+
+    Returns:
+        Frame numbers (0-based) of each candidate, in ascending order.
+    """
+    keyframe_nums = index.keyframe_nums
+    intervals = np.diff(keyframe_nums)
+    inserted_keyframes = keyframe_nums[:0]
+    if len(intervals) > 0:
+        # The longest interval is assumed to be the regular one (e.g. x264's `keyint`).
+        inserted_keyframes = keyframe_nums[1:][intervals < intervals.max()]
+    size_spikes = np.flatnonzero(score_frames(index, window) >= size_ratio)
+    return np.union1d(inserted_keyframes, size_spikes)
+
+
+class Prefilter:
+    """Selects which frames a :py:class:`SceneManager <scenedetect.scene_manager.SceneManager>`
+    decodes, from candidates found by demuxing the video (see :py:func:`find_candidates`)."""
+
+    def __init__(self,
+                 size_ratio: float = DEFAULT_SIZE_RATIO,
+                 margin: int = DEFAULT_MARGIN,
+                 index_dir: Optional[AnyStr] = None):
+        """
+        Arguments:
+            size_ratio: Minimum ratio of the packet size of a frame to the sizes of the frames
+                around it for the frame to be a candidate. Lower values find more candidates.
+            margin: Number of frames to decode on either side of each candidate. Should be
+                larger than the window used by detectors (e.g. `window_width` of
+                `AdaptiveDetector`), and allows for candidates being a few frames away from
+                the actual scene change.
+            index_dir: Folder to store frame indexes in. If not set, uses the user cache
+                folder (see :py:data:`scenedetect.backends.frame_index.INDEX_CACHE_DIR`).
+
+        Raises:
+            ValueError: `size_ratio` or `margin` is invalid.
+        """
+        if size_ratio <= 1.0:
+            raise ValueError('size_ratio must be greater than 1.0!')
+        if margin < 1:
+            raise ValueError('margin must be at least 1!')
+        self.size_ratio = size_ratio
+        self.margin = margin
+        self._index_dir = index_dir
+
+    def get_windows(self, index: 'FrameIndex') -> List[Tuple[int, int]]:
+        """Get the ranges of frames around each candidate, merging any which overlap.
+
+        Returns:
+            List of (start, end) frame numbers of each window, where `end` is exclusive.
+        """
+        windows = []
+        for frame_num in find_candidates(index, self.size_ratio).tolist():
+            start, end = max(0, frame_num - self.margin), frame_num + self.margin + 1
+            if windows and start <= windows[-1][1]:
+                windows[-1] = (windows[-1][0], end)
+            else:
+                windows.append((start, end))
+        return windows
+
+    def get_required_frames(self, video: VideoStream, start_frame_num: int,
+                            end_frame_num: int) -> Optional[np.ndarray]:
+        """Find which frames of `video` must be decoded because they are near a candidate.
+
+        Arguments:
+            video: Video to get the index of. Uses the index of the video if it has one (e.g.
+                `VideoStreamAv` with `use_index` set), otherwise builds or loads one from the
+                path of the video.
+            start_frame_num: First frame to include.
+            end_frame_num: Frame after the last one to include.
+
+        Returns:
+            Array of booleans for each frame from `start_frame_num` to `end_frame_num`, which
+            are True for frames that must be decoded, or None if the video cannot be indexed.
+        """
+        index = self._get_index(video)
+        if index is None:
+            return None
+        required = np.zeros(max(end_frame_num, index.num_frames), dtype=bool)
+        for start, end in self.get_windows(index):
+            required[start:end] = True
+        # Frames missing from the index are always decoded.
+        required[index.num_frames:] = True
+        required = required[start_frame_num:end_frame_num]
+        logger.info('Prefilter selected %d of %d frames to decode.', np.count_nonzero(required),
+                    len(required))
+        return required
+
+    def _get_index(self, video: VideoStream) -> Optional['FrameIndex']:
+        """Get the index of `video`, or None if it cannot be indexed."""
+        index = getattr(video, 'index', None)
+        if index is not None:
+            return index
+        reason = None
+        if FrameIndex is None:
+            reason = 'PyAV is not available'
+        elif not (isinstance(video.path, str) and os.path.isfile(video.path)):
+            reason = 'input must be a video file'
+        if reason is None:
+            try:
+                return FrameIndex.open(video.path, self._index_dir)
+            except (FrameIndexUnavailable, OSError) as ex:
+                reason = str(ex)
+        logger.warning('Unable to index video for prefilter, decoding every frame: %s', reason)
+        return None
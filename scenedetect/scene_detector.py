@@ -25,11 +25,215 @@ are expected to provide in order to be compatible with PySceneDetect.
     provide a specific type of event (in, out, cut, etc...).
 """
 
-from typing import List, Optional, Tuple
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import cv2
 import numpy
 
 from scenedetect.stats_manager import StatsManager
+from scenedetect.video_stream import PIXEL_FORMAT_BGR
+
+
+class AutoThreshold:
+    """Chooses the threshold of a detector from the distribution of frame scores once every frame
+    has been processed, instead of using a fixed value.
+
+    The threshold is either a percentile of the frame scores, or the lowest threshold which
+    results in at most a target number of cuts per minute of video. Detectors which support this
+    (e.g. :py:class:`ContentDetector <scenedetect.detectors.ContentDetector>`) keep the frame
+    score of every frame, and find all cuts with the chosen threshold in `post_process`.
+    """
+
+    def __init__(self,
+                 percentile: Optional[float] = None,
+                 cuts_per_minute: Optional[float] = None,
+                 frame_rate: Optional[float] = None):
+        """
+        Arguments:
+            percentile: Percentile of the frame scores (from 0 to 100) to use as the threshold.
+            cuts_per_minute: Target number of cuts per minute of video.
+            frame_rate: Framerate of the video, in frames/sec. Required if `cuts_per_minute`
+                is set.
+
+        Raises:
+            ValueError: Both or neither of `percentile` and `cuts_per_minute` are set, or a
+                value is out of range.
+        """
+        if (percentile is None) == (cuts_per_minute is None):
+            raise ValueError('Exactly one of percentile or cuts_per_minute must be set.')
+        if percentile is not None and not 0.0 <= percentile <= 100.0:
+            raise ValueError('percentile must be between 0 and 100.')
+        if cuts_per_minute is not None:
+            if cuts_per_minute < 0.0:
+                raise ValueError('cuts_per_minute must be positive.')
+            if frame_rate is None or frame_rate <= 0.0:
+                raise ValueError('frame_rate is required to use cuts_per_minute.')
+        self.percentile = percentile
+        self.cuts_per_minute = cuts_per_minute
+        self.frame_rate = frame_rate
+
+    def __repr__(self) -> str:
+        if self.percentile is not None:
+            return 'AutoThreshold(percentile=%g)' % self.percentile
+        return 'AutoThreshold(cuts_per_minute=%g, frame_rate=%g)' % (self.cuts_per_minute,
+                                                                     self.frame_rate)
+
+    def calculate(self,
+                  frame_scores: numpy.ndarray,
+                  num_frames: int,
+                  count_cuts: Optional[Callable[[float], int]] = None) -> Optional[float]:
+        """Calculate the threshold.
+
+        Arguments:
+            frame_scores: Frame score of each frame processed. NaN values are ignored.
+            num_frames: Number of frames processed.
+            count_cuts: Function returning how many cuts the detector finds with a given
+                threshold, which must not increase as the threshold does. Required if
+                `cuts_per_minute` is set.
+
+        Returns:
+            Threshold, or None if there are no frame scores to calculate it from.
+        """
+        frame_scores = frame_scores[~numpy.isnan(frame_scores)]
+        if len(frame_scores) == 0:
+            return None
+        if self.percentile is not None:
+            return float(numpy.percentile(frame_scores, self.percentile))
+        if count_cuts is None:
+            raise ValueError('count_cuts is required to use cuts_per_minute.')
+        max_cuts = int(round(self.cuts_per_minute * num_frames / (self.frame_rate * 60.0)))
+        # Binary search for the lowest frame score which results in at most `max_cuts` cuts. A
+        # threshold just above the highest score results in no cuts at all.
+        thresholds = numpy.unique(frame_scores)
+        thresholds = numpy.append(thresholds, numpy.nextafter(thresholds[-1], numpy.inf))
+        low, high = 0, len(thresholds) - 1
+        while low < high:
+            mid = (low + high) // 2
+            if count_cuts(float(thresholds[mid])) <= max_cuts:
+                high = mid
+            else:
+                low = mid + 1
+        return float(thresholds[low])
+
+
+class FrameCache:
+    """Representations of a frame derived from its pixels (e.g. the frame converted to HSV), which
+    are calculated the first time a detector requests them, and shared by every other detector
+    processing the same frame.
+
+    The :py:class:`SceneManager <scenedetect.scene_manager.SceneManager>` sets the
+    :py:attr:`SceneDetector.frame_cache` of each detector added to it, and calls
+    :py:meth:`set_frame` before passing each frame to the detectors. Arrays returned by the
+    cache are reused when the same representation is calculated for the frame after the next, so
+    detectors can keep the one of the previous frame without copying it.
+
+    Values can be requested from multiple threads at once, in which case each one is still only
+    calculated once.
+    """
+
+    def __init__(self):
+        self._frame_num: Optional[int] = None
+        self._frame_img: Optional[numpy.ndarray] = None
+        # Values calculated for the current frame, by key.
+        self._values: Dict[str, Any] = {}
+        # Lock held while calculating each value, created under `_lock`.
+        self._lock = threading.Lock()
+        self._value_locks: Dict[str, threading.Lock] = {}
+        # Two buffers for each array representation, one of which may be held by detectors as
+        # the previous frame, and index of the buffer that was written last.
+        self._buffers: Dict[str, List[Optional[numpy.ndarray]]] = {}
+        self._buffer_index: Dict[str, int] = {}
+        self._bgr_planes: Optional[List[numpy.ndarray]] = None
+
+    @property
+    def frame_num(self) -> Optional[int]:
+        """Frame number of the current frame, or None if no frame was set."""
+        return self._frame_num
+
+    def set_frame(self, frame_num: Optional[int], frame_img: Optional[numpy.ndarray]):
+        """Set the frame which values are calculated for, discarding those of the last frame."""
+        self._frame_num = frame_num
+        self._frame_img = frame_img
+        self._values.clear()
+
+    def clear(self):
+        """Discard the current frame and all values calculated from it."""
+        self.set_frame(None, None)
+
+    def holds(self, frame_num: int, frame_img: Optional[numpy.ndarray]) -> bool:
+        """Check if `frame_img` is the current frame, i.e. if values from the cache can be used
+        instead of calculating them from `frame_img`."""
+        return (frame_img is not None and frame_num == self._frame_num
+                and frame_img is self._frame_img)
+
+    def get(self, key: str, calculate: Callable[[numpy.ndarray], Any]) -> Any:
+        """Get a value derived from the current frame, calling `calculate` with the frame image
+        if it was not yet requested by another detector. Detectors should use a `key` which is
+        unique to the parameters that `calculate` uses (e.g. 'hist_b32' for a histogram of the
+        blue channel with 32 bins), as the value is shared with any detector using the same key.
+
+        Raises:
+            ValueError: There is no current frame image.
+        """
+        if key in self._values:
+            return self._values[key]
+        with self._lock:
+            value_lock = self._value_locks.setdefault(key, threading.Lock())
+        with value_lock:
+            if key not in self._values:
+                if self._frame_img is None:
+                    raise ValueError('FrameCache has no frame image to calculate %s from.' % key)
+                self._values[key] = calculate(self._frame_img)
+            return self._values[key]
+
+    def hsv(self) -> numpy.ndarray:
+        """Current frame converted to HSV, as a 3-channel uint8 image."""
+        return self.get('hsv', self._calculate_hsv)
+
+    def luma(self) -> numpy.ndarray:
+        """V channel of the current frame converted to HSV, i.e. the maximum of the B, G, and R
+        values of each pixel, without calculating the H and S channels."""
+        return self.get('luma', self._calculate_luma)
+
+    def grey(self) -> numpy.ndarray:
+        """Current frame converted to greyscale, or the frame itself if it is already in a single
+        channel format."""
+        return self.get('grey', self._calculate_grey)
+
+    def mean(self) -> float:
+        """Average of the B, G, and R values (or the single channel) of every pixel in the
+        current frame."""
+        return self.get('mean', lambda frame_img: numpy.sum(frame_img) / float(frame_img.size))
+
+    def _calculate_hsv(self, frame_img: numpy.ndarray) -> numpy.ndarray:
+        return cv2.cvtColor(
+            frame_img, cv2.COLOR_BGR2HSV, dst=self._get_buffer('hsv', frame_img.shape))
+
+    def _calculate_grey(self, frame_img: numpy.ndarray) -> numpy.ndarray:
+        if frame_img.ndim == 2:
+            return frame_img
+        return cv2.cvtColor(
+            frame_img, cv2.COLOR_BGR2GRAY, dst=self._get_buffer('grey', frame_img.shape[:2]))
+
+    def _calculate_luma(self, frame_img: numpy.ndarray) -> numpy.ndarray:
+        shape = frame_img.shape[:2]
+        luma = self._get_buffer('luma', shape)
+        if self._bgr_planes is None or self._bgr_planes[0].shape != shape:
+            self._bgr_planes = [numpy.empty(shape, dtype=numpy.uint8) for _ in range(3)]
+        cv2.split(frame_img, self._bgr_planes)
+        cv2.max(self._bgr_planes[0], self._bgr_planes[1], dst=luma)
+        cv2.max(luma, self._bgr_planes[2], dst=luma)
+        return luma
+
+    def _get_buffer(self, key: str, shape: Tuple[int, ...]) -> numpy.ndarray:
+        """Get whichever buffer for `key` was not written last, allocating it if required."""
+        buffers = self._buffers.setdefault(key, [None, None])
+        index = self._buffer_index.get(key, 0) ^ 1
+        self._buffer_index[key] = index
+        if buffers[index] is None or buffers[index].shape != shape:
+            buffers[index] = numpy.empty(shape, dtype=numpy.uint8)
+        return buffers[index]
 
 
 # pylint: disable=unused-argument, no-self-use
@@ -49,6 +253,12 @@ class SceneDetector:
     """Optional :py:class:`StatsManager <scenedetect.stats_manager.StatsManager>` to
     use for caching frame metrics to and from."""
 
+    frame_cache: Optional[FrameCache] = None
+    """Optional :py:class:`FrameCache` shared with other detectors, which holds representations
+    of the frame being processed (e.g. HSV) so they are only calculated once for all detectors.
+    Only valid if :py:meth:`FrameCache.holds` is True for the frame passed to
+    :py:meth:`process_frame`."""
+
     # TODO(v1.0): Remove - this is a rarely used case for what is now a neglegible performance gain.
     def is_processing_required(self, frame_num: int) -> bool:
         """[DEPRECATED] DO NOT USE
@@ -68,6 +278,14 @@ class SceneDetector:
         return not metric_keys or not (self.stats_manager is not None
                                        and self.stats_manager.metrics_exist(frame_num, metric_keys))
 
+    @property
+    def event_buffer_length(self) -> int:
+        """Number of frames behind the current frame that events (and frame metrics) may be
+        produced for. For example, if `event_buffer_length` is 2, the result of calling
+        :py:meth:`process_frame` with frame N may include a cut on frame N - 2, and metrics for
+        frame N - 2 may be set in the :py:attr:`stats_manager`."""
+        return 0
+
     def stats_manager_required(self) -> bool:
         """Stats Manager Required: Prototype indicating if detector requires stats.
 
@@ -85,6 +303,32 @@ class SceneDetector:
         """
         return []
 
+    def get_input_metrics(self) -> List[str]:
+        """Get the metric keys which must be set in the :py:attr:`stats_manager` for a frame to be
+        processed without the frame image (i.e. when `frame_img` is None), such as when detecting
+        scenes only from frame metrics. Metrics which are calculated from other metrics can be
+        excluded.
+
+        Returns:
+            List of strings of frame metric key names. Defaults to :py:meth:`get_metrics`.
+        """
+        return self.get_metrics()
+
+    def input_format(self) -> str:
+        """Get the pixel format the detector would prefer frames in (e.g.
+        :py:data:`PIXEL_FORMAT_GRAY <scenedetect.video_stream.PIXEL_FORMAT_GRAY>`). If every
+        detector added to a :py:class:`SceneManager <scenedetect.scene_manager.SceneManager>`
+        prefers the same format, the video backend is asked to return frames in that format, which
+        avoids decoding and transferring channels no detector uses.
+
+        Detectors must still accept BGR frames, since not every backend supports every format.
+
+        Returns:
+            Pixel format of frames passed to :py:meth:`process_frame`. Defaults to
+            :py:data:`PIXEL_FORMAT_BGR <scenedetect.video_stream.PIXEL_FORMAT_BGR>`.
+        """
+        return PIXEL_FORMAT_BGR
+
     def process_frame(self, frame_num: int, frame_img: numpy.ndarray) -> List[int]:
         """Process Frame: Computes/stores metrics and detects any scene changes.
 
@@ -95,6 +339,29 @@ class SceneDetector:
         """
         return []
 
+    def process_frames(self, start_frame_num: int, frames: numpy.ndarray) -> List[int]:
+        """Process a batch of consecutive frames, where `frames[i]` is frame number
+        `start_frame_num + i`. Used instead of :py:meth:`process_frame` when the
+        :py:attr:`SceneManager.batch_size <scenedetect.scene_manager.SceneManager.batch_size>`
+        is set.
+
+        Detectors can override this to calculate frame metrics for every frame in the batch at
+        once, which avoids the overhead of processing each frame individually. By default, calls
+        :py:meth:`process_frame` with each frame in turn.
+
+        Arguments:
+            start_frame_num: Frame number of the first frame in the batch.
+            frames: Array of frames with shape (N, height, width, channels), or (N, height, width)
+                if frames are in a single channel format (see :py:meth:`input_format`).
+
+        Returns:
+            List of frame numbers of cuts to be added to the cutting list.
+        """
+        cuts = []
+        for i, frame_img in enumerate(frames):
+            cuts += self.process_frame(start_frame_num + i, frame_img)
+        return cuts
+
     def post_process(self, frame_num: int) -> List[int]:
         """Post Process: Performs any processing after the last frame has been read.
 
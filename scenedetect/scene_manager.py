@@ -31,25 +31,42 @@ objects for caching of frame metrics.
 This speeds up subsequent calls to the :py:meth:`SceneManager.detect_scenes` method
 that process the same frames with the same detection algorithm, even if different
 threshold values (or other algorithm options) are used.
+
+Detection can also be split across multiple processes by passing `workers` to
+:py:meth:`SceneManager.detect_scenes`. Each worker decodes one segment of the video and
+computes frame metrics, which are then merged and replayed through the detectors in order
+so that the result is the same as processing the video serially.
 """
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import copy
 import csv
 from string import Template
-from typing import Iterable, List, Tuple, Optional, Dict, Callable, Union, TextIO
+from typing import Any, Iterable, List, Tuple, Optional, Dict, Callable, Union, TextIO
 import threading
 import queue
 import logging
 import math
+import multiprocessing
+import os.path
 import sys
 
 import cv2
 import numpy as np
 
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
 from scenedetect.frame_timecode import FrameTimecode
 from scenedetect.platform import (tqdm, get_and_create_path, get_cv2_imwrite_params)
-from scenedetect.video_stream import VideoStream
+from scenedetect.video_stream import VideoStream, PIXEL_FORMAT_BGR
+from scenedetect.backends import AVAILABLE_BACKENDS
 from scenedetect.stats_manager import StatsManager, FrameMetricRegistered
-from scenedetect.scene_detector import SceneDetector, SparseSceneDetector
+from scenedetect.stats_cache import StatsCache
+from scenedetect.scene_detector import FrameCache, SceneDetector, SparseSceneDetector
+from scenedetect.prefilter import Prefilter
 from scenedetect.thirdparty.simpletable import (SimpleTableCell, SimpleTableImage, SimpleTableRow,
                                                 SimpleTable, HTMLPage)
 
@@ -68,6 +85,24 @@ DEFAULT_MIN_WIDTH: int = 256
 MAX_FRAME_QUEUE_LENGTH: int = 4
 """Maximum size of the queue of frames waiting to be processed after decoding."""
 
+MAX_FRAME_BUFFER_SIZE: int = 128 * 1024 * 1024
+"""Maximum size in bytes of the frames waiting to be processed after decoding. For large frames,
+fewer than `MAX_FRAME_QUEUE_LENGTH` frames are buffered (a minimum of 2 are always used)."""
+
+NUM_BATCH_BUFFERS: int = 3
+"""Number of batches of frames that can be decoded ahead of the one being processed when
+:py:attr:`SceneManager.batch_size` is set. The size of each batch is limited so the total size
+of the batches is at most `MAX_FRAME_BUFFER_SIZE`."""
+
+MIN_FRAMES_PER_WORKER: int = 100
+"""Minimum number of frames each worker process must be assigned when detecting scenes in
+parallel. Shorter inputs are split across fewer workers."""
+
+MIN_SEEK_FRAMES: int = 250
+"""Minimum number of consecutive frames which already have all frame metrics in the StatsManager
+for them to be skipped by seeking instead of reading each frame. Seeking may require decoding
+from the previous keyframe, so this is about the keyframe interval of most videos."""
+
 
 def compute_downscale_factor(frame_width: int, effective_width: int = DEFAULT_MIN_WIDTH) -> int:
     """Get the optimal default downscale factor based on a video's resolution (currently only
@@ -459,11 +494,270 @@ def save_images(scene_list: List[Tuple[FrameTimecode, FrameTimecode]],
     return image_filenames
 
 
+def _detect_segment(path: str, backend: str, framerate: float, open_options: Dict[str, Any],
+                    detectors: List[SceneDetector], downscale_factor: int, start_frame: int,
+                    end_frame: Optional[int],
+                    decode_previous: bool) -> Tuple[Dict[int, Dict[str, float]], int]:
+    """Compute frame metrics for a single segment of a video. Used as the entry point of each
+    worker process when `workers` is set in :py:meth:`SceneManager.detect_scenes`.
+
+    If `decode_previous` is set, the frame before `start_frame` is also decoded (but its metrics
+    are not returned) so that detectors which compare adjacent frames have a previous frame at
+    the segment boundary.
+
+    Arguments:
+        path: Path to the video file.
+        backend: Name of the backend to open the video with (key of `AVAILABLE_BACKENDS`).
+        framerate: Framerate of the video, in frames/sec.
+        open_options: Backend-specific options to open the video with (see
+            :py:attr:`VideoStream.open_options
+            <scenedetect.video_stream.VideoStream.open_options>`).
+        detectors: Detectors to compute frame metrics with. Must not be bound to a StatsManager.
+        downscale_factor: Factor to downscale frames by.
+        start_frame: First frame number (0-based) of the segment.
+        end_frame: Frame number (0-based) the segment ends at, exclusive. If None, the segment
+            ends at the end of the video.
+        decode_previous: Decode the frame before `start_frame` as well. Should be set for every
+            segment except the first.
+
+    Returns:
+        Tuple of the frame metrics computed for the segment (mapping of frame number to
+        metric key/value pairs), and the last frame number that was decoded.
+    """
+    video = AVAILABLE_BACKENDS[backend](path, framerate, **open_options)
+    video.seek(start_frame - 1 if decode_previous else start_frame)
+    scene_manager = SceneManager(StatsManager())
+    scene_manager.auto_downscale = False
+    scene_manager.downscale = downscale_factor
+    for detector in detectors:
+        scene_manager.add_detector(detector)
+    scene_manager.detect_scenes(
+        video=video, end_time=end_frame - 1 if end_frame is not None else None)
+    last_frame = video.frame_number - 1
+
+    metric_keys = []
+    for detector in detectors:
+        metric_keys += [key for key in detector.get_metrics() if not key in metric_keys]
+    frame_metrics = {}
+    for frame_num in range(start_frame, last_frame + 1):
+        values = scene_manager.stats_manager.get_metrics(frame_num, metric_keys)
+        metrics = {key: value for key, value in zip(metric_keys, values) if value is not None}
+        if metrics:
+            frame_metrics[frame_num] = metrics
+    return frame_metrics, last_frame
+
+
+def _decode_frames(path: str, backend: str, framerate: float, open_options: Dict[str, Any],
+                   start_frame: int, frame_skip: int, downscale_factor: int, pixel_format: str,
+                   end_time: Optional[FrameTimecode], required_frames: Optional[np.ndarray],
+                   buffer_name: str, frame_shape: Tuple[int, ...], num_slots: int, conn) -> None:
+    """Decode frames into a shared memory ring buffer. Used as the entry point of the decode
+    process when :py:attr:`SceneManager.decode_process` is set. Frames are decoded the same way
+    as by the decode thread, and the result is sent over `conn` once all frames are decoded.
+
+    Arguments:
+        path: Path to the video file.
+        backend: Name of the backend to open the video with (key of `AVAILABLE_BACKENDS`).
+        framerate: Framerate of the video, in frames/sec.
+        open_options: Backend-specific options to open the video with (see
+            :py:attr:`VideoStream.open_options
+            <scenedetect.video_stream.VideoStream.open_options>`).
+        start_frame: Frame number (0-based) to start decoding from.
+        frame_skip: Number of frames to skip after each frame that is decoded.
+        downscale_factor: Factor to downscale frames by.
+        pixel_format: Pixel format to decode frames to.
+        end_time: Last frame to decode. If None, decodes until the end of the video.
+        required_frames: Which frames must be decoded (see `_get_required_frames`), if known.
+        buffer_name: Name of the shared memory created by the `_SharedFrameBuffer` to use.
+        frame_shape: Shape of each frame in the buffer.
+        num_slots: Number of frames in the buffer.
+        conn: Connection to the main process.
+    """
+    frame_buffer = _SharedFrameBuffer(conn, frame_shape, num_slots, name=buffer_name)
+    scene_manager = SceneManager()
+    frame_number = start_frame
+    try:
+        video = AVAILABLE_BACKENDS[backend](path, framerate, **open_options)
+        if start_frame > 0:
+            video.seek(start_frame)
+        if downscale_factor > 1 and video.set_output_downscale(downscale_factor):
+            downscale_factor = 1
+        video.set_output_format(pixel_format)
+        if frame_skip > 0:
+            video.set_fast_skip(True)
+        scene_manager._base_timecode = video.base_timecode
+        scene_manager._decode_thread(video, frame_skip, downscale_factor, end_time, frame_buffer,
+                                     required_frames)
+        frame_number = video.frame_number
+    # pylint: disable=bare-except
+    except:
+        scene_manager._exception_info = sys.exc_info()
+        frame_buffer.put_end()
+    finally:
+        frame_buffer.close()
+    exception = None
+    if scene_manager._exception_info is not None:
+        exception = scene_manager._exception_info[1]
+    frame_buffer.put_result(frame_number, exception)
+
+
 ##
 ## SceneManager Class Implementation
 ##
 
 
+class _FrameBuffer:
+    """Ring buffer of preallocated frames used to pass frames from the decode thread to the
+    main thread in `SceneManager.detect_scenes`. Slots are allocated once based on the size
+    of the first frame, so the amount of memory used is bounded by `MAX_FRAME_BUFFER_SIZE`.
+
+    Each item is a tuple of (slot, frame, frame_num). `slot` must be passed to `release` once
+    the frame is no longer used. Frames that do not fit in a slot (i.e. if the frame size
+    changes) are passed with a `slot` of None. `frame` is None if the frame was not decoded.
+    """
+
+    def __init__(self,
+                 max_size: int = MAX_FRAME_BUFFER_SIZE,
+                 max_length: int = MAX_FRAME_QUEUE_LENGTH):
+        self._max_size = max_size
+        self._max_length = max(2, max_length)
+        self._frames: Optional[np.ndarray] = None
+        self._free_slots = queue.Queue()
+        self._filled = queue.Queue(self._max_length)
+
+    def _allocate(self, frame: np.ndarray):
+        num_slots = min(self._max_length, max(2, self._max_size // frame.nbytes))
+        self._frames = np.empty((num_slots,) + frame.shape, dtype=frame.dtype)
+        for slot in range(num_slots):
+            self._free_slots.put(slot)
+        logger.debug('Allocated %d frames (%d MB) for decoding.', num_slots,
+                     self._frames.nbytes // (1024 * 1024))
+
+    def put(self, frame: Optional[np.ndarray], frame_num: int):
+        """Copy `frame` into a free slot (blocking until one is available). Called by the
+        decode thread."""
+        if frame is None:
+            self._filled.put((None, None, frame_num))
+            return
+        if self._frames is None:
+            self._allocate(frame)
+        if frame.shape != self._frames.shape[1:] or frame.dtype != self._frames.dtype:
+            self._filled.put((None, frame.copy(), frame_num))
+            return
+        slot = self._free_slots.get()
+        np.copyto(self._frames[slot], frame)
+        self._filled.put((slot, self._frames[slot], frame_num))
+
+    def put_end(self):
+        """Signal that no more frames will be put into the buffer."""
+        self._filled.put((None, None, None))
+
+    def get(self) -> Tuple[Optional[int], Optional[np.ndarray], Optional[int]]:
+        """Get the next (slot, frame, frame_num) tuple. `frame_num` is None once the end is
+        reached. Called by the main thread."""
+        return self._filled.get()
+
+    def release(self, slot: Optional[int]):
+        """Return `slot` to the decode thread so it can be reused."""
+        if slot is not None:
+            self._free_slots.put(slot)
+
+
+class _SharedFrameBuffer:
+    """Ring buffer of frames in shared memory used to pass frames from the decode process to the
+    main process when :py:attr:`SceneManager.decode_process` is set. Has the same interface as
+    `_FrameBuffer`, where `put` and `put_end` are called by the decode process, and `get` and
+    `release` by the main process. Only slot numbers and frame numbers are sent over `conn`, and
+    frames returned by `get` are views into the shared memory.
+
+    Frames which do not match `frame_shape` are sent over `conn` instead.
+    """
+
+    def __init__(self, conn, frame_shape: Tuple[int, ...], num_slots: int, name: str = None):
+        """
+        Arguments:
+            conn: Connection to the other process.
+            frame_shape: Shape of each uint8 frame.
+            num_slots: Number of frames in the buffer.
+            name: Name of the shared memory to attach to. If None, it is created.
+        """
+        self._conn = conn
+        self._owner = name is None
+        nbytes = int(np.prod(frame_shape)) * num_slots
+        self._memory = shared_memory.SharedMemory(name=name, create=self._owner, size=nbytes)
+        self._frames = np.ndarray(
+            (num_slots,) + tuple(frame_shape), dtype=np.uint8, buffer=self._memory.buf)
+        self._free_slots = list(range(num_slots))
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory."""
+        return self._memory.name
+
+    def put(self, frame: Optional[np.ndarray], frame_num: int):
+        """Copy `frame` into a free slot (blocking until one is released)."""
+        if frame is None:
+            self._conn.send((None, None, frame_num))
+            return
+        if frame.shape != self._frames.shape[1:] or frame.dtype != self._frames.dtype:
+            self._conn.send((None, frame, frame_num))
+            return
+        while self._conn.poll() or not self._free_slots:
+            self._free_slots.append(self._conn.recv())
+        slot = self._free_slots.pop(0)
+        np.copyto(self._frames[slot], frame)
+        self._conn.send((slot, None, frame_num))
+
+    def put_end(self):
+        """Signal that no more frames will be put into the buffer."""
+        self._conn.send((None, None, None))
+
+    def get(self) -> Tuple[Optional[int], Optional[np.ndarray], Optional[int]]:
+        """Get the next (slot, frame, frame_num) tuple. `frame_num` is None once the end is
+        reached, or if the decode process exited unexpectedly."""
+        try:
+            slot, frame, frame_num = self._conn.recv()
+        except EOFError:
+            return (None, None, None)
+        if slot is not None:
+            frame = self._frames[slot]
+        return (slot, frame, frame_num)
+
+    def release(self, slot: Optional[int]):
+        """Return `slot` to the decode process so it can be reused."""
+        if slot is not None:
+            try:
+                self._conn.send(slot)
+            except BrokenPipeError:
+                # The decode process exits once every frame is in the buffer.
+                pass
+
+    def put_result(self, frame_number: int, exception: Optional[BaseException]):
+        """Send the frame number the decode process stopped at, and the exception raised while
+        decoding (if any), after the end of the buffer."""
+        try:
+            self._conn.send((frame_number, exception))
+        except Exception:    # pylint: disable=broad-except
+                             # The exception could not be pickled.
+            self._conn.send(
+                (frame_number, RuntimeError('Exception raised in decode process: %s' % exception)))
+
+    def get_result(self) -> Tuple[Optional[int], Optional[BaseException]]:
+        """Get the result sent by `put_result` once the end of the buffer is reached."""
+        try:
+            return self._conn.recv()
+        except EOFError:
+            return (None, RuntimeError('Decode process exited unexpectedly.'))
+
+    def close(self):
+        """Unmap the shared memory, and free it if it was created by this object. Frames
+        returned by `get` must no longer be referenced."""
+        self._frames = None
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+
 class SceneManager:
     """The SceneManager facilitates detection of scenes via the :py:meth:`detect_scenes`
     method, given a video source (:py:class:`VideoStream <scenedetect.video.VideoStream>`),
@@ -475,12 +769,17 @@ class SceneManager:
     def __init__(
         self,
         stats_manager: Optional[StatsManager] = None,
+        stats_cache: Optional[StatsCache] = None,
     ):
         """
         Arguments:
             stats_manager: :py:class:`StatsManager` to bind to this `SceneManager`. Can be
                 accessed via the `stats_manager` property of the resulting object to load
                 from or save to a file on disk.
+            stats_cache: :py:class:`StatsCache <scenedetect.stats_cache.StatsCache>` to load
+                frame metrics of the video from before detecting scenes, and to save new
+                ones to after. If no `stats_manager` is set, a temporary one is used. Not
+                used if `frame_skip` is set, or if only keyframes are decoded.
         """
         self._cutting_list = []
         self._event_list = []
@@ -494,6 +793,15 @@ class SceneManager:
         # to the detect_scenes method. If concatenation is required, it can be implemented as
         # a generic VideoStream wrapper.
         self._stats_manager: Optional[StatsManager] = stats_manager
+        self._stats_cache: Optional[StatsCache] = stats_cache
+        # Representations of the current frame shared by all detectors.
+        self._frame_cache: FrameCache = FrameCache()
+        self._detector_threads: int = 1
+        self._decode_process: bool = False
+        self._batch_size: int = 1
+        self._prefilter: Optional[Prefilter] = None
+        # Runs detectors on each frame in parallel while detecting scenes if detector_threads > 1.
+        self._detector_executor: Optional[ThreadPoolExecutor] = None
 
         # Position of video that was first passed to detect_scenes.
         self._start_pos: FrameTimecode = None
@@ -502,6 +810,9 @@ class SceneManager:
         self._base_timecode: Optional[FrameTimecode] = None
         self._downscale: int = 1
         self._auto_downscale: bool = True
+        # Maximum event_buffer_length of all detectors, i.e. how many frames behind the current
+        # one that metrics may still be set for.
+        self._event_buffer_length: int = 0
         # Boolean indicating if we have only seen EventType.CUT events so far.
         self._only_cuts: bool = True
         # Set by decode thread when an exception occurs.
@@ -512,6 +823,26 @@ class SceneManager:
         """Getter for the StatsManager associated with this SceneManager, if any."""
         return self._stats_manager
 
+    @stats_manager.setter
+    def stats_manager(self, value: Optional[StatsManager]):
+        """Set the StatsManager, which is also used by all detectors added so far."""
+        if value is None and any(detector.stats_manager_required()
+                                 for detector in self._detector_list + self._sparse_detector_list):
+            raise ValueError("A StatsManager is required by the detectors added.")
+        self._stats_manager = value
+        for detector in self._detector_list + self._sparse_detector_list:
+            detector.stats_manager = value
+            if value is not None:
+                try:
+                    value.register_metrics(detector.get_metrics())
+                except FrameMetricRegistered:
+                    pass
+
+    @property
+    def stats_cache(self) -> Optional[StatsCache]:
+        """Getter for the StatsCache associated with this SceneManager, if any."""
+        return self._stats_cache
+
     @property
     def downscale(self) -> int:
         """Factor to downscale each frame by. Will always be >= 1, where 1
@@ -541,6 +872,76 @@ class SceneManager:
     def auto_downscale(self, value: bool):
         self._auto_downscale = value
 
+    @property
+    def detector_threads(self) -> int:
+        """Number of threads to run detectors on each frame in parallel with. If greater than 1,
+        every detector processes a frame at the same time, and all must finish before the next
+        frame is processed. Cuts are the same as when detectors run one after another.
+
+        Only improves performance when multiple detectors are added, as most of the work that
+        detectors do (e.g. converting frames with OpenCV) can run in parallel. Detectors must not
+        share any state other than the StatsManager and FrameCache. Defaults to 1."""
+        return self._detector_threads
+
+    @detector_threads.setter
+    def detector_threads(self, value: int):
+        if value < 1:
+            raise ValueError("Number of detector threads must be at least 1!")
+        self._detector_threads = value
+
+    @property
+    def decode_process(self) -> bool:
+        """If True, frames are decoded in a separate process instead of a background thread, so
+        decoding does not compete with detectors for the GIL. Frames are passed to the main process
+        through shared memory without being copied.
+
+        The decode process opens the video again using the same backend, so the video must be a
+        seekable file (the `VideoStream` passed to :py:meth:`detect_scenes` is seeked to the end
+        position afterwards). Falls back to a thread if these requirements are not met, or if
+        `multiprocessing.shared_memory` is unavailable (requires Python 3.8+). Defaults to False.
+        """
+        return self._decode_process
+
+    @decode_process.setter
+    def decode_process(self, value: bool):
+        self._decode_process = value
+
+    @property
+    def batch_size(self) -> int:
+        """Number of consecutive frames to decode and process at once. If greater than 1, frames
+        are read with :py:meth:`VideoStream.read_batch
+        <scenedetect.video_stream.VideoStream.read_batch>` and passed to each detector with
+        :py:meth:`SceneDetector.process_frames
+        <scenedetect.scene_detector.SceneDetector.process_frames>`, which detectors can implement
+        to calculate frame metrics for the whole batch at once. This reduces the overhead of
+        processing each frame, especially at low resolutions. Detection results are the same.
+
+        Frames are processed one at a time if `frame_skip` or a `callback` is passed to
+        :py:meth:`detect_scenes`, if some frames already have metrics in the StatsManager or are
+        skipped by the :py:attr:`prefilter`, or if :py:attr:`decode_process` is set.
+        Defaults to 1."""
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, value: int):
+        if value < 1:
+            raise ValueError("Batch size must be at least 1!")
+        self._batch_size = value
+
+    @property
+    def prefilter(self) -> Optional[Prefilter]:
+        """If set, only frames near likely scene changes found by demuxing the video are decoded
+        (see :py:mod:`scenedetect.prefilter`), and the rest of the video is skipped by seeking.
+        Frames which are not decoded are passed to detectors as None, so only detectors which
+        compare frames with the ones before them (`ContentDetector` and `AdaptiveDetector`)
+        produce useful results. Much faster, but scene changes which are not near a candidate
+        are missed. Ignored if `frame_skip` is set. Defaults to None."""
+        return self._prefilter
+
+    @prefilter.setter
+    def prefilter(self, value: Optional[Prefilter]):
+        self._prefilter = value
+
     def add_detector(self, detector: SceneDetector) -> None:
         """ Adds/registers a SceneDetector (e.g. ContentDetector, ThresholdDetector) to
         run when detect_scenes is called. The SceneManager owns the detector object,
@@ -556,6 +957,7 @@ class SceneManager:
             self._stats_manager = StatsManager()
 
         detector.stats_manager = self._stats_manager
+        detector.frame_cache = self._frame_cache
         if self._stats_manager is not None:
             # Allow multiple detection algorithms of the same type to be added
             # by suppressing any FrameMetricRegistered exceptions due to attempts
@@ -672,23 +1074,50 @@ class SceneManager:
                        frame_im: np.ndarray,
                        callback: Optional[Callable[[np.ndarray, int], None]] = None) -> None:
         """ Adds any cuts detected with the current frame to the cutting list. """
-        for detector in self._detector_list:
-            cuts = detector.process_frame(frame_num, frame_im)
-            if cuts and callback:
-                callback(frame_im, frame_num)
-            self._cutting_list += cuts
-        for detector in self._sparse_detector_list:
-            events = detector.process_frame(frame_num, frame_im)
+        self._frame_cache.set_frame(frame_num, frame_im)
+        results = self._run_detectors(lambda detector: detector.process_frame(frame_num, frame_im))
+        for events in results:
             if events and callback:
                 callback(frame_im, frame_num)
-            self._event_list += events
+        self._add_detector_results(results)
+        if self._stats_manager is not None:
+            self._stats_manager.stream_frames(frame_num + 1 - self._event_buffer_length)
+
+    def _process_frames(self, start_frame_num: int, frames: np.ndarray) -> None:
+        """ Adds any cuts detected with a batch of frames to the cutting list. """
+        self._add_detector_results(
+            self._run_detectors(lambda detector: detector.process_frames(start_frame_num, frames)))
+        if self._stats_manager is not None:
+            self._stats_manager.stream_frames(start_frame_num + len(frames) -
+                                              self._event_buffer_length)
+
+    def _run_detectors(self, process: Callable[[SceneDetector], list]) -> List[list]:
+        """Call `process` with each detector, in parallel if `detector_threads` is set.
+
+        Returns:
+            Result for each detector, in the same order as the detectors were added. Cuts and
+            callbacks are the same as when running each detector in turn.
+        """
+        detectors = self._detector_list + self._sparse_detector_list
+        if self._detector_executor is not None:
+            return list(self._detector_executor.map(process, detectors))
+        return [process(detector) for detector in detectors]
+
+    def _add_detector_results(self, results: List[list]) -> None:
+        """Add the cuts and events returned by each detector (see `_run_detectors`)."""
+        num_dense = len(self._detector_list)
+        for i, events in enumerate(results):
+            if i < num_dense:
+                self._cutting_list += events
+            else:
+                self._event_list += events
 
     def _is_processing_required(self, frame_num: int) -> bool:
         """ Is Processing Required: Returns True if frame metrics not in StatsManager,
         False otherwise. """
         if self.stats_manager is None:
             return True
-        return all([detector.is_processing_required(frame_num) for detector in self._detector_list])
+        return any([detector.is_processing_required(frame_num) for detector in self._detector_list])
 
     def _post_process(self, frame_num: int) -> None:
         """ Adds any remaining cuts to the cutting list after processing the last frame. """
@@ -702,7 +1131,9 @@ class SceneManager:
                       frame_skip: int = 0,
                       show_progress: bool = False,
                       callback: Optional[Callable[[np.ndarray, int], None]] = None,
-                      frame_source: Optional[VideoStream] = None) -> int:
+                      frame_source: Optional[VideoStream] = None,
+                      workers: int = 1,
+                      stats_only: bool = False) -> int:
         """ Perform scene detection on the given video using the added SceneDetectors.
 
         Blocks until all frames in the video have been processed. Results can
@@ -722,16 +1153,37 @@ class SceneManager:
                 where N is frame_skip, processing only 1/N+1 percent of the video,
                 speeding up the detection time at the expense of accuracy).
                 `frame_skip` **must** be 0 (the default) when using a StatsManager.
+                If the backend supports it (see `VideoStream.set_fast_skip`), skipped frames
+                are not decoded, in which case slightly more than N frames may be skipped.
             show_progress: If True, and the ``tqdm`` module is available, displays
                 a progress bar with the progress, framerate, and expected time to
                 complete processing the video frame source.
-            callback: If set, called after each scene/event detected.
+            callback: If set, called after each scene/event detected. The frame passed to the
+                callback is only valid until the callback returns, and must be copied if it is
+                used afterwards.
             frame_source: [DEPRECATED] DO NOT USE. For compatibility with previous version.
+            workers: Number of processes to split detection across. If greater than 1, the
+                video is split into segments which are decoded in parallel, and the resulting
+                frame metrics are processed in order to produce the same result as a single
+                process. Each worker opens the video with the same backend and options (see
+                :py:attr:`VideoStream.open_options
+                <scenedetect.video_stream.VideoStream.open_options>`). Requires a seekable video
+                file with a known duration, and all detectors must provide frame metrics. Cannot
+                be combined with `frame_skip` or `callback`. Falls back to a single process if
+                these requirements are not met.
+            stats_only: If True, scenes are detected only from the frame metrics in the
+                StatsManager (or StatsCache) without decoding any frames, which is much faster
+                when re-running detection with different settings. Only the metadata of `video`
+                (e.g. framerate, position) is used. Every frame must have the metrics required
+                by each detector (see :py:meth:`SceneDetector.get_input_metrics`). If
+                `end_time`/`duration` are not set, processing ends at the last frame with metrics.
+                Cannot be combined with `frame_skip` or `callback`.
         Returns:
             int: Number of frames read and processed from the frame source.
         Raises:
             ValueError: `frame_skip` **must** be 0 (the default) if the SceneManager
-                was constructed with a StatsManager object.
+                was constructed with a StatsManager object. Also raised if `stats_only` is set
+                and the required frame metrics are not available.
         """
         # Compatibility for v0.5 API.
         # TODO: Remove default value for `video`` when removing `frame_source`.
@@ -748,12 +1200,18 @@ class SceneManager:
             raise ValueError('duration must be greater than or equal to 0!')
         if end_time is not None and end_time < 0:
             raise ValueError('end_time must be greater than or equal to 0!')
+        if stats_only and frame_skip > 0:
+            raise ValueError('frame_skip must be 0 when stats_only is set!')
+        if stats_only and callback is not None:
+            raise ValueError('callback cannot be set when stats_only is set!')
 
         self._base_timecode = video.base_timecode
         # TODO(v1.0): Fix this properly by making SceneManager create and own a StatsManager,
         # and requiring the framerate to be passed to the StatsManager the constructor.
         if self._stats_manager is not None:
             self._stats_manager._base_timecode = self._base_timecode
+        self._event_buffer_length = max(
+            [detector.event_buffer_length for detector in self._detector_list], default=0)
         start_frame_num: int = video.frame_number
 
         if duration is not None:
@@ -762,6 +1220,31 @@ class SceneManager:
         if end_time is not None:
             end_time = self._base_timecode + end_time
 
+        if self._stats_cache is not None and self._can_use_stats_cache(video, frame_skip):
+            return self._detect_scenes_cached(video, start_frame_num, end_time, show_progress,
+                                              callback, workers, stats_only)
+        return self._detect_scenes(video, start_frame_num, end_time, frame_skip, show_progress,
+                                   callback, workers, stats_only)
+
+    def _detect_scenes(self, video: VideoStream, start_frame_num: int,
+                       end_time: Optional[FrameTimecode], frame_skip: int, show_progress: bool,
+                       callback: Optional[Callable[[np.ndarray, int],
+                                                   None]], workers: int, stats_only: bool) -> int:
+        """Perform scene detection on `video` from `start_frame_num` until `end_time`, after the
+        arguments of :py:meth:`detect_scenes` have been validated.
+
+        Returns:
+            int: Number of frames read and processed from the frame source.
+        """
+        if stats_only:
+            return self._detect_scenes_from_stats(video, start_frame_num, end_time)
+
+        if workers > 1:
+            if self._can_detect_in_parallel(video, frame_skip, callback):
+                return self._detect_scenes_parallel(video, start_frame_num, end_time, workers,
+                                                    show_progress)
+            logger.warning('Unable to split detection across multiple processes, using one.')
+
         # Can only calculate total number of frames we expect to process if the duration of
         # the video is available.
         total_frames = 0
@@ -772,39 +1255,394 @@ class SceneManager:
                 total_frames = (video.duration.get_frames() - start_frame_num)
 
         # Calculate the desired downscale factor and log the effective resolution.
-        if self.auto_downscale:
-            downscale_factor = compute_downscale_factor(frame_width=video.frame_size[0])
-        else:
-            downscale_factor = self.downscale
+        downscale_factor = self._get_downscale_factor(video)
         if downscale_factor > 1:
             logger.info('Downscale factor set to %d, effective resolution: %d x %d',
                         downscale_factor, video.frame_size[0] // downscale_factor,
                         video.frame_size[1] // downscale_factor)
 
+        required_frames = None
+        if frame_skip == 0:
+            required_frames = self._get_required_frames(video, start_frame_num, end_time)
+
+        pixel_format = self._negotiate_pixel_format(video, callback)
+
+        if self._batch_size > 1:
+            if self._can_detect_in_batches(frame_skip, callback, required_frames):
+                return self._detect_scenes_batched(video, start_frame_num, end_time, total_frames,
+                                                   downscale_factor, pixel_format, show_progress)
+            logger.warning('Unable to process frames in batches, processing one at a time.')
+
+        decode_thread = None
+        if self._decode_process and self._can_decode_in_process(video):
+            frame_buffer, decode_process = self._start_decode_process(video, start_frame_num,
+                                                                      frame_skip, downscale_factor,
+                                                                      pixel_format, end_time,
+                                                                      required_frames)
+        else:
+            if self._decode_process:
+                logger.warning('Unable to decode frames in a separate process, using a thread.')
+            decode_process = None
+            # Let the backend downscale frames as part of decoding if it supports doing so.
+            if downscale_factor > 1 and video.set_output_downscale(downscale_factor):
+                downscale_factor = 1
+            # Avoid decoding frames we are going to skip if the backend supports it.
+            if frame_skip > 0 and video.set_fast_skip(True):
+                logger.debug('Skipping frames without decoding them.')
+            frame_buffer = _FrameBuffer()
+            decode_thread = threading.Thread(
+                target=SceneManager._decode_thread,
+                args=(self, video, frame_skip, downscale_factor, end_time, frame_buffer,
+                      required_frames),
+                daemon=True)
+            decode_thread.start()
+
         progress_bar = None
         if tqdm and show_progress:
             progress_bar = tqdm(total=int(total_frames), unit='frames', dynamic_ncols=True)
 
-        frame_queue = queue.Queue(MAX_FRAME_QUEUE_LENGTH)
+        num_detectors = len(self._detector_list) + len(self._sparse_detector_list)
+        if self._detector_threads > 1 and num_detectors > 1:
+            self._detector_executor = ThreadPoolExecutor(max_workers=self._detector_threads)
+
+        frame_im = None
+        # Slot of `frame_im`, which is kept until a new frame is decoded, since the previous
+        # frame may be passed to detectors for frames that were not decoded.
+        frame_slot = None
+        last_frame_num = start_frame_num - 1
+        try:
+            while True:
+                slot, next_frame, frame_num = frame_buffer.get()
+                if frame_num is None:
+                    break
+                # Frames which were not decoded because they are not required (see
+                # `_get_required_frames`) are passed as None, so detectors do not compare the next
+                # decoded frame with one from before the frames that were skipped. Otherwise the
+                # previous frame is passed again (e.g. when using frame_skip).
+                if next_frame is not None or required_frames is not None:
+                    frame_buffer.release(frame_slot)
+                    frame_im, frame_slot = next_frame, slot
+                self._process_frame(frame_num, frame_im, callback)
+                if progress_bar is not None:
+                    # Frames may have been skipped, so update based on the position.
+                    progress_bar.update(frame_num - last_frame_num)
+                last_frame_num = frame_num
+            if progress_bar is not None:
+                progress_bar.close()
+            if decode_thread is not None:
+                decode_thread.join()
+            else:
+                self._finish_decode_process(video, start_frame_num, frame_buffer)
+        finally:
+            # Restore full size BGR frames for subsequent reads (e.g. when saving images).
+            video.set_output_downscale(1)
+            video.set_output_format(PIXEL_FORMAT_BGR)
+            video.set_fast_skip(False)
+            if self._detector_executor is not None:
+                self._detector_executor.shutdown()
+                self._detector_executor = None
+            if decode_process is not None:
+                # Frames in shared memory must not be referenced once it is closed.
+                frame_im = next_frame = None
+                self._frame_cache.clear()
+                if decode_process.is_alive():
+                    decode_process.terminate()
+                decode_process.join()
+                frame_buffer.close()
+
+        if self._exception_info is not None:
+            raise self._exception_info[1].with_traceback(self._exception_info[2])
+
+        self._last_pos = video.base_timecode + video.frame_number
+        self._post_process(video.position.frame_num)
+        return video.frame_number - start_frame_num
+
+    def _can_use_stats_cache(self, video: VideoStream, frame_skip: int) -> bool:
+        """Check if frame metrics of `video` can be loaded from/saved to the StatsCache."""
+        reason = None
+        if frame_skip > 0:
+            reason = 'frame_skip is set'
+        elif getattr(video, 'keyframes_only', False):
+            reason = 'only keyframes are being decoded'
+        elif not (isinstance(video.path, str) and os.path.isfile(video.path)):
+            reason = 'input must be a video file'
+        if reason is not None:
+            logger.debug('Cannot use stats cache: %s.', reason)
+            return False
+        return True
+
+    def _detect_scenes_cached(self, video: VideoStream, start_frame_num: int,
+                              end_time: Optional[FrameTimecode], show_progress: bool,
+                              callback: Optional[Callable[[np.ndarray, int], None]], workers: int,
+                              stats_only: bool) -> int:
+        """Perform scene detection, loading the frame metrics of `video` from the StatsCache
+        before, and saving any new ones to it after. A temporary StatsManager is used if none
+        was provided.
+
+        Returns:
+            int: Number of frames processed.
+        """
+        detectors = self._detector_list + self._sparse_detector_list
+        metric_keys = set(
+            metric_key for detector in detectors for metric_key in detector.get_metrics())
+        stats_manager = self._stats_manager
+        temporary_stats_manager = stats_manager is None
+        if temporary_stats_manager:
+            stats_manager = StatsManager(self._base_timecode)
+            stats_manager.register_metrics(metric_keys)
+            self._stats_manager = stats_manager
+            for detector in detectors:
+                detector.stats_manager = stats_manager
+        cache_path = self._stats_cache.get_path(video, self._get_downscale_factor(video))
+        try:
+            if self._stats_cache.load(cache_path, stats_manager, metric_keys):
+                logger.info('Loaded cached frame metrics.')
+            num_frames = self._detect_scenes(video, start_frame_num, end_time, 0, show_progress,
+                                             callback, workers, stats_only)
+            self._stats_cache.save(cache_path, stats_manager, metric_keys)
+        finally:
+            if temporary_stats_manager:
+                self._stats_manager = None
+                for detector in detectors:
+                    detector.stats_manager = None
+        return num_frames
+
+    def _detect_scenes_from_stats(self, video: VideoStream, start_frame_num: int,
+                                  end_time: Optional[FrameTimecode]) -> int:
+        """Perform scene detection by passing the frame metrics in the StatsManager through each
+        detector in order, without decoding any frames.
+
+        Returns:
+            int: Number of frames processed.
+
+        Raises:
+            ValueError: There is no StatsManager, or it does not have the metrics required by
+                every detector for each frame.
+        """
+        if self._stats_manager is None:
+            raise ValueError('A StatsManager or StatsCache is required when stats_only is set!')
+        input_metrics = []
+        for detector in self._detector_list + self._sparse_detector_list:
+            if not detector.get_input_metrics():
+                raise ValueError('All detectors must provide frame metrics when stats_only is set!')
+            input_metrics += detector.get_input_metrics()
+
+        if end_time is not None:
+            end_frame_num = end_time.frame_num + 1
+            if video.duration is not None:
+                end_frame_num = min(end_frame_num, video.duration.frame_num)
+        else:
+            end_frame_num = self._stats_manager.get_frame_range()[1]
+        # The first frame is not checked, since detectors which compare each frame with the
+        # previous one don't have any metrics for it.
+        exists = self._stats_manager.metrics_exist_range(input_metrics, start_frame_num + 1,
+                                                         end_frame_num)
+        if end_time is None and exists.any():
+            end_frame_num = start_frame_num + 2 + int(np.flatnonzero(exists)[-1])
+            exists = exists[:end_frame_num - start_frame_num - 1]
+        if end_frame_num <= start_frame_num + 1 or not exists.any():
+            raise ValueError('No frame metrics to detect scenes from!')
+        if not exists.all():
+            missing = np.flatnonzero(~exists)
+            raise ValueError(
+                'Frame metrics are missing for %d frames (starting from frame %d)! Detect scenes'
+                ' without stats_only to calculate them.' %
+                (len(missing), start_frame_num + 1 + int(missing[0])))
+        if end_time is None and video.duration is not None and (end_frame_num <
+                                                                video.duration.frame_num - 1):
+            logger.warning('Frame metrics end at frame %d, before the end of the video (%d).',
+                           end_frame_num, video.duration.frame_num)
+
+        logger.info('Detecting scenes from frame metrics of %d frames.',
+                    end_frame_num - start_frame_num)
+        self._start_pos = self._base_timecode + start_frame_num
+        for frame_num in range(start_frame_num, end_frame_num):
+            self._process_frame(frame_num, None)
+        self._last_pos = self._base_timecode + end_frame_num
+        self._post_process(end_frame_num - 1)
+        return end_frame_num - start_frame_num
+
+    def _get_required_frames(self, video: VideoStream, start_frame_num: int,
+                             end_time: Optional[FrameTimecode]) -> Optional[np.ndarray]:
+        """Find which frames of `video` must be decoded because they are missing frame metrics in
+        the StatsManager, and are near a candidate found by the `prefilter` if it is set. The
+        frame before each one missing metrics is also included, so that detectors which compare
+        frames with the previous one have it. The last frame is always included, so the video
+        ends at the same position as if every frame was decoded.
+
+        Returns:
+            Array of booleans for each frame from `start_frame_num` to `end_time` (or the end of
+            the video), which are True for frames that must be decoded, or None if this cannot be
+            determined (e.g. there is no StatsManager or prefilter, or a detector does not use
+            frame metrics and there is no prefilter).
+        """
+        if end_time is not None:
+            end_frame_num = end_time.frame_num + 1
+        elif video.duration is not None:
+            end_frame_num = video.duration.frame_num
+        else:
+            return None
+        if end_frame_num <= start_frame_num:
+            return None
+        required = self._get_frames_missing_metrics(start_frame_num, end_frame_num)
+        if self._prefilter is not None:
+            candidate_frames = self._prefilter.get_required_frames(video, start_frame_num,
+                                                                   end_frame_num)
+            if candidate_frames is not None:
+                required = candidate_frames if required is None else required & candidate_frames
+        if required is not None:
+            required[-1] = True
+        return required
+
+    def _get_frames_missing_metrics(self, start_frame_num: int,
+                                    end_frame_num: int) -> Optional[np.ndarray]:
+        """Find which frames from `start_frame_num` to `end_frame_num` (exclusive) are missing
+        metrics required by any detector, or are the frame before one that is. Returns None if
+        there is no StatsManager, or a detector does not use frame metrics."""
+        if self._stats_manager is None:
+            return None
+        input_metrics = []
+        for detector in self._detector_list + self._sparse_detector_list:
+            if not detector.get_input_metrics():
+                return None
+            input_metrics += detector.get_input_metrics()
+        missing = ~self._stats_manager.metrics_exist_range(input_metrics, start_frame_num,
+                                                           end_frame_num + 1)
+        return missing[:-1] | missing[1:]
+
+    def _get_downscale_factor(self, video: VideoStream) -> int:
+        """Get the factor to downscale frames of `video` by during detection."""
+        if self.auto_downscale:
+            return compute_downscale_factor(frame_width=video.frame_size[0])
+        return self.downscale
+
+    def _can_detect_in_parallel(self, video: VideoStream, frame_skip: int,
+                                callback: Optional[Callable[[np.ndarray, int], None]]) -> bool:
+        """Check if detection on `video` can be split across multiple worker processes."""
+        reason = None
+        if frame_skip > 0:
+            reason = 'frame_skip is set'
+        elif callback is not None:
+            reason = 'a callback is set'
+        elif getattr(video, 'keyframes_only', False):
+            reason = 'only keyframes are being decoded'
+        elif self._sparse_detector_list:
+            reason = 'sparse detectors are not supported'
+        elif self._prefilter is not None:
+            reason = 'a prefilter is set'
+        elif not all(detector.get_metrics() for detector in self._detector_list):
+            reason = 'all detectors must provide frame metrics'
+        elif not video.BACKEND_NAME in AVAILABLE_BACKENDS:
+            reason = 'backend %s is not supported' % video.BACKEND_NAME
+        elif not (isinstance(video.path, str) and os.path.isfile(video.path)):
+            reason = 'input must be a video file'
+        elif not video.is_seekable or video.duration is None:
+            reason = 'input must be seekable and have a known duration'
+        if reason is not None:
+            logger.debug('Cannot detect scenes in parallel: %s.', reason)
+            return False
+        return True
+
+    def _negotiate_pixel_format(self, video: VideoStream,
+                                callback: Optional[Callable[[np.ndarray, int], None]]) -> str:
+        """Ask `video` to return frames in the pixel format every detector prefers (see
+        :py:meth:`SceneDetector.input_format`), if they all prefer the same one. Frames are kept
+        in BGR if a `callback` is set, since it is passed the same frames as the detectors.
+
+        Returns:
+            Pixel format of frames returned by `video`.
+        """
+        pixel_formats = set(detector.input_format()
+                            for detector in self._detector_list + self._sparse_detector_list)
+        if callback is None and len(pixel_formats) == 1:
+            pixel_format = pixel_formats.pop()
+            if pixel_format != PIXEL_FORMAT_BGR and video.set_output_format(pixel_format):
+                logger.debug('Decoding frames in %s format.', pixel_format)
+                return pixel_format
+        return PIXEL_FORMAT_BGR
+
+    @staticmethod
+    def _get_frame_shape(video: VideoStream, downscale_factor: int,
+                         pixel_format: str) -> Tuple[int, ...]:
+        """Shape of frames passed to detectors. Frames are downscaled to ceil(width / factor) x
+        ceil(height / factor) pixels whether or not the backend does so while decoding."""
+        frame_shape = (math.ceil(video.frame_size[1] / downscale_factor),
+                       math.ceil(video.frame_size[0] / downscale_factor))
+        return frame_shape + (3,) if pixel_format == PIXEL_FORMAT_BGR else frame_shape
+
+    def _can_detect_in_batches(self, frame_skip: int, callback: Optional[Callable[[np.ndarray, int],
+                                                                                  None]],
+                               required_frames: Optional[np.ndarray]) -> bool:
+        """Check if frames can be decoded and processed in batches."""
+        reason = None
+        if frame_skip > 0:
+            reason = 'frame_skip is set'
+        elif callback is not None:
+            reason = 'a callback is set'
+        elif required_frames is not None and not required_frames.all():
+            reason = 'some frames do not need to be decoded'
+        elif self._decode_process:
+            reason = 'decode_process is set'
+        if reason is not None:
+            logger.debug('Cannot process frames in batches: %s.', reason)
+            return False
+        return True
+
+    def _detect_scenes_batched(self, video: VideoStream, start_frame_num: int,
+                               end_time: Optional[FrameTimecode], total_frames: int,
+                               downscale_factor: int, pixel_format: str,
+                               show_progress: bool) -> int:
+        """Perform scene detection by decoding batches of up to `batch_size` frames in a
+        background thread, and passing each batch to every detector at once.
+
+        Returns:
+            int: Number of frames read and processed from the frame source.
+        """
+        # Let the backend downscale frames as part of decoding if it supports doing so.
+        if downscale_factor > 1 and video.set_output_downscale(downscale_factor):
+            downscale_factor = 1
+        frame_size = int(np.prod(self._get_frame_shape(video, downscale_factor, pixel_format)))
+        batch_size = max(
+            1, min(self._batch_size, MAX_FRAME_BUFFER_SIZE // (NUM_BATCH_BUFFERS * frame_size)))
+        logger.debug('Processing frames in batches of %d.', batch_size)
+
+        progress_bar = None
+        if tqdm and show_progress:
+            progress_bar = tqdm(total=int(total_frames), unit='frames', dynamic_ncols=True)
+
+        num_detectors = len(self._detector_list) + len(self._sparse_detector_list)
+        if self._detector_threads > 1 and num_detectors > 1:
+            self._detector_executor = ThreadPoolExecutor(max_workers=self._detector_threads)
+
+        # Batches are passed to the main thread through `filled`, and returned through `free`
+        # once they are processed so their buffers are reused.
+        filled = queue.Queue()
+        free = queue.Queue()
         decode_thread = threading.Thread(
-            target=SceneManager._decode_thread,
-            args=(self, video, frame_skip, downscale_factor, end_time, frame_queue),
+            target=SceneManager._decode_batches,
+            args=(self, video, batch_size, downscale_factor, end_time, filled, free),
             daemon=True)
         decode_thread.start()
-        frame_im = None
-        while True:
-            next_frame, position = frame_queue.get()
-            if next_frame is None and position is None:
-                break
-            if not next_frame is None:
-                frame_im = next_frame
-            self._process_frame(position.frame_num, frame_im, callback)
+        try:
+            while True:
+                batch = filled.get()
+                if batch is None:
+                    break
+                buffer, batch_start_frame_num, frames = batch
+                self._process_frames(batch_start_frame_num, frames)
+                free.put(buffer)
+                if progress_bar is not None:
+                    progress_bar.update(len(frames))
             if progress_bar is not None:
-                progress_bar.update(1 + frame_skip)
-
-        if progress_bar is not None:
-            progress_bar.close()
-        decode_thread.join()
+                progress_bar.close()
+            decode_thread.join()
+        finally:
+            # Restore full size BGR frames for subsequent reads (e.g. when saving images).
+            video.set_output_downscale(1)
+            video.set_output_format(PIXEL_FORMAT_BGR)
+            if self._detector_executor is not None:
+                self._detector_executor.shutdown()
+                self._detector_executor = None
 
         if self._exception_info is not None:
             raise self._exception_info[1].with_traceback(self._exception_info[2])
@@ -813,22 +1651,256 @@ class SceneManager:
         self._post_process(video.position.frame_num)
         return video.frame_number - start_frame_num
 
-    def _decode_thread(self, video, frame_skip, downscale_factor, end_time, out_queue):
+    def _decode_batches(self, video: VideoStream, batch_size: int, downscale_factor: int,
+                        end_time: Optional[FrameTimecode], filled: queue.Queue, free: queue.Queue):
+        """Decode batches of frames from `video` until `end_time`, putting a tuple of (buffer,
+        start_frame_num, frames) into `filled` for each batch, where `frames` is a view of
+        `buffer`. Buffers are reused once they are put into `free`. None is put into `filled`
+        once all frames are decoded."""
+        end_frame = end_time.frame_num if end_time is not None else None
+        num_buffers = 0
+        # Frames are decoded into `decoded` first if they must be downscaled after decoding.
+        decoded = None
+        try:
+            while end_frame is None or video.frame_number <= end_frame:
+                num_frames = batch_size
+                if end_frame is not None:
+                    num_frames = min(num_frames, end_frame + 1 - video.frame_number)
+                start_frame_num = video.frame_number
+                buffer = None
+                if num_buffers == NUM_BATCH_BUFFERS:
+                    buffer = free.get()
+                if downscale_factor > 1:
+                    frames = video.read_batch(num_frames, decoded)
+                    if frames is False:
+                        break
+                    decoded = frames if decoded is None else decoded
+                    frames = frames[:, ::downscale_factor, ::downscale_factor]
+                    if buffer is None:
+                        buffer = np.empty((batch_size,) + frames.shape[1:], dtype=frames.dtype)
+                    np.copyto(buffer[:len(frames)], frames)
+                    frames = buffer[:len(frames)]
+                else:
+                    frames = video.read_batch(num_frames, buffer)
+                    if frames is False:
+                        break
+                    buffer = frames if buffer is None else buffer
+                if num_buffers < NUM_BATCH_BUFFERS:
+                    num_buffers += 1
+                if self._start_pos is None:
+                    self._start_pos = self._base_timecode + start_frame_num
+                filled.put((buffer, start_frame_num, frames))
+
+        # If *any* exceptions occur, we re-raise them in the main thread so that the caller of
+        # detect_scenes can handle it.
+
+        # pylint: disable=bare-except
+        except:
+            logger.critical('Fatal error: Exception raised in decode thread.')
+            self._exception_info = sys.exc_info()
+
+        finally:
+            # Handle case where start position was never set if we did not decode any frames.
+            if self._start_pos is None:
+                self._start_pos = video.position
+            # Make sure main thread stops processing loop.
+            filled.put(None)
+
+    def _can_decode_in_process(self, video: VideoStream) -> bool:
+        """Check if frames of `video` can be decoded in a separate process."""
+        reason = None
+        if shared_memory is None:
+            reason = 'multiprocessing.shared_memory is unavailable'
+        elif getattr(video, 'keyframes_only', False):
+            reason = 'only keyframes are being decoded'
+        elif not video.BACKEND_NAME in AVAILABLE_BACKENDS:
+            reason = 'backend %s is not supported' % video.BACKEND_NAME
+        elif not (isinstance(video.path, str) and os.path.isfile(video.path)):
+            reason = 'input must be a video file'
+        elif not video.is_seekable:
+            reason = 'input must be seekable'
+        if reason is not None:
+            logger.debug('Cannot decode frames in a separate process: %s.', reason)
+            return False
+        return True
+
+    def _start_decode_process(
+        self, video: VideoStream, start_frame_num: int, frame_skip: int, downscale_factor: int,
+        pixel_format: str, end_time: Optional[FrameTimecode], required_frames: Optional[np.ndarray]
+    ) -> Tuple[_SharedFrameBuffer, multiprocessing.Process]:
+        """Start a process which decodes frames of `video` into a `_SharedFrameBuffer`."""
+        frame_shape = self._get_frame_shape(video, downscale_factor, pixel_format)
+        num_slots = min(MAX_FRAME_QUEUE_LENGTH,
+                        max(2, MAX_FRAME_BUFFER_SIZE // int(np.prod(frame_shape))))
+        conn, process_conn = multiprocessing.Pipe()
+        frame_buffer = _SharedFrameBuffer(conn, frame_shape, num_slots)
+        decode_process = multiprocessing.Process(
+            target=_decode_frames,
+            args=(video.path, video.BACKEND_NAME, video.frame_rate, video.open_options,
+                  start_frame_num, frame_skip, downscale_factor, pixel_format, end_time,
+                  required_frames, frame_buffer.name, frame_shape, num_slots, process_conn),
+            daemon=True)
+        try:
+            decode_process.start()
+        except:
+            frame_buffer.close()
+            raise
+        finally:
+            process_conn.close()
+        logger.debug('Decoding frames in a separate process (%d frames buffered).', num_slots)
+        return frame_buffer, decode_process
+
+    def _finish_decode_process(self, video: VideoStream, start_frame_num: int,
+                               frame_buffer: _SharedFrameBuffer) -> None:
+        """Get the result of the decode process once all frames were processed, and leave `video`
+        at the same position as if it decoded the frames itself."""
+        frame_number, exception = frame_buffer.get_result()
+        if exception is not None:
+            self._exception_info = (type(exception), exception, exception.__traceback__)
+        if self._start_pos is None:
+            self._start_pos = self._base_timecode + start_frame_num
+        if frame_number is not None and frame_number > start_frame_num:
+            video.seek(frame_number - 1)
+            video.read(decode=False)
+
+    def _detect_scenes_parallel(self, video: VideoStream, start_frame_num: int,
+                                end_time: Optional[FrameTimecode], workers: int,
+                                show_progress: bool) -> int:
+        """Perform scene detection by splitting `video` into segments which are processed by
+        `workers` processes. The frame metrics of each segment are merged into the StatsManager
+        (a temporary one is used if none was provided), and then passed through each detector
+        in order, so the results are the same as if the video was processed in one pass.
+
+        Returns:
+            int: Number of frames processed.
+        """
+        end_frame_num = video.duration.frame_num
+        if end_time is not None and end_time < video.duration:
+            end_frame_num = end_time.frame_num + 1
+        num_frames = max(0, end_frame_num - start_frame_num)
+        workers = max(1, min(workers, num_frames // MIN_FRAMES_PER_WORKER))
+        segment_length = math.ceil(num_frames / workers)
+        segments = []
+        for i in range(workers):
+            segment_start = start_frame_num + i * segment_length
+            segment_end = min(segment_start + segment_length, end_frame_num)
+            # Let the last segment run to the end of the video in case the duration is inexact.
+            if i == workers - 1 and end_time is None:
+                segment_end = None
+            segments.append((segment_start, segment_end))
+
+        downscale_factor = self._get_downscale_factor(video)
+        # Detectors are sent to the workers as copies without a StatsManager or FrameCache, each
+        # worker process creates its own.
+        detectors = []
+        for detector in self._detector_list:
+            detector = copy.copy(detector)
+            detector.stats_manager = None
+            detector.frame_cache = None
+            detectors.append(detector)
+
+        logger.info('Detecting scenes using %d processes.', workers)
+        progress_bar = None
+        if tqdm and show_progress:
+            progress_bar = tqdm(total=int(num_frames), unit='frames', dynamic_ncols=True)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_detect_segment, video.path, video.BACKEND_NAME, video.frame_rate,
+                                video.open_options, detectors, downscale_factor, segment_start,
+                                segment_end, segment_start > start_frame_num)
+                for (segment_start, segment_end) in segments
+            ]
+            if progress_bar is not None:
+                segment_lengths = {
+                    future:
+                    (segment_end if segment_end is not None else end_frame_num) - segment_start
+                    for future, (segment_start, segment_end) in zip(futures, segments)
+                }
+                for future in as_completed(futures):
+                    progress_bar.update(segment_lengths[future])
+                progress_bar.close()
+            results = [future.result() for future in futures]
+
+        stats_manager = self._stats_manager
+        if stats_manager is None:
+            stats_manager = StatsManager()
+            for detector in self._detector_list:
+                detector.stats_manager = stats_manager
+        for detector in self._detector_list:
+            try:
+                stats_manager.register_metrics(detector.get_metrics())
+            except FrameMetricRegistered:
+                pass
+        stats_manager._base_timecode = self._base_timecode
+
+        last_frame_num = start_frame_num - 1
+        for (frame_metrics, segment_last_frame), (_, segment_end) in zip(results, segments):
+            for frame_num, metrics in frame_metrics.items():
+                stats_manager.set_metrics(frame_num, metrics)
+            last_frame_num = max(last_frame_num, segment_last_frame)
+            # Stop if the video ended before this segment did.
+            if segment_end is not None and segment_last_frame < (segment_end - 1):
+                break
 
+        try:
+            self._start_pos = self._base_timecode + start_frame_num
+            for frame_num in range(start_frame_num, last_frame_num + 1):
+                self._process_frame(frame_num, None)
+            self._last_pos = self._base_timecode + (last_frame_num + 1)
+            self._post_process(last_frame_num)
+        finally:
+            if self._stats_manager is None:
+                for detector in self._detector_list:
+                    detector.stats_manager = None
+
+        # Leave the video at the same position as if all frames were decoded.
+        if last_frame_num >= start_frame_num:
+            video.seek(last_frame_num)
+            video.read(decode=False)
+        return last_frame_num + 1 - start_frame_num
+
+    def _decode_thread(self, video, frame_skip, downscale_factor, end_time, frame_buffer,
+                       required_frames):
+
+        end_frame = end_time.frame_num if end_time is not None else None
+        start_frame_num = video.frame_number
+        # Frame numbers of frames which must be decoded, used to find how many frames can be
+        # skipped by seeking.
+        required_frame_nums = None
+        if required_frames is not None:
+            required_frame_nums = np.flatnonzero(required_frames) + start_frame_num
         try:
             while True:
                 frame_im = None
+                frame_num = video.frame_number
+                if required_frame_nums is not None and video.is_seekable:
+                    # Seek past long runs of frames which don't need to be decoded. Detectors
+                    # still process each of them using the metrics in the StatsManager.
+                    i = np.searchsorted(required_frame_nums, frame_num)
+                    if i < len(required_frame_nums) and (required_frame_nums[i] - frame_num >=
+                                                         MIN_SEEK_FRAMES):
+                        if self._start_pos is None:
+                            self._start_pos = self._base_timecode + frame_num
+                        for skipped_frame_num in range(frame_num, int(required_frame_nums[i])):
+                            frame_buffer.put(None, skipped_frame_num)
+                        video.seek(int(required_frame_nums[i]))
+                        continue
                 # We don't do any kind of locking here since the worst-case of this being wrong
                 # is that we do some extra work, and this function should never mutate any data
                 # (all of which should be modified under the GIL).
                 # TODO(v1.0): This optimization should be removed as it is rarely used and
                 # simplifies the implementation of detection algorithms.
-                if (self._is_processing_required(video.position.frame_num)):
+                if required_frames is not None and 0 <= frame_num - start_frame_num < len(
+                        required_frames):
+                    processing_required = required_frames[frame_num - start_frame_num]
+                else:
+                    processing_required = self._is_processing_required(frame_num)
+                if processing_required:
                     frame_im = video.read()
                     if frame_im is False:
                         break
                     if downscale_factor > 1:
-                        frame_im = frame_im[::downscale_factor, ::downscale_factor, :]
+                        frame_im = frame_im[::downscale_factor, ::downscale_factor]
                 else:
                     if video.read(decode=False) is False:
                         break
@@ -837,14 +1909,18 @@ class SceneManager:
                 if self._start_pos is None:
                     self._start_pos = video.position
 
-                out_queue.put((frame_im, video.position))
+                # Position of the current frame is one less than the frame number.
+                frame_buffer.put(frame_im, video.frame_number - 1)
 
+                # The backend may skip more than one frame per read if fast skipping is enabled,
+                # so we use the frame number to determine when to stop.
                 if frame_skip > 0:
-                    for _ in range(frame_skip):
+                    skip_until = video.frame_number + frame_skip
+                    while video.frame_number < skip_until:
                         if not video.read(decode=False):
                             break
 
-                if end_time is not None and video.position >= end_time:
+                if end_frame is not None and video.frame_number - 1 >= end_frame:
                     break
 
         # If *any* exceptions occur, we re-raise them in the main thread so that the caller of
@@ -860,4 +1936,4 @@ class SceneManager:
             if self._start_pos is None:
                 self._start_pos = video.position
             # Make sure main thread stops processing loop.
-            out_queue.put((None, None))
+            frame_buffer.put_end()
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+#         PySceneDetect: Python-Based Video Scene Detector
+#   ---------------------------------------------------------------
+#     [  Site:   http://www.scenedetect.scenedetect.com/         ]
+#     [  Docs:   http://manual.scenedetect.scenedetect.com/      ]
+#     [  Github: https://github.com/Breakthrough/PySceneDetect/  ]
+#
+# Copyright (C) 2014-2022 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+""":py:class:`StatsCache` stores the frame metrics calculated for each video on disk, so that
+detecting scenes in the same video again (e.g. with a different threshold) does not require
+recalculating them.
+
+A cache is used by passing it to a :py:class:`SceneManager <scenedetect.scene_manager.SceneManager>`,
+which loads any metrics cached for the video before detecting scenes, and saves new ones after:
+
+.. code:: python
+
+    from scenedetect import open_video, SceneManager, ContentDetector
+    from scenedetect.stats_cache import StatsCache
+    scene_manager = SceneManager(stats_cache=StatsCache())
+    scene_manager.add_detector(ContentDetector())
+    scene_manager.detect_scenes(open_video('video.mp4'))
+
+Metrics are stored in the user cache folder by default, in the binary stats file format (see
+:py:meth:`StatsManager.save_to_binary <scenedetect.stats_manager.StatsManager.save_to_binary>`).
+Each video has one file for every backend and downscale factor it is processed with, keyed by the
+size, modification time, and a hash of several blocks of the video file. Metrics from different
+detectors are stored in the same file, so only those missing from it need to be calculated.
+"""
+
+from logging import getLogger
+import os
+import os.path
+from typing import AnyStr, Iterable, Optional
+
+from appdirs import user_cache_dir
+
+from scenedetect.platform import get_file_fingerprint
+from scenedetect.stats_manager import BINARY_STATS_FILE_EXTENSION, StatsFileCorrupt, StatsManager
+from scenedetect.video_stream import VideoStream
+
+logger = getLogger('pyscenedetect')
+
+STATS_CACHE_DIR: str = os.path.join(user_cache_dir("PySceneDetect", False), 'stats')
+"""Default folder frame metrics are cached in."""
+
+
+class StatsCache:
+    """Cache of the frame metrics of each video processed, stored in a folder on disk."""
+
+    def __init__(self, cache_dir: Optional[AnyStr] = None):
+        """
+        Arguments:
+            cache_dir: Folder to store frame metrics in. If not set, uses
+                :py:data:`STATS_CACHE_DIR`.
+        """
+        self._cache_dir = cache_dir if cache_dir is not None else STATS_CACHE_DIR
+
+    @property
+    def cache_dir(self) -> AnyStr:
+        """Folder frame metrics are stored in."""
+        return self._cache_dir
+
+    def get_path(self, video: VideoStream, downscale_factor: int) -> Optional[str]:
+        """Get the path of the file the frame metrics of `video` are cached in.
+
+        Arguments:
+            video: Video the metrics were calculated from.
+            downscale_factor: Factor frames were downscaled by when calculating the metrics.
+
+        Returns:
+            Path of the cache file (which may not exist yet), or None if `video` is not a file
+            (e.g. an image sequence or a URL) and cannot be cached.
+        """
+        if not (isinstance(video.path, str) and os.path.isfile(video.path)):
+            return None
+        key = get_file_fingerprint(
+            video.path, prefix=b'%s:%d:' % (video.BACKEND_NAME.encode(), downscale_factor))
+        return os.path.join(self._cache_dir, key + BINARY_STATS_FILE_EXTENSION)
+
+    def load(self, path: AnyStr, stats_manager: StatsManager, metric_keys: Iterable[str]) -> int:
+        """Load cached frame metrics into `stats_manager`.
+
+        Arguments:
+            path: Path of the cache file, from :py:meth:`get_path`.
+            stats_manager: StatsManager to load the metrics into.
+            metric_keys: Metric keys to load. Other metrics in the cache are ignored.
+
+        Returns:
+            Number of metric values loaded. Metrics already set in `stats_manager` are kept.
+        """
+        if not os.path.exists(path):
+            return 0
+        cached = StatsManager()
+        try:
+            cached.load_from_binary(path)
+        except (OSError, StatsFileCorrupt) as ex:
+            logger.warning('Failed to load cached frame metrics: %s', str(ex))
+            return 0
+        num_loaded = stats_manager.update(cached, metric_keys)
+        logger.debug('Loaded %d cached frame metrics: %s', num_loaded, path)
+        return num_loaded
+
+    def save(self, path: AnyStr, stats_manager: StatsManager, metric_keys: Iterable[str]) -> None:
+        """Add the frame metrics in `stats_manager` to the cache, if any are not cached yet.
+
+        Arguments:
+            path: Path of the cache file, from :py:meth:`get_path`.
+            stats_manager: StatsManager to save the metrics of.
+            metric_keys: Metric keys to save.
+        """
+        cached = StatsManager()
+        if os.path.exists(path):
+            try:
+                cached.load_from_binary(path)
+            except (OSError, StatsFileCorrupt) as ex:
+                logger.warning('Failed to load cached frame metrics, replacing: %s', str(ex))
+                cached = StatsManager()
+        metric_keys = set(metric_keys)
+        if not cached.update(stats_manager, metric_keys):
+            return
+        cached.register_metrics(metric_keys)
+        # The cache file may be memory-mapped by `cached` (or another StatsManager), so the new
+        # one is written to a temporary file that then replaces it.
+        temp_path = '%s.%d.tmp' % (path, os.getpid())
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            cached.save_to_binary(temp_path)
+            del cached
+            os.replace(temp_path, path)
+            logger.debug('Saved frame metrics to cache: %s', path)
+        except OSError as ex:
+            logger.warning('Failed to save frame metrics to cache: %s', str(ex))
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
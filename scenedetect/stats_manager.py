@@ -22,12 +22,27 @@ the metrics calculated for each frame. The :py:class:`StatsManager` must be regi
 The entire :py:class:`StatsManager` can be :py:meth:`saved to <StatsManager.save_to_csv>`
 a human-readable CSV file, also allowing both precise determination of the threshold or
 other optimal values for video files.
+
+For long videos, stats can instead be :py:meth:`saved to <StatsManager.save_to_binary>` a
+compact binary file which is :py:meth:`loaded <StatsManager.load_from_binary>` without parsing
+by memory-mapping it. Both formats contain the same information, so a stats file can be converted
+between them by loading it and saving it in the other format:
+
+.. code:: python
+
+    stats_manager = StatsManager()
+    stats_manager.load_from_binary('video.stats')
+    stats_manager.save_to_csv('video.stats.csv')
 """
 
 import csv
+import json
 from logging import getLogger
-from typing import Any, Dict, Iterable, List, Optional, Set, TextIO, Union
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Set, TextIO, Tuple, Union
 import os.path
+import threading
+
+import numpy as np
 
 from scenedetect.frame_timecode import FrameTimecode
 
@@ -43,6 +58,63 @@ COLUMN_NAME_FRAME_NUMBER = "Frame Number"
 COLUMN_NAME_TIMECODE = "Timecode"
 """Name of column containing timecodes in the statsfile CSV."""
 
+##
+## StatsManager Binary File Format
+##
+
+BINARY_STATS_FILE_EXTENSION = ".stats"
+"""Extension of binary stats files (see :py:meth:`StatsManager.save_to_binary`). The command-line
+interface saves stats files with any other extension as CSV."""
+
+BINARY_STATS_FILE_MAGIC = b"PSDSTATS"
+"""Identifier at the start of every binary stats file."""
+
+BINARY_STATS_FILE_VERSION = 1
+"""Version of the binary stats file format."""
+
+# Data in binary stats files is aligned to this many bytes from the start of the file.
+_BINARY_STATS_FILE_ALIGNMENT = 64
+
+_INITIAL_CAPACITY = 1024
+"""Number of frames space is initially allocated for in each metric column."""
+
+# Number of rows to write to CSV files at once.
+_CSV_ROWS_PER_WRITE = 10000
+
+# Minimum number of complete frames before they are written to a stream (see open_stream).
+_STREAM_FRAMES_PER_WRITE = 1000
+
+
+def _is_binary_stats_file(path: Union[str, bytes]) -> bool:
+    """Check if `path` has the extension of a binary stats file."""
+    if isinstance(path, bytes):
+        path = os.fsdecode(path)
+    return path.lower().endswith(BINARY_STATS_FILE_EXTENSION)
+
+
+def _format_timecodes(frame_nums: np.ndarray, framerate: float) -> List[str]:
+    """Format the timecode of each frame number, giving the same result as
+    :py:meth:`FrameTimecode.get_timecode` without creating a :py:class:`FrameTimecode` per frame.
+    """
+    # Use the same floating point operations as FrameTimecode.get_timecode so the results are
+    # identical. Rounding the seconds to 3 decimal places is done by the `%.3f` format.
+    secs = frame_nums.astype(np.float64) / float(framerate)
+    hrs = np.trunc(secs / 3600.0)
+    secs -= hrs * 3600.0
+    mins = np.trunc(secs / 60.0)
+    secs -= mins * 60.0
+    return list(
+        map('%02d:%02d:%06.3f'.__mod__,
+            zip(hrs.astype(np.int64).tolist(),
+                mins.astype(np.int64).tolist(), secs.tolist())))
+
+
+def _get_data_offset(header_size: int) -> int:
+    """Get the offset of the data in a binary stats file with a JSON header of `header_size`."""
+    offset = len(BINARY_STATS_FILE_MAGIC) + 4 + header_size
+    return -(-offset // _BINARY_STATS_FILE_ALIGNMENT) * _BINARY_STATS_FILE_ALIGNMENT
+
+
 ##
 ## StatsManager Exceptions
 ##
@@ -71,7 +143,7 @@ class FrameMetricNotRegistered(Exception):
 
 
 class StatsFileCorrupt(Exception):
-    """Raised when frame metrics/stats could not be loaded from a provided CSV file."""
+    """Raised when frame metrics/stats could not be loaded from a provided CSV/binary file."""
 
     def __init__(self,
                  message: str = "Could not load frame metric data data from passed CSV file."):
@@ -94,8 +166,13 @@ class StatsManager:
     after having called the detect_scenes(...) method on the SceneManager object
     which owns the given StatsManager instance.
 
-    Only metrics consisting of `float` or `int` should be used currently. All metrics loaded
-    from disk are treated as `float`.
+    Only metrics consisting of `float` or `int` should be used currently. All metrics are
+    stored (and returned) as `float`.
+
+    Metrics are stored in one array per metric key, along with a mask indicating which frames
+    the metric has been set for. The arrays cover a contiguous range of frame numbers, and grow
+    as metrics for frames outside of that range are set. A range of frames can be queried all at
+    once with :py:meth:`get_metric_range` and :py:meth:`metrics_exist_range`.
     """
 
     def __init__(self, base_timecode: FrameTimecode = None):
@@ -105,14 +182,29 @@ class StatsManager:
             base_timecode: Timecode associated with this object. Must not be None (default value
                 will be removed in a future release).
         """
-        # Frame metrics is a dict of frame (int): metric_dict (Dict[str, float])
-        # of each frame metric key and the value it represents (usually float).
-        self._frame_metrics: Dict[FrameTimecode, Dict[str, float]] = dict()
+        # Frame metrics are stored in columns, one for each metric key, where index 0 is
+        # frame number `_frame_offset`. Each column has a mask of which frames are set, and
+        # `_frame_set` marks frames which have any metric set.
+        self._frame_offset: int = 0
+        self._frame_set: np.ndarray = np.zeros(0, dtype=bool)
+        self._columns: Dict[str, np.ndarray] = dict()
+        self._column_set: Dict[str, np.ndarray] = dict()
         self._registered_metrics: Set[str] = set()                   # Set of frame metric keys.
         self._loaded_metrics: Set[str] = set()                       # Metric keys loaded from stats file.
         self._metrics_updated: bool = False                          # Flag indicating if metrics require saving.
         self._base_timecode: Optional[FrameTimecode] = base_timecode # Used for timing calculations.
 
+        # Held while setting metrics, as detectors may run in parallel (see
+        # `SceneManager.detector_threads`) and setting metrics can resize the columns.
+        self._set_lock = threading.Lock()
+
+        # CSV file frame metrics are being written to (see open_stream).
+        self._stream: Optional[TextIO] = None
+        self._stream_owned: bool = False
+        self._stream_evict: bool = False
+        self._stream_metric_keys: List[str] = []
+        self._stream_next_frame: Optional[int] = None
+
     def register_metrics(self, metric_keys: Iterable[str]) -> None:
         """Register a list of metric keys that will be used by the detector.
 
@@ -144,7 +236,17 @@ class StatsManager:
             in the same order as the input list of metric keys. If a metric could
             not be found, None is returned for that particular metric.
         """
-        return [self._get_metric(frame_number, metric_key) for metric_key in metric_keys]
+        index = frame_number - self._frame_offset
+        if not 0 <= index < len(self._frame_set):
+            return [None for _ in metric_keys]
+        metrics = []
+        for metric_key in metric_keys:
+            column_set = self._column_set.get(metric_key)
+            if column_set is not None and column_set.item(index):
+                metrics.append(self._columns[metric_key].item(index))
+            else:
+                metrics.append(None)
+        return metrics
 
     def set_metrics(self, frame_number: int, metric_kv_dict: Dict[str, Any]) -> None:
         """ Set Metrics: Sets the provided statistics/metrics for a given frame.
@@ -154,8 +256,17 @@ class StatsManager:
             metric_kv_dict: A dict mapping metric keys to the
                 respective integer/floating-point metric values to set.
         """
-        for metric_key in metric_kv_dict:
-            self._set_metric(frame_number, metric_key, metric_kv_dict[metric_key])
+        if not metric_kv_dict:
+            return
+        with self._set_lock:
+            self._metrics_updated = True
+            index = self._reserve_frame(frame_number)
+            for metric_key, metric_value in metric_kv_dict.items():
+                column = self._columns.get(metric_key)
+                if column is None:
+                    column = self._add_column(metric_key)
+                column[index] = metric_value
+                self._column_set[metric_key][index] = True
 
     def metrics_exist(self, frame_number: int, metric_keys: Iterable[str]) -> bool:
         """ Metrics Exist: Checks if the given metrics/stats exist for the given frame.
@@ -163,7 +274,94 @@ class StatsManager:
         Returns:
             bool: True if the given metric keys exist for the frame, False otherwise.
         """
-        return all([self._metric_exists(frame_number, metric_key) for metric_key in metric_keys])
+        index = frame_number - self._frame_offset
+        if not 0 <= index < len(self._frame_set):
+            # Only True if no metric keys were given.
+            return all(False for _ in metric_keys)
+        for metric_key in metric_keys:
+            column_set = self._column_set.get(metric_key)
+            if column_set is None or not column_set.item(index):
+                return False
+        return True
+
+    def get_metric_range(self, metric_key: str, start: int, end: int) -> np.ndarray:
+        """Get the values of a metric for a range of frames.
+
+        Arguments:
+            metric_key: Metric key to look up.
+            start: First frame number of the range.
+            end: Frame number after the last frame of the range.
+
+        Returns:
+            Array of `end - start` values, in order of frame number. Frames which do not have the
+            metric set are NaN (use :py:meth:`metrics_exist_range` to check which are set).
+        """
+        values = self._get_range(self._columns.get(metric_key), start, end, np.nan)
+        values[~self._get_range(self._column_set.get(metric_key), start, end, False)] = np.nan
+        return values
+
+    def metrics_exist_range(self, metric_keys: Iterable[str], start: int, end: int) -> np.ndarray:
+        """Check which frames in a range have all of the given metrics set.
+
+        Arguments:
+            metric_keys: Metric keys to check.
+            start: First frame number of the range.
+            end: Frame number after the last frame of the range.
+
+        Returns:
+            Array of `end - start` booleans, in order of frame number, which are True if the
+            frame has every metric in `metric_keys` set.
+        """
+        exists = np.ones(max(0, end - start), dtype=bool)
+        for metric_key in metric_keys:
+            exists &= self._get_range(self._column_set.get(metric_key), start, end, False)
+        return exists
+
+    def get_frame_range(self) -> Tuple[int, int]:
+        """Get the range of frames which have any metric set.
+
+        Returns:
+            Tuple of the first frame number with any metric set, and the frame number after the
+            last one. Both are 0 if no metrics are set.
+        """
+        frames_set = np.flatnonzero(self._frame_set)
+        if len(frames_set) == 0:
+            return (0, 0)
+        return (self._frame_offset + int(frames_set[0]),
+                self._frame_offset + int(frames_set[-1]) + 1)
+
+    def update(self,
+               stats_manager: 'StatsManager',
+               metric_keys: Optional[Iterable[str]] = None) -> int:
+        """Copy the frame metrics set in another StatsManager which are not already set in this
+        one.
+
+        Arguments:
+            stats_manager: StatsManager to copy frame metrics from.
+            metric_keys: Metric keys to copy. If not set, every metric is copied.
+
+        Returns:
+            Number of metric values copied.
+        """
+        if metric_keys is None:
+            metric_keys = list(stats_manager._columns.keys())
+        metric_keys = [key for key in metric_keys if key in stats_manager._columns]
+        frames_set = np.flatnonzero(stats_manager._frame_set)
+        if not metric_keys or len(frames_set) == 0:
+            return 0
+        start, end = int(frames_set[0]), int(frames_set[-1]) + 1
+        masks = np.stack([stats_manager._column_set[key][start:end] for key in metric_keys])
+        if not masks.any():
+            return 0
+        values = np.stack([stats_manager._columns[key][start:end] for key in metric_keys])
+        start, end = start + stats_manager._frame_offset, end + stats_manager._frame_offset
+        masks &= ~np.stack(
+            [self._get_range(self._column_set.get(key), start, end, False) for key in metric_keys])
+        num_copied = int(np.count_nonzero(masks))
+        if num_copied:
+            self._set_metrics_bulk(np.arange(start, end), metric_keys, values, masks)
+            self._metrics_updated = True
+        return num_copied
 
     def is_save_required(self) -> bool:
         """ Is Save Required: Checks if the stats have been updated since loading.
@@ -193,8 +391,8 @@ class StatsManager:
             logger.error('base_timecode is deprecated.')
 
         # Ensure we need to write to the file, and that we have data to do so with.
-        if not ((self.is_save_required() or force_save) and self._registered_metrics
-                and self._frame_metrics):
+        if not ((self.is_save_required() or force_save) and
+                (self._registered_metrics or self._loaded_metrics) and self._frame_set.any()):
             logger.info("No metrics to save.")
             return
 
@@ -210,14 +408,249 @@ class StatsManager:
         # Header rows.
         metric_keys = sorted(list(self._registered_metrics.union(self._loaded_metrics)))
         csv_writer.writerow([COLUMN_NAME_FRAME_NUMBER, COLUMN_NAME_TIMECODE] + metric_keys)
-        frame_keys = sorted(self._frame_metrics.keys())
-        logger.info("Writing %d frames to CSV...", len(frame_keys))
-        for frame_key in frame_keys:
-            frame_timecode = self._base_timecode + frame_key
-            csv_writer.writerow(
-                [frame_timecode.get_frames() +
-                 1, frame_timecode.get_timecode()] +
-                [str(metric) for metric in self.get_metrics(frame_key, metric_keys)])
+        indices = np.flatnonzero(self._frame_set)
+        logger.info("Writing %d frames to CSV...", len(indices))
+        self._write_csv_rows(csv_file, indices, metric_keys)
+
+    def open_stream(self, csv_file: Union[str, bytes, TextIO], evict: bool = True) -> None:
+        """Write frame metrics to a CSV file while they are being calculated, rather than saving
+        them all at once with :py:meth:`save_to_csv` when detection is complete.
+
+        Frames are written in blocks once they are marked as complete by calling
+        :py:meth:`stream_frames` (done by :py:meth:`SceneManager.detect_scenes
+        <scenedetect.scene_manager.SceneManager.detect_scenes>`), so if detection is interrupted,
+        the stats file contains the metrics of every frame up to the last block. The remaining
+        frames are written by :py:meth:`close_stream`, which must be called when done.
+
+        Only metrics registered before calling this method are written. Metrics set for a frame
+        after it was written are not saved.
+
+        Arguments:
+            csv_file: A file handle opened in write mode (e.g. open('...', 'w')) or a path as str.
+            evict: If True, the metrics of frames are discarded once they are written, so memory
+                use does not grow with the length of the video. If False, all metrics are kept
+                (e.g. to use them after detection).
+
+        Raises:
+            OSError: If `path` cannot be opened or a write failure occurs.
+        """
+        assert self._stream is None
+        if isinstance(csv_file, (str, bytes)):
+            csv_file = open(csv_file, 'w')
+            self._stream_owned = True
+        else:
+            self._stream_owned = False
+        self._stream = csv_file
+        self._stream_evict = evict
+        self._stream_metric_keys = sorted(
+            list(self._registered_metrics.union(self._loaded_metrics)))
+        self._stream_next_frame = None
+        csv_writer = csv.writer(csv_file, lineterminator='\n')
+        csv_writer.writerow([COLUMN_NAME_FRAME_NUMBER, COLUMN_NAME_TIMECODE] +
+                            self._stream_metric_keys)
+        csv_file.flush()
+
+    def stream_frames(self, end_frame: int) -> None:
+        """Mark all frames before `end_frame` as complete (i.e. no more metrics will be set for
+        them), allowing them to be written to the stream opened by :py:meth:`open_stream`. Frames
+        are only written once enough of them are complete. Does nothing if no stream is open.
+
+        Arguments:
+            end_frame: Frame number after the last complete frame.
+        """
+        if self._stream is None:
+            return
+        if self._stream_next_frame is None:
+            self._stream_next_frame = self._frame_offset
+        if end_frame - self._stream_next_frame >= _STREAM_FRAMES_PER_WRITE:
+            self._write_stream(end_frame)
+
+    def close_stream(self) -> None:
+        """Write all remaining frames to the stream opened by :py:meth:`open_stream` and close
+        it. The file is only closed if a path was passed to :py:meth:`open_stream`."""
+        if self._stream is None:
+            return
+        try:
+            self._write_stream(self._frame_offset + len(self._frame_set))
+        finally:
+            if self._stream_owned:
+                self._stream.close()
+            self._stream = None
+        self._metrics_updated = False
+
+    def _write_stream(self, end_frame: int) -> None:
+        """Write all frames from the last written frame up to `end_frame` to the stream."""
+        assert self._base_timecode is not None
+        start = 0
+        if self._stream_next_frame is not None:
+            start = max(0, self._stream_next_frame - self._frame_offset)
+        end = max(start, min(end_frame - self._frame_offset, len(self._frame_set)))
+        indices = np.flatnonzero(self._frame_set[start:end]) + start
+        self._write_csv_rows(self._stream, indices, self._stream_metric_keys)
+        self._stream.flush()
+        self._stream_next_frame = self._frame_offset + end
+        if self._stream_evict:
+            self._evict(self._stream_next_frame)
+
+    def _write_csv_rows(self, csv_file: TextIO, indices: np.ndarray,
+                        metric_keys: List[str]) -> None:
+        """Write a CSV row for each frame in `indices` (the index of each frame in the metric
+        columns). Each column is formatted at once, then the rows are written in chunks."""
+        frame_nums = indices + (self._frame_offset + self._base_timecode.get_frames())
+        columns = [[str(frame_num + 1) for frame_num in frame_nums.tolist()],
+                   _format_timecodes(frame_nums, self._base_timecode.get_framerate())]
+        for metric_key in metric_keys:
+            if metric_key in self._columns:
+                values = self._columns[metric_key][indices].tolist()
+                for i in np.flatnonzero(~self._column_set[metric_key][indices]).tolist():
+                    values[i] = None
+                columns.append(list(map(str, values)))
+            else:
+                columns.append(['None'] * len(indices))
+        rows = list(map(','.join, zip(*columns)))
+        for start in range(0, len(rows), _CSV_ROWS_PER_WRITE):
+            csv_file.write('\n'.join(rows[start:start + _CSV_ROWS_PER_WRITE]))
+            csv_file.write('\n')
+
+    def save_to_binary(self,
+                       path: Union[str, bytes, BinaryIO],
+                       quantize: bool = False,
+                       force_save: bool = True) -> None:
+        """Save all frame metrics stored in the StatsManager to a binary stats file, which can be
+        loaded with :py:meth:`load_from_binary`.
+
+        The file consists of :py:data:`BINARY_STATS_FILE_MAGIC`, the size of a JSON header as a
+        32-bit little-endian integer, the header itself, and then (aligned to 64 bytes) an array
+        of the values of each metric, followed by an array of bytes for each metric indicating
+        which frames it is set for. The header contains the list of metrics, the frame number of
+        the first frame, the number of frames, the data type of the values, and the framerate
+        of the video (if known).
+
+        Arguments:
+            path: Path to save the stats file to, or a file handle opened in binary write mode.
+            quantize: Store metrics as 32-bit instead of 64-bit floats, halving the size of the
+                file at the cost of precision.
+            force_save: If True, writes metrics out even if an update is not required.
+
+        Raises:
+            OSError: If `path` cannot be opened or a write failure occurs.
+        """
+        # Ensure we need to write to the file, and that we have data to do so with.
+        if not ((self.is_save_required() or force_save) and self._frame_set.any()):
+            logger.info("No metrics to save.")
+            return
+
+        if isinstance(path, (str, bytes)):
+            # The metrics may be memory-mapped from `path` (see :py:meth:`load_from_binary`), so
+            # they are written to a temporary file that then replaces it.
+            temp_path = os.fsdecode(path) + '.%d.tmp' % os.getpid()
+            try:
+                with open(temp_path, 'wb') as file:
+                    self.save_to_binary(path=file, quantize=quantize, force_save=force_save)
+                os.replace(temp_path, path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            return
+
+        metric_keys = sorted(list(self._registered_metrics.union(self._loaded_metrics)))
+        frames_set = np.flatnonzero(self._frame_set)
+        start, end = int(frames_set[0]), int(frames_set[-1]) + 1
+        dtype = np.dtype('<f4' if quantize else '<f8')
+        values = np.zeros((len(metric_keys), end - start), dtype=dtype)
+        masks = np.zeros((len(metric_keys), end - start), dtype=np.uint8)
+        for i, metric_key in enumerate(metric_keys):
+            if metric_key in self._columns:
+                values[i] = self._columns[metric_key][start:end]
+                masks[i] = self._column_set[metric_key][start:end]
+
+        header = {
+            'version': BINARY_STATS_FILE_VERSION,
+            'metrics': metric_keys,
+            'first_frame': self._frame_offset + start,
+            'num_frames': end - start,
+            'dtype': dtype.str,
+            'framerate': None,
+        }
+        if self._base_timecode is not None:
+            header['framerate'] = self._base_timecode.get_framerate()
+        encoded_header = json.dumps(header).encode('utf-8')
+        path.write(BINARY_STATS_FILE_MAGIC + len(encoded_header).to_bytes(4, 'little'))
+        path.write(encoded_header)
+        header_size = len(BINARY_STATS_FILE_MAGIC) + 4 + len(encoded_header)
+        path.write(b'\0' * (_get_data_offset(len(encoded_header)) - header_size))
+        logger.info("Writing %d frames to binary stats file...", end - start)
+        path.write(values.tobytes())
+        path.write(masks.tobytes())
+
+    def load_from_binary(self, path: Union[str, bytes]) -> Optional[int]:
+        """Load all metrics stored in a binary stats file saved by :py:meth:`save_to_binary`.
+
+        The file is memory-mapped rather than parsed, so frame metrics are only read from disk
+        when they are used. Metrics which are modified after loading are not written back to the
+        file (use :py:meth:`save_to_binary` to save them).
+
+        Arguments:
+            path: Path to the stats file.
+
+        Returns:
+            Number of frames in the stats file, or None if the file could not be found.
+
+        Raises:
+            StatsFileCorrupt: Stats file is corrupt and can't be loaded, or wrong file
+                was specified.
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as file:
+            prefix = file.read(len(BINARY_STATS_FILE_MAGIC) + 4)
+            if len(prefix) < len(BINARY_STATS_FILE_MAGIC) + 4 or not prefix.startswith(
+                    BINARY_STATS_FILE_MAGIC):
+                raise StatsFileCorrupt('File is not a binary stats file.')
+            try:
+                header_size = int.from_bytes(prefix[-4:], 'little')
+                header = json.loads(file.read(header_size))
+                metric_keys = [str(metric_key) for metric_key in header['metrics']]
+                first_frame = int(header['first_frame'])
+                num_frames = int(header['num_frames'])
+                dtype = np.dtype(header['dtype'])
+                framerate = header['framerate']
+            except (ValueError, KeyError, TypeError) as ex:
+                raise StatsFileCorrupt('Corrupted binary stats file header.') from ex
+            if header['version'] != BINARY_STATS_FILE_VERSION:
+                raise StatsFileCorrupt('Unsupported binary stats file version.')
+            data_offset = _get_data_offset(header_size)
+            file.seek(0, os.SEEK_END)
+            data_size = len(metric_keys) * num_frames * (dtype.itemsize + 1)
+            if file.tell() < data_offset + data_size:
+                raise StatsFileCorrupt('Binary stats file is truncated.')
+
+        shape = (len(metric_keys), num_frames)
+        values, masks = np.zeros((0, num_frames)), np.zeros((0, num_frames), dtype=bool)
+        if metric_keys and num_frames:
+            # Open in copy-on-write mode, so metrics can be modified without changing the file.
+            values = np.memmap(path, dtype=dtype, mode='c', offset=data_offset, shape=shape)
+            masks = np.memmap(
+                path, dtype=bool, mode='c', offset=data_offset + values.nbytes, shape=shape)
+            if dtype != np.float64:
+                values = values.astype(np.float64)
+
+        if not self._frame_set.any():
+            # Use the file as storage directly if there are no metrics yet.
+            self._frame_offset = first_frame
+            self._frame_set = masks.any(axis=0)
+            self._columns = {key: values[i] for i, key in enumerate(metric_keys)}
+            self._column_set = {key: masks[i] for i, key in enumerate(metric_keys)}
+        elif num_frames:
+            self._set_metrics_bulk(
+                np.arange(first_frame, first_frame + num_frames), metric_keys, values, masks)
+
+        self._loaded_metrics = set(metric_keys)
+        if self._base_timecode is None and framerate is not None:
+            self._base_timecode = FrameTimecode(0, float(framerate))
+        logger.info('Loaded %d metrics for %d frames.', len(metric_keys), num_frames)
+        self._metrics_updated = False
+        return num_frames
 
     @staticmethod
     def valid_header(row: List[str]) -> bool:
@@ -235,12 +668,52 @@ class StatsManager:
             return False
         return True
 
+    def save(self, path: Union[str, bytes], force_save: bool = True) -> None:
+        """Save all frame metrics to a stats file. Paths ending in
+        :py:data:`BINARY_STATS_FILE_EXTENSION` are saved with :py:meth:`save_to_binary`, and all
+        other paths with :py:meth:`save_to_csv`.
+
+        Arguments:
+            path: Path to save the stats file to.
+            force_save: If True, writes metrics out even if an update is not required.
+
+        Raises:
+            OSError: If `path` cannot be opened or a write failure occurs.
+        """
+        if _is_binary_stats_file(path):
+            self.save_to_binary(path, force_save=force_save)
+        else:
+            self.save_to_csv(path, force_save=force_save)
+
+    def load(self, path: Union[str, bytes]) -> Optional[int]:
+        """Load all metrics stored in a stats file saved by :py:meth:`save`. Paths ending in
+        :py:data:`BINARY_STATS_FILE_EXTENSION` are loaded with :py:meth:`load_from_binary`, and
+        all other paths are loaded as CSV.
+
+        Arguments:
+            path: Path to the stats file.
+
+        Returns:
+            Number of frames/rows read from the stats file, or None if the file was blank or could
+            not be found.
+
+        Raises:
+            StatsFileCorrupt: Stats file is corrupt and can't be loaded, or wrong file
+                was specified.
+        """
+        if _is_binary_stats_file(path):
+            return self.load_from_binary(path)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as file:
+            return self._load_csv(file)
+
     # TODO(v1.0): Remove.
     def load_from_csv(self, csv_file: Union[str, bytes, TextIO]) -> Optional[int]:
         """[DEPRECATED] DO NOT USE
 
         Load all metrics stored in a CSV file into the StatsManager instance. Will be removed in a
-        future release after becoming a no-op.
+        future release after becoming a no-op. Use :py:meth:`load` instead.
 
         Arguments:
             csv_file: A file handle opened in read mode (e.g. open('...', 'r')) or a path as str.
@@ -261,65 +734,146 @@ class StatsManager:
         if isinstance(csv_file, (str, bytes)):
             if os.path.exists(csv_file):
                 with open(csv_file, 'r') as file:
-                    return self.load_from_csv(csv_file=file)
+                    return self._load_csv(file)
             # Path doesn't exist.
             return None
+        return self._load_csv(csv_file)
 
-        # If we get here, file is a valid file handle in read-only text mode.
-        csv_reader = csv.reader(csv_file, lineterminator='\n')
-        num_cols = None
-        num_metrics = None
-        num_frames = None
+    def _load_csv(self, csv_file: TextIO) -> Optional[int]:
+        """Load all metrics from a CSV file handle. The header is parsed with the `csv` module,
+        and the remaining rows are parsed by `numpy.loadtxt` at once."""
         # First Row: Frame Num, Timecode, [metrics...]
-        try:
-            row = next(csv_reader)
-            # Backwards compatibility for previous versions of statsfile
-            # which included an additional header row.
-            if not self.valid_header(row):
-                row = next(csv_reader)
-        except StopIteration:
-            # If the file is blank or we couldn't decode anything, assume the file was empty.
-            return None
+        row = None
+        # Backwards compatibility for previous versions of statsfile
+        # which included an additional header row.
+        for _ in range(2):
+            line = csv_file.readline()
+            if not line:
+                # If the file is blank or we couldn't decode anything, assume the file was empty.
+                return None
+            row = next(csv.reader([line]), [])
+            if self.valid_header(row):
+                break
         if not self.valid_header(row):
             raise StatsFileCorrupt()
         num_cols = len(row)
-        num_metrics = num_cols - 2
-        if not num_metrics > 0:
+        metric_keys = row[2:]
+        if not metric_keys:
             raise StatsFileCorrupt('No metrics defined in CSV file.')
-        self._loaded_metrics = row[2:]
-        num_frames = 0
-        for row in csv_reader:
-            metric_dict = {}
-            if not len(row) == num_cols:
-                raise StatsFileCorrupt('Wrong number of columns detected in stats file row.')
-            for i, metric_str in enumerate(row[2:]):
-                if metric_str and metric_str != 'None':
-                    try:
-                        metric_dict[self._loaded_metrics[i]] = float(metric_str)
-                    except ValueError:
-                        raise StatsFileCorrupt('Corrupted value in stats file: %s' %
-                                               metric_str) from ValueError
-            frame_number = int(row[0])
+        self._loaded_metrics = set(metric_keys)
+
+        # Missing metrics are written as None, so load them as NaN.
+        lines = csv_file.read().replace('None', 'nan').splitlines()
+        lines = [line for line in lines if line]
+        if any(line.count(',') != num_cols - 1 for line in lines):
+            raise StatsFileCorrupt('Wrong number of columns detected in stats file row.')
+        num_frames = len(lines)
+        if num_frames:
+            try:
+                data = np.loadtxt(
+                    lines,
+                    delimiter=',',
+                    dtype=np.float64,
+                    usecols=[0] + list(range(2, num_cols)),
+                    ndmin=2,
+                    comments=None)
+            except ValueError as ex:
+                raise StatsFileCorrupt('Corrupted value in stats file: %s' % str(ex)) from ex
+            frame_numbers = data[:, 0].astype(np.int64)
             # Switch from 1-based to 0-based frame numbers.
-            if frame_number > 0:
-                frame_number -= 1
-            self.set_metrics(frame_number, metric_dict)
-            num_frames += 1
-        logger.info('Loaded %d metrics for %d frames.', num_metrics, num_frames)
+            frame_numbers[frame_numbers > 0] -= 1
+            values = data[:, 1:].T
+            self._set_metrics_bulk(frame_numbers, metric_keys, values, ~np.isnan(values))
+        logger.info('Loaded %d metrics for %d frames.', len(metric_keys), num_frames)
         self._metrics_updated = False
         return num_frames
 
-    def _get_metric(self, frame_number: int, metric_key: str) -> Optional[Any]:
-        if self._metric_exists(frame_number, metric_key):
-            return self._frame_metrics[frame_number][metric_key]
-        return None
-
-    def _set_metric(self, frame_number: int, metric_key: str, metric_value: Any) -> None:
-        self._metrics_updated = True
-        if not frame_number in self._frame_metrics:
-            self._frame_metrics[frame_number] = dict()
-        self._frame_metrics[frame_number][metric_key] = metric_value
+    def _set_metrics_bulk(self, frame_numbers: np.ndarray, metric_keys: List[str],
+                          values: np.ndarray, masks: np.ndarray) -> None:
+        """Set the values of `metric_keys` for each frame in `frame_numbers`, where `values` and
+        `masks` have one row per metric key and one column per frame. Only values where the
+        corresponding entry in `masks` is True are set."""
+        self._reserve(int(frame_numbers.min()), int(frame_numbers.max()))
+        indices = frame_numbers - self._frame_offset
+        self._frame_set[indices[masks.any(axis=0)]] = True
+        for i, metric_key in enumerate(metric_keys):
+            column = self._columns.get(metric_key)
+            if column is None:
+                column = self._add_column(metric_key)
+            column[indices[masks[i]]] = values[i][masks[i]]
+            self._column_set[metric_key][indices[masks[i]]] = True
+
+    def _add_column(self, metric_key: str) -> np.ndarray:
+        column = np.zeros(len(self._frame_set), dtype=np.float64)
+        self._columns[metric_key] = column
+        self._column_set[metric_key] = np.zeros(len(self._frame_set), dtype=bool)
+        return column
+
+    def _reserve_frame(self, frame_number: int) -> int:
+        """Ensure the columns cover `frame_number`, and mark the frame as set.
 
-    def _metric_exists(self, frame_number: int, metric_key: str) -> bool:
-        return (frame_number in self._frame_metrics
-                and metric_key in self._frame_metrics[frame_number])
+        Returns:
+            Index of `frame_number` in each column.
+        """
+        self._reserve(frame_number, frame_number)
+        index = frame_number - self._frame_offset
+        self._frame_set[index] = True
+        return index
+
+    def _reserve(self, first_frame: int, last_frame: int) -> None:
+        """Ensure the columns cover all frames from `first_frame` to `last_frame`. Columns are
+        grown by at least a factor of 2 when resized, so appending frames takes amortized O(1)
+        time."""
+        capacity = len(self._frame_set)
+        if capacity == 0:
+            self._resize(first_frame, max(_INITIAL_CAPACITY, last_frame - first_frame + 1))
+            return
+        offset = self._frame_offset
+        end = offset + capacity
+        if first_frame < offset:
+            offset = min(first_frame, max(0, end - 2 * capacity))
+        if last_frame >= end:
+            end = max(offset + 2 * capacity, last_frame + 1)
+        if offset != self._frame_offset or end != self._frame_offset + capacity:
+            self._resize(offset, end - offset)
+
+    def _evict(self, frame_number: int) -> None:
+        """Discard the metrics of all frames before `frame_number`. Frames after it are moved to
+        the start of each column, so memory is reused without reallocating the columns."""
+        count = min(frame_number - self._frame_offset, len(self._frame_set))
+        if count <= 0:
+            return
+        for column in [self._frame_set, *self._columns.values(), *self._column_set.values()]:
+            column[:len(column) - count] = column[count:]
+            column[len(column) - count:] = 0
+        self._frame_offset += count
+
+    def _resize(self, frame_offset: int, capacity: int) -> None:
+        """Reallocate all columns to cover `capacity` frames starting from `frame_offset`, which
+        must include all frames the columns currently cover."""
+        start = self._frame_offset - frame_offset
+        end = start + len(self._frame_set)
+
+        def resize(column: np.ndarray) -> np.ndarray:
+            resized = np.zeros(capacity, dtype=column.dtype)
+            resized[start:end] = column
+            return resized
+
+        self._frame_set = resize(self._frame_set)
+        self._columns = {key: resize(column) for key, column in self._columns.items()}
+        self._column_set = {key: resize(column) for key, column in self._column_set.items()}
+        self._frame_offset = frame_offset
+
+    def _get_range(self, column: Optional[np.ndarray], start: int, end: int,
+                   fill_value: Any) -> np.ndarray:
+        """Copy the values of `column` for frames in [start, end), using `fill_value` for frames
+        outside of the range the column covers."""
+        if column is None:
+            return np.full(max(0, end - start), fill_value)
+        values = np.full(max(0, end - start), fill_value, dtype=column.dtype)
+        first = max(start, self._frame_offset)
+        last = min(end, self._frame_offset + len(column))
+        if first < last:
+            values[first - start:last - start] = column[first - self._frame_offset:last -
+                                                        self._frame_offset]
+        return values
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+#
+#         PySceneDetect: Python-Based Video Scene Detector
+#   ---------------------------------------------------------------
+#     [  Site:   http://www.scenedetect.scenedetect.com/         ]
+#     [  Docs:   http://manual.scenedetect.scenedetect.com/      ]
+#     [  Github: https://github.com/Breakthrough/PySceneDetect/  ]
+#
+# Copyright (C) 2014-2022 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+""" ``scenedetect.sweep`` Module
+
+This module evaluates many combinations of detector parameters (e.g. the `threshold` and
+`min_scene_len` of a :py:class:`ContentDetector <scenedetect.detectors.ContentDetector>`) from
+frame metrics which were only calculated once, instead of detecting scenes again for each of them.
+
+The frame metrics are taken from a :py:class:`StatsManager <scenedetect.stats_manager.StatsManager>`
+after detecting scenes with the detector, or after loading a stats file:
+
+.. code:: python
+
+    from scenedetect import open_video, SceneManager, StatsManager, ContentDetector
+    from scenedetect.sweep import sweep_detector
+    video = open_video('video.mp4')
+    scene_manager = SceneManager(StatsManager())
+    detector = ContentDetector()
+    scene_manager.add_detector(detector)
+    num_frames = scene_manager.detect_scenes(video)
+    results = sweep_detector(detector, scene_manager.stats_manager, 0, num_frames,
+                             thresholds=[20.0, 25.0, 30.0], min_scene_lens=[10, 15])
+    for result in results:
+        print(result.threshold, result.min_scene_len, result.num_cuts)
+
+The cuts of each combination are the same as those :py:meth:`SceneManager.detect_scenes
+<scenedetect.scene_manager.SceneManager.detect_scenes>` finds when the detector is created with
+those parameters. If a list of expected cuts is given, the precision and recall of each combination
+are also calculated.
+"""
+
+import csv
+from typing import Iterable, List, Optional, TextIO, Tuple, Union
+
+import numpy as np
+
+from scenedetect.detectors import AdaptiveDetector, ContentDetector
+from scenedetect.detectors.content_detector import select_cuts
+from scenedetect.frame_timecode import FrameTimecode
+from scenedetect.stats_manager import StatsManager
+
+
+class SweepResult:
+    """Cuts found with one combination of detector parameters."""
+
+    def __init__(self,
+                 threshold: float,
+                 min_scene_len: int,
+                 cuts: np.ndarray,
+                 precision: Optional[float] = None,
+                 recall: Optional[float] = None):
+        """
+        Arguments:
+            threshold: Threshold the cuts were found with.
+            min_scene_len: Minimum scene length, in frames, the cuts were found with.
+            cuts: Frame numbers of the cuts.
+            precision: Fraction of `cuts` which match an expected cut, if known.
+            recall: Fraction of expected cuts which match one of `cuts`, if known.
+        """
+        self.threshold = threshold
+        self.min_scene_len = min_scene_len
+        self.cuts = cuts
+        self.precision = precision
+        self.recall = recall
+
+    @property
+    def num_cuts(self) -> int:
+        """Number of cuts found."""
+        return len(self.cuts)
+
+    @property
+    def f1_score(self) -> Optional[float]:
+        """Harmonic mean of `precision` and `recall`, or None if they are not known."""
+        if self.precision is None or self.recall is None:
+            return None
+        if self.precision + self.recall == 0.0:
+            return 0.0
+        return 2.0 * self.precision * self.recall / (self.precision + self.recall)
+
+    def __repr__(self) -> str:
+        return (
+            'SweepResult(threshold=%g, min_scene_len=%d, num_cuts=%d, precision=%s, recall=%s)' %
+            (self.threshold, self.min_scene_len, self.num_cuts, self.precision, self.recall))
+
+
+def get_content_cuts(frame_scores: np.ndarray, start_frame: int, threshold: float,
+                     min_scene_len: int) -> np.ndarray:
+    """Get the cuts a :py:class:`ContentDetector <scenedetect.detectors.ContentDetector>` finds.
+
+    Arguments:
+        frame_scores: Frame score (e.g. `content_val`) of each frame from `start_frame`. The first
+            value is ignored, as the first frame has nothing to compare with.
+        start_frame: Frame number of the first frame.
+        threshold: Threshold the frame score must reach to be a cut.
+        min_scene_len: Minimum number of frames between cuts (and from `start_frame`).
+
+    Returns:
+        Frame numbers of the cuts.
+    """
+    with np.errstate(invalid='ignore'):
+        candidates = np.flatnonzero(frame_scores[1:] >= threshold) + (start_frame + 1)
+    return select_cuts(candidates, start_frame, min_scene_len)
+
+
+def calculate_adaptive_ratio(frame_scores: np.ndarray, window_width: int,
+                             min_delta_hsv: float) -> np.ndarray:
+    """Calculate the `adaptive_ratio` metric of an :py:class:`AdaptiveDetector
+    <scenedetect.detectors.AdaptiveDetector>` for every frame.
+
+    Arguments:
+        frame_scores: Frame score (e.g. `content_val`) of each frame. The first value is ignored,
+            as the first frame has nothing to compare with.
+        window_width: Number of frames before and after each frame to average together.
+        min_delta_hsv: Minimum frame score for the ratio to be non-zero when the average of the
+            frames around it is zero.
+
+    Returns:
+        Adaptive ratio of each frame. Frames without a full window around them are NaN.
+    """
+    scores = frame_scores[1:]
+    adaptive_ratio = np.full(len(frame_scores), np.nan)
+    # The last frame is never part of a window, as AdaptiveDetector checks each window before
+    # adding the next frame to it.
+    num_windows = len(scores) - 2 * window_width - 1
+    if num_windows <= 0:
+        return adaptive_ratio
+    # Sum the frames around each one in the same order as AdaptiveDetector, so that the ratios
+    # (and which frames pass the threshold) are exactly the same.
+    denominator = np.zeros(num_windows)
+    for i in range(2 * window_width + 1):
+        if i != window_width:
+            denominator += scores[i:i + num_windows]
+    denominator /= (2.0 * window_width)
+    content_val = scores[window_width:window_width + num_windows]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(
+            np.abs(denominator) < 0.00001, np.where(content_val >= min_delta_hsv, 255.0, 0.0),
+            content_val / denominator)
+    adaptive_ratio[window_width + 1:window_width + 1 + num_windows] = ratio
+    return adaptive_ratio
+
+
+def get_adaptive_cuts(frame_scores: np.ndarray, adaptive_ratio: np.ndarray, start_frame: int,
+                      adaptive_threshold: float, min_delta_hsv: float,
+                      min_scene_len: int) -> np.ndarray:
+    """Get the cuts an :py:class:`AdaptiveDetector <scenedetect.detectors.AdaptiveDetector>`
+    finds.
+
+    Arguments:
+        frame_scores: Frame score (e.g. `content_val`) of each frame from `start_frame`.
+        adaptive_ratio: Adaptive ratio of each frame from `start_frame`, from
+            :py:func:`calculate_adaptive_ratio`.
+        start_frame: Frame number of the first frame.
+        adaptive_threshold: Threshold the adaptive ratio must reach to be a cut.
+        min_delta_hsv: Minimum frame score of a cut.
+        min_scene_len: Minimum number of frames between cuts.
+
+    Returns:
+        Frame numbers of the cuts.
+    """
+    with np.errstate(invalid='ignore'):
+        candidates = np.flatnonzero((adaptive_ratio >= adaptive_threshold)
+                                    & (frame_scores >= min_delta_hsv)) + start_frame
+    return select_cuts(candidates, None, min_scene_len)
+
+
+def evaluate_cuts(cuts: np.ndarray,
+                  expected_cuts: np.ndarray,
+                  tolerance: int = 0) -> Tuple[float, float]:
+    """Compare cuts to the expected ones. Each expected cut can only match one cut.
+
+    Arguments:
+        cuts: Sorted frame numbers of the cuts found.
+        expected_cuts: Sorted frame numbers of the expected cuts.
+        tolerance: Maximum number of frames between a cut and the expected cut it matches.
+
+    Returns:
+        Tuple of the precision (fraction of `cuts` which match an expected cut) and recall
+        (fraction of `expected_cuts` which match a cut). Either is 1.0 if there are no cuts to
+        calculate it from.
+    """
+    matched = 0
+    i, j = 0, 0
+    while i < len(cuts) and j < len(expected_cuts):
+        if abs(cuts[i] - expected_cuts[j]) <= tolerance:
+            matched += 1
+            i += 1
+            j += 1
+        elif cuts[i] < expected_cuts[j]:
+            i += 1
+        else:
+            j += 1
+    precision = matched / len(cuts) if len(cuts) else 1.0
+    recall = matched / len(expected_cuts) if len(expected_cuts) else 1.0
+    return (precision, recall)
+
+
+def sweep_detector(detector: ContentDetector,
+                   stats_manager: StatsManager,
+                   start_frame: int,
+                   end_frame: int,
+                   thresholds: Optional[Iterable[float]] = None,
+                   min_scene_lens: Optional[Iterable[int]] = None,
+                   expected_cuts: Optional[Iterable[Union[int, FrameTimecode]]] = None,
+                   tolerance: int = 0) -> List[SweepResult]:
+    """Find the cuts of every combination of threshold and minimum scene length of a detector,
+    from frame metrics which were already calculated.
+
+    Arguments:
+        detector: :py:class:`ContentDetector <scenedetect.detectors.ContentDetector>` or
+            :py:class:`AdaptiveDetector <scenedetect.detectors.AdaptiveDetector>` to use the other
+            parameters of (e.g. `weights` or `window_width`).
+        stats_manager: StatsManager containing the frame score of every frame in the range.
+        start_frame: Frame number of the first frame scenes were detected from.
+        end_frame: Frame number after the last frame scenes were detected from.
+        thresholds: Values of `threshold` (or `adaptive_threshold`) to try. If not set, only the
+            one of `detector` is used.
+        min_scene_lens: Values of `min_scene_len` to try, in frames. If not set, only the one of
+            `detector` is used.
+        expected_cuts: Expected cuts to calculate the precision and recall of each combination
+            with, if any.
+        tolerance: Maximum number of frames between a cut and the expected cut it matches.
+
+    Returns:
+        List of results for every combination, ordered by threshold then minimum scene length.
+
+    Raises:
+        TypeError: `detector` is not a ContentDetector or AdaptiveDetector.
+        ValueError: The frame score of a frame in the range is missing from `stats_manager`.
+    """
+    if not isinstance(detector, ContentDetector):
+        raise TypeError('Only ContentDetector and AdaptiveDetector can be swept.')
+    is_adaptive = isinstance(detector, AdaptiveDetector)
+    if thresholds is None:
+        thresholds = [detector.adaptive_threshold if is_adaptive else detector.threshold]
+    if min_scene_lens is None:
+        min_scene_lens = [detector.min_scene_len]
+    min_scene_lens = [int(min_scene_len) for min_scene_len in min_scene_lens]
+
+    metric_key = detector.frame_score_key
+    if not stats_manager.metrics_exist_range([metric_key], start_frame + 1, end_frame).all():
+        raise ValueError('Frame metric %s is missing for some frames from %d to %d.' %
+                         (metric_key, start_frame + 1, end_frame))
+    frame_scores = stats_manager.get_metric_range(metric_key, start_frame, end_frame)
+    if is_adaptive:
+        adaptive_ratio = calculate_adaptive_ratio(frame_scores, detector.window_width,
+                                                  detector.min_delta_hsv)
+    if expected_cuts is not None:
+        expected_cuts = np.array(
+            sorted(cut.get_frames() if isinstance(cut, FrameTimecode) else int(cut)
+                   for cut in expected_cuts),
+            dtype=np.int64)
+
+    results = []
+    for threshold in sorted(thresholds):
+        for min_scene_len in sorted(min_scene_lens):
+            if is_adaptive:
+                cuts = get_adaptive_cuts(frame_scores, adaptive_ratio, start_frame, threshold,
+                                         detector.min_delta_hsv, min_scene_len)
+            else:
+                cuts = get_content_cuts(frame_scores, start_frame, threshold, min_scene_len)
+            result = SweepResult(threshold, min_scene_len, cuts)
+            if expected_cuts is not None:
+                result.precision, result.recall = evaluate_cuts(cuts, expected_cuts, tolerance)
+            results.append(result)
+    return results
+
+
+def write_sweep_results(output_csv_file: TextIO, results: Iterable[SweepResult]) -> None:
+    """Writes the results of :py:func:`sweep_detector` to an output file handle in CSV format.
+
+    Arguments:
+        output_csv_file: Handle to open file in write mode.
+        results: Results to write, one row each. Precision, recall, and F1 score columns are only
+            written if they are known.
+    """
+    results = list(results)
+    has_scores = any(result.precision is not None for result in results)
+    csv_writer = csv.writer(output_csv_file, lineterminator='\n')
+    header = ["Threshold", "Min Scene Length (frames)", "Cuts"]
+    if has_scores:
+        header += ["Precision", "Recall", "F1 Score"]
+    csv_writer.writerow(header)
+    for result in results:
+        row = ['%g' % result.threshold, '%d' % result.min_scene_len, '%d' % result.num_cuts]
+        if has_scores:
+            row += [
+                '%.3f' % result.precision,
+                '%.3f' % result.recall,
+                '%.3f' % result.f1_score,
+            ]
+        csv_writer.writerow(row)
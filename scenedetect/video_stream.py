@@ -28,9 +28,9 @@ tested by adding it to the test suite in `tests/test_video_stream.py`.
 """
 
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional, Union
+from typing import Any, Dict, Tuple, Optional, Union
 
-from numpy import ndarray
+from numpy import empty, ndarray
 
 from scenedetect.frame_timecode import FrameTimecode
 
@@ -96,6 +96,14 @@ def compute_downscale_factor(frame_width: int, effective_width: int = DEFAULT_MI
     return frame_width // effective_width
 
 
+PIXEL_FORMAT_BGR: str = 'bgr24'
+"""Pixel format of frames with 3 channels (blue, green, red) per pixel. This is the default
+format of frames returned by :py:meth:`VideoStream.read`."""
+
+PIXEL_FORMAT_GRAY: str = 'gray'
+"""Pixel format of frames with a single luma (Y) channel per pixel, as 2D arrays with a shape of
+(height, width). These are a third of the size of BGR frames."""
+
 ##
 ## VideoStream Interface (Base Class)
 ##
@@ -113,6 +121,61 @@ class VideoStream(ABC):
         """FrameTimecode object to use as a time base."""
         return FrameTimecode(timecode=0, fps=self.frame_rate)
 
+    @property
+    def open_options(self) -> Dict[str, Any]:
+        """Keyword arguments, other than the path and framerate, which open the video again with
+        the same backend-specific options (e.g. in another process)."""
+        return {}
+
+    def set_output_downscale(self, factor: int = 1) -> bool:
+        """Request that frames returned by `read` be downscaled by the given integer factor, if
+        the backend is able to do so as part of decoding. Downscaled frames have a size of
+        ceil(width / factor) x ceil(height / factor) pixels. Set `factor` to 1 to disable.
+
+        Backends which do not support this return False, in which case the frames returned
+        by `read` are not downscaled.
+
+        Arguments:
+            factor: Integer factor to downscale frames by.
+
+        Returns:
+            True if frames returned by `read` will be downscaled, False otherwise.
+        """
+        return False
+
+    def set_output_format(self, pixel_format: str = PIXEL_FORMAT_BGR) -> bool:
+        """Request that frames returned by `read` and `read_batch` be converted to the given
+        pixel format (e.g. :py:data:`PIXEL_FORMAT_GRAY`) as part of decoding, if the backend is
+        able to do so. Set `pixel_format` to :py:data:`PIXEL_FORMAT_BGR` to restore the default.
+
+        Backends which do not support this return False, in which case the frames returned
+        by `read` are in BGR format.
+
+        Arguments:
+            pixel_format: Pixel format of frames to return.
+
+        Returns:
+            True if frames returned by `read` will be in `pixel_format`, False otherwise.
+        """
+        return pixel_format == PIXEL_FORMAT_BGR
+
+    def set_fast_skip(self, enabled: bool = False) -> bool:
+        """Request that frames advanced past by calling `read` with `decode` = False are skipped
+        without being fully decoded, if the backend is able to do so. When enabled, `read` may
+        advance by more than one frame at a time if `decode` is False, so callers should use
+        `frame_number` or `position` to determine how far the stream has advanced.
+
+        Backends which do not support this return False, in which case every frame is still
+        advanced through one at a time.
+
+        Arguments:
+            enabled: True to enable skipping frames without decoding them, False to disable.
+
+        Returns:
+            True if `read` may skip frames without decoding them, False otherwise.
+        """
+        return False
+
     #
     # Abstract Static Methods
     #
@@ -213,6 +276,41 @@ class VideoStream(ABC):
         """
         raise NotImplementedError
 
+    def read_batch(self, num_frames: int, out: Optional[ndarray] = None) -> Union[ndarray, bool]:
+        """ Read up to `num_frames` consecutive frames, stacked into a single array with shape
+        (N, height, width, channels), or (N, height, width) if the output format has a single
+        channel. Fewer frames are returned if the end of the video is reached.
+
+        Backends can override this to decode frames directly into the batch. By default, each
+        frame is read with :py:meth:`read` and copied into the batch.
+
+        Arguments:
+            num_frames: Maximum number of frames to read.
+            out: Array with shape (num_frames, height, width, channels) to store the frames in,
+                to avoid allocating a new one for each batch. If not set, one is allocated.
+
+        Returns:
+            Array of the frames that were read (a view of `out` if set), or False if the end of
+            the video was reached before reading any frames.
+
+        Raises:
+            ValueError: The size of a frame does not match the size of the batch.
+        """
+        num_read = 0
+        while num_read < num_frames:
+            frame = self.read()
+            if frame is False:
+                break
+            if out is None:
+                out = empty((num_frames,) + frame.shape, dtype=frame.dtype)
+            if frame.shape != out.shape[1:]:
+                raise ValueError('Size of frame does not match the size of the batch.')
+            out[num_read] = frame
+            num_read += 1
+        if num_read == 0:
+            return False
+        return out[:num_read]
+
     @abstractmethod
     def reset(self) -> None:
         """ Close and re-open the VideoStream (equivalent to seeking back to beginning). """
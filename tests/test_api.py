@@ -16,14 +16,13 @@ Demonstrates high-level usage of the PySceneDetect API. These tests are provided
 examples of common use cases, and only validate semantic correctness.
 """
 
+import os
 from typing import List, Tuple
 
 from scenedetect import detect, open_video
 from scenedetect import ContentDetector, FrameTimecode, SceneManager, StatsManager
 from scenedetect.backends import VideoStreamCv2
 
-STATS_FILE_PATH = 'api_test_statsfile.csv'
-
 
 def print_scenes(scene_list: List[Tuple[FrameTimecode, FrameTimecode]]):
     """Helper function to print a list of scenes to the terminal."""
@@ -60,7 +59,7 @@ def test_api_start_end_time(test_video_file: str):
     print_scenes(scene_list=scene_list)
 
 
-def test_api_stats_manager(test_video_file: str):
+def test_api_stats_manager(test_video_file: str, tmp_path):
     """Demonstrate using a StatsManager to save per-frame statistics to disk."""
     video = open_video(test_video_file)
     scene_manager = SceneManager(stats_manager=StatsManager())
@@ -69,7 +68,7 @@ def test_api_stats_manager(test_video_file: str):
     scene_list = scene_manager.get_scene_list()
     print_scenes(scene_list=scene_list)
     # Save per-frame statistics to disk.
-    scene_manager.stats_manager.save_to_csv(csv_file=STATS_FILE_PATH)
+    scene_manager.stats_manager.save_to_csv(csv_file=os.path.join(tmp_path, 'stats.csv'))
 
 
 def test_api_video_stream_opencv(test_video_file: str):
@@ -18,7 +18,15 @@ VideoStreamAv ('pyav') backend. These tests validate behaviour specific to this
 For VideoStream tests that validate conformance, see test_video_stream.py.
 """
 
+import math
+import os
+
+import numpy
+import pytest
+
+from scenedetect import SceneManager, StatsManager
 from scenedetect.backends.pyav import VideoStreamAv
+from scenedetect.detectors import ContentDetector
 
 
 def test_video_stream_pyav_bytesio(test_video_file: str):
@@ -30,3 +38,117 @@ def test_video_stream_pyav_bytesio(test_video_file: str):
     stream.seek(50)
     for _ in range(10):
         assert stream.read() is not False
+
+
+def test_video_stream_pyav_output_downscale(test_video_file: str):
+    """Test that VideoStreamAv can downscale frames while decoding."""
+    stream = VideoStreamAv(test_video_file)
+    frame = stream.read()
+    assert stream.set_output_downscale(3)
+    downscaled_frame = stream.read()
+    assert downscaled_frame.shape == (math.ceil(frame.shape[0] / 3), math.ceil(frame.shape[1] / 3),
+                                      3)
+    assert stream.set_output_downscale(1)
+    assert stream.read().shape == frame.shape
+
+
+def test_video_stream_pyav_open_options(test_video_file: str):
+    """Test that `open_options` opens the video again with the same options (as used by each
+    worker process when detecting scenes in parallel)."""
+    stream = VideoStreamAv(test_video_file, threading_mode='AUTO', suppress_output=True)
+    assert stream.open_options['threading_mode'] == 'AUTO'
+    assert stream.open_options['suppress_output']
+    reopened = VideoStreamAv(stream.path, stream.frame_rate, **stream.open_options)
+    assert reopened.open_options == stream.open_options
+    assert numpy.array_equal(reopened.read(), stream.read())
+
+
+class _VideoStreamAvNoOutputDownscale(VideoStreamAv):
+    """VideoStreamAv which leaves downscaling frames to the SceneManager."""
+
+    def set_output_downscale(self, factor: int = 1) -> bool:
+        return factor == 1
+
+
+@pytest.mark.parametrize('downscale', [2, 3, 4])
+def test_video_stream_pyav_output_downscale_metrics(test_video_file: str, downscale: int):
+    """Test that frame metrics are close to those from downscaling full resolution frames in the
+    SceneManager, so stats files and thresholds remain valid. Metrics only match closely when
+    the frame size is a multiple of `downscale` (testvideo.mp4 is 1280x720)."""
+    num_frames = 300
+    frame_scores = []
+    cuts = []
+    for video_type in (VideoStreamAv, _VideoStreamAvNoOutputDownscale):
+        stats_manager = StatsManager()
+        scene_manager = SceneManager(stats_manager)
+        scene_manager.auto_downscale = False
+        scene_manager.downscale = downscale
+        scene_manager.add_detector(ContentDetector())
+        scene_manager.detect_scenes(video=video_type(test_video_file), end_time=num_frames)
+        frame_scores.append(
+            stats_manager.get_metric_range(ContentDetector.FRAME_SCORE_KEY, 1, num_frames))
+        cuts.append(scene_manager.get_cut_list())
+    difference = numpy.abs(frame_scores[0] - frame_scores[1])
+    if 1280 % downscale == 0:
+        assert numpy.max(difference) < 0.5
+        assert numpy.mean(difference) < 0.01 * numpy.mean(frame_scores[1])
+    else:
+        assert numpy.mean(difference) < 0.05 * numpy.mean(frame_scores[1])
+    assert cuts[0] == cuts[1]
+
+
+def test_video_stream_pyav_keyframes_only(test_video_file: str):
+    """Test that VideoStreamAv only returns keyframes when `keyframes_only` is set."""
+    stream = VideoStreamAv(test_video_file, keyframes_only=True)
+    assert stream.keyframes_only
+    frame_numbers = []
+    while stream.read() is not False:
+        frame_numbers.append(stream.frame_number)
+    assert frame_numbers
+    assert frame_numbers == sorted(set(frame_numbers))
+    assert len(frame_numbers) < stream.duration.get_frames()
+
+
+def test_video_stream_pyav_fast_skip(test_video_file: str):
+    """Test that VideoStreamAv still reads every frame with decode = True when fast skipping
+    is enabled, and can advance through the whole video with decode = False."""
+    stream = VideoStreamAv(test_video_file)
+    assert stream.set_fast_skip(True)
+    stream.seek(50)
+    assert stream.frame_number == 50
+    assert stream.read() is not False
+    assert stream.frame_number == 51
+    while stream.read(decode=False):
+        pass
+    assert stream.frame_number > 51
+    assert stream.set_fast_skip(False)
+    stream.seek(50)
+    for i in range(10):
+        assert stream.read() is not False
+        assert stream.frame_number == 51 + i
+
+
+def test_video_stream_pyav_index(test_video_file: str, tmp_path):
+    """Test that seeking using a frame index returns the same frames as decoding linearly, and
+    that the index is cached."""
+    index_dir = str(tmp_path)
+    stream = VideoStreamAv(test_video_file, use_index=True, index_dir=index_dir)
+    assert stream.index is not None
+    assert stream.duration.get_frames() == stream.index.num_frames
+    assert len(os.listdir(index_dir)) == 1
+
+    reference = VideoStreamAv(test_video_file)
+    frames = []
+    for _ in range(200):
+        frames.append(reference.read())
+    # Includes targets behind the current position, as well as ahead in the same GOP.
+    for target in [150, 0, 5, 6, 7, 120, 199, 60]:
+        stream.seek(target)
+        assert stream.frame_number == target
+        assert numpy.array_equal(stream.read(), frames[target])
+        assert stream.frame_number == target + 1
+
+    # Second open should load the cached index.
+    cached = VideoStreamAv(test_video_file, use_index=True, index_dir=index_dir)
+    assert numpy.array_equal(cached.index.pts, stream.index.pts)
+    assert numpy.array_equal(cached.index.keyframe_nums, stream.index.keyframe_nums)
@@ -11,10 +11,13 @@
 # included LICENSE file, or visit one of the above pages for details.
 #
 
+import os
 from typing import Optional
 import subprocess
 import pytest
 
+from scenedetect.stats_manager import StatsManager
+
 # These tests validate that the CLI itself functions correctly, mainly based on the return
 # return code from the process. We do not yet check for correctness of the output, just a
 # successful invocation of the command (i.e. no exceptions/errors).
@@ -128,6 +131,88 @@ def test_cli_detector_with_stats(tmp_path, detector_command: str):
     # and ensuring that we got some frames.
 
 
+def test_cli_binary_stats(tmp_path):
+    """Test writing a binary stats file with -s/--stats."""
+    assert invoke_scenedetect(
+        '-i {VIDEO} -s {STATS} time {TIME} {DETECTOR}',
+        output_dir=tmp_path,
+        STATS='statsfile.stats') == 0
+    stats_manager = StatsManager()
+    assert stats_manager.load_from_binary(os.path.join(tmp_path, 'statsfile.stats'))
+    assert 'content_val' in stats_manager._loaded_metrics
+
+
+def test_cli_stats_cache(tmp_path):
+    """Test caching frame metrics with --stats-cache."""
+    cache_dir = os.path.join(tmp_path, 'cache')
+    config_file = os.path.join(tmp_path, 'scenedetect.cfg')
+    with open(config_file, 'w') as file:
+        file.write('[global]\nstats-cache-dir = %s\n' % cache_dir)
+    for threshold in (27, 15):
+        assert invoke_scenedetect(
+            '-i {VIDEO} --stats-cache time {TIME} detect-content -t %d' % threshold,
+            config_file=config_file) == 0
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_cli_stats_only(tmp_path):
+    """Test detecting scenes from an existing stats file with --stats-only."""
+    assert invoke_scenedetect(
+        '-i {VIDEO} -s {STATS} --stats-only {DETECTOR}', output_dir=tmp_path) != 0
+    assert invoke_scenedetect(
+        '-i {VIDEO} -s {STATS} time {TIME} {DETECTOR}', output_dir=tmp_path) == 0
+    assert invoke_scenedetect(
+        '-i {VIDEO} -s {STATS} --stats-only time {TIME} detect-content -t 15 list-scenes',
+        output_dir=tmp_path) == 0
+
+
+def test_cli_stats_only_binary(tmp_path):
+    """Test that --stats-only does not rewrite a binary stats file, even if detectors add new
+    metrics (e.g. `adaptive_ratio` with a different window width)."""
+    stats_path = os.path.join(tmp_path, 'stats.stats')
+    assert invoke_scenedetect(
+        '-i {VIDEO} -s {STATS} time {TIME} detect-adaptive', STATS=stats_path) == 0
+    with open(stats_path, 'rb') as file:
+        stats_data = file.read()
+    for _ in range(2):
+        assert invoke_scenedetect(
+            '-i {VIDEO} -s {STATS} --stats-only time {TIME} detect-adaptive -w 3 list-scenes -n',
+            STATS=stats_path) == 0
+        with open(stats_path, 'rb') as file:
+            assert file.read() == stats_data
+
+
+def test_cli_sweep(tmp_path):
+    """Test `sweep` command."""
+    cuts_file = tmp_path.joinpath('cuts.txt')
+    cuts_file.write_text('# Expected cuts\n90, 00:00:06.006\n')
+    assert invoke_scenedetect(
+        '-i {VIDEO} time {TIME} detect-content sweep -t 20:30:5 -m 0,0.5s -g %s' % cuts_file,
+        output_dir=tmp_path) == 0
+    assert os.path.exists(os.path.join(tmp_path, 'goldeneye-Sweep.csv'))
+    assert invoke_scenedetect(
+        '-i {VIDEO} time {TIME} detect-adaptive sweep -t 2,3 -n', output_dir=tmp_path) == 0
+    # Invalid ranges, and frame skip (sweeping requires the metrics of every frame).
+    assert invoke_scenedetect('-i {VIDEO} time {TIME} {DETECTOR} sweep -t 30:20:5') != 0
+    assert invoke_scenedetect('-i {VIDEO} -fs 1 time {TIME} {DETECTOR} sweep -t 20,30') != 0
+
+
+def test_cli_auto_threshold():
+    """Test -a/--auto-threshold option of detectors."""
+    assert invoke_scenedetect('-i {VIDEO} time {TIME} detect-content -a 99%') == 0
+    assert invoke_scenedetect('-i {VIDEO} time {TIME} detect-content -a 10/min') == 0
+    assert invoke_scenedetect('-i {VIDEO} time {TIME} detect-threshold -a 5%') == 0
+    assert invoke_scenedetect('-i {VIDEO} time {TIME} detect-threshold -a 10/min') != 0
+    assert invoke_scenedetect('-i {VIDEO} time {TIME} detect-content -a 101%') != 0
+    assert invoke_scenedetect('-i {VIDEO} time {TIME} detect-content -a 10') != 0
+
+
+def test_cli_detect_threshold_luma_only(tmp_path):
+    """Test --luma-only option of detect-threshold, which decodes frames in greyscale."""
+    assert invoke_scenedetect(
+        '-i {VIDEO} -s {STATS} time {TIME} detect-threshold --luma-only', output_dir=tmp_path) == 0
+
+
 def test_cli_time():
     """Test `time` command."""
     # TODO: Add test for timecode formats.
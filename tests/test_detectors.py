@@ -19,9 +19,15 @@ test case material.
 
 import time
 
+import cv2
+import numpy
+import pytest
+
 from scenedetect import detect, SceneManager, FrameTimecode, StatsManager
 from scenedetect.detectors import AdaptiveDetector, ContentDetector, ThresholdDetector
+from scenedetect.detectors.content_detector import calculate_frame_score
 from scenedetect.backends.opencv import VideoStreamCv2
+from scenedetect.scene_detector import AutoThreshold, FrameCache
 
 # TODO(v1.0): Parameterize these tests like VideoStreams are.
 # Current test output cannot be used for profiling cases which iterate over multiple detectors.
@@ -74,10 +80,9 @@ def test_adaptive_detector(test_movie_clip):
     video = VideoStreamCv2(test_movie_clip)
     scene_manager = SceneManager()
     assert scene_manager.stats_manager is None
-    # The SceneManager should implicitly create a StatsManager since this
-    # detector requires it.
+    # AdaptiveDetector keeps the metrics it needs, so a StatsManager should not be created.
     scene_manager.add_detector(AdaptiveDetector())
-    assert scene_manager.stats_manager is not None
+    assert scene_manager.stats_manager is None
     scene_manager.auto_downscale = True
 
     video_fps = video.frame_rate
@@ -143,3 +148,221 @@ def test_detectors_with_stats(test_video_file):
         print("No Stats:\t%2.1fs" % time_no_stats)
         print("With Stats:\t%2.1fs" % time_with_stats)
         print("--------------------------------------------------------------------")
+
+
+def test_content_detector_frame_score():
+    """ Test that calculate_frame_score gives the exact average difference of each channel,
+    regardless of whether frames are split into channels or not. """
+    rng = numpy.random.default_rng(0)
+    frames = [rng.integers(0, 256, size=(45, 80, 3), dtype=numpy.uint8) for _ in range(2)]
+    expected = [
+        numpy.sum(numpy.abs(frames[0][:, :, i].astype(int) - frames[1][:, :, i].astype(int))) /
+        float(45 * 80) for i in range(3)
+    ]
+    expected.append(sum(expected) / 3.0)
+    assert calculate_frame_score(frames[0], frames[1]) == tuple(expected)
+    assert calculate_frame_score(cv2.split(frames[0]), cv2.split(frames[1])) == tuple(expected)
+    assert calculate_frame_score(frames[0], frames[1],
+                                 numpy.empty_like(frames[0])) == tuple(expected)
+
+
+def test_content_detector_partial_stats(test_video_file):
+    """ Test that ContentDetector calculates the same metrics when only some of them were loaded
+    from a StatsManager. """
+    end_time = 200
+    video = VideoStreamCv2(test_video_file)
+    stats = StatsManager()
+    scene_manager = SceneManager(stats_manager=stats)
+    scene_manager.add_detector(ContentDetector())
+    scene_manager.detect_scenes(video=video, end_time=end_time)
+    metric_keys = ContentDetector.METRIC_KEYS
+
+    # Remove metrics for some ranges of frames, which must be re-calculated.
+    partial_stats = StatsManager()
+    for frame_num in range(1, end_time + 1):
+        if not (20 <= frame_num < 60 or 100 <= frame_num < 150):
+            partial_stats.set_metrics(
+                frame_num, dict(zip(metric_keys, stats.get_metrics(frame_num, metric_keys))))
+    video.reset()
+    scene_manager = SceneManager(stats_manager=partial_stats)
+    scene_manager.add_detector(ContentDetector())
+    scene_manager.detect_scenes(video=video, end_time=end_time)
+
+    for frame_num in range(1, end_time + 1):
+        assert partial_stats.get_metrics(frame_num,
+                                         metric_keys) == stats.get_metrics(frame_num, metric_keys)
+
+
+def test_content_detector_luma_only(test_video_file):
+    """ Test that ContentDetector only calculates the luma channel when `luma_only` is set,
+    and that the result is the same as when all channels are calculated. """
+    end_time = 200
+    video = VideoStreamCv2(test_video_file)
+    stats = StatsManager()
+    scene_manager = SceneManager(stats_manager=stats)
+    scene_manager.add_detector(ContentDetector())
+    scene_manager.detect_scenes(video=video, end_time=end_time)
+
+    video.reset()
+    luma_stats = StatsManager()
+    scene_manager = SceneManager(stats_manager=luma_stats)
+    detector = ContentDetector(luma_only=True)
+    assert detector.get_metrics() == ['delta_lum']
+    scene_manager.add_detector(detector)
+    scene_manager.detect_scenes(video=video, end_time=end_time)
+
+    for frame_num in range(1, end_time + 1):
+        assert not luma_stats.metrics_exist(frame_num, ['content_val'])
+        assert luma_stats.get_metrics(frame_num,
+                                      ['delta_lum']) == stats.get_metrics(frame_num, ['delta_lum'])
+
+
+def test_content_detector_weights():
+    """ Test validation and metric names of ContentDetector weights. """
+    with pytest.raises(ValueError):
+        ContentDetector(weights=(0.0, 0.0, 0.0))
+    with pytest.raises(ValueError):
+        ContentDetector(weights=(1.0, -1.0, 1.0))
+    assert ContentDetector().frame_score_key == 'content_val'
+    assert ContentDetector(weights=(0.0, 1.0, 0.0)).get_metrics() == ['delta_sat']
+    detector = ContentDetector(weights=(1.0, 0.0, 0.5))
+    assert detector.frame_score_key == 'content_val (h=1 s=0 l=0.5)'
+    assert detector.get_metrics() == [detector.frame_score_key, 'delta_hue', 'delta_lum']
+
+
+def test_adaptive_detector_streaming(test_video_file):
+    """ Test that AdaptiveDetector reports cuts while processing frames, `window_width + 1`
+    frames after they occur, and that the results are the same with a StatsManager. """
+    window_width = 3
+    video = VideoStreamCv2(test_video_file)
+    detector = AdaptiveDetector(window_width=window_width)
+    cuts = []
+    while True:
+        frame_img = video.read()
+        if frame_img is False:
+            break
+        frame_num = video.frame_number - 1
+        for cut in detector.process_frame(frame_num, frame_img):
+            assert frame_num - cut == window_width + 1 == detector.event_buffer_length
+            cuts.append(cut)
+    assert detector.post_process(frame_num) == []
+    assert cuts
+
+    video.reset()
+    scene_manager = SceneManager(stats_manager=StatsManager())
+    scene_manager.add_detector(AdaptiveDetector(window_width=window_width))
+    scene_manager.detect_scenes(video=video)
+    assert [start.get_frames() for start, _ in scene_manager.get_scene_list()][1:] == cuts
+
+
+@pytest.mark.parametrize('detector_type,auto_threshold',
+                         [(ContentDetector, AutoThreshold(percentile=99.0)),
+                          (ContentDetector, AutoThreshold(cuts_per_minute=15.0, frame_rate=30.0)),
+                          (ThresholdDetector, AutoThreshold(percentile=5.0))])
+def test_detectors_auto_threshold(test_video_file, detector_type, auto_threshold):
+    """ Test that detectors with an `auto_threshold` find the same cuts as they do when the
+    threshold they chose is set directly. """
+    end_time = 400
+    video = VideoStreamCv2(test_video_file)
+    scene_manager = SceneManager()
+    detector = detector_type(auto_threshold=auto_threshold)
+    scene_manager.add_detector(detector)
+    scene_manager.detect_scenes(video=video, end_time=end_time)
+    cuts = scene_manager.get_cut_list()
+    assert cuts
+    if auto_threshold.cuts_per_minute is not None:
+        # 15 cuts per minute of 401 frames at 30 FPS.
+        assert len(cuts) <= 3
+
+    video.reset()
+    scene_manager = SceneManager()
+    scene_manager.add_detector(detector_type(threshold=detector.threshold))
+    scene_manager.detect_scenes(video=video, end_time=end_time)
+    assert scene_manager.get_cut_list() == cuts
+
+
+def test_auto_threshold():
+    """ Test AutoThreshold validation and calculation. """
+    with pytest.raises(ValueError):
+        AutoThreshold()
+    with pytest.raises(ValueError):
+        AutoThreshold(percentile=50.0, cuts_per_minute=1.0, frame_rate=30.0)
+    with pytest.raises(ValueError):
+        AutoThreshold(cuts_per_minute=1.0)
+    with pytest.raises(ValueError):
+        ThresholdDetector(auto_threshold=AutoThreshold(cuts_per_minute=1.0, frame_rate=30.0))
+    frame_scores = numpy.array([numpy.nan, 1.0, 2.0, 3.0, 4.0])
+    assert AutoThreshold(percentile=50.0).calculate(frame_scores, 5) == 2.5
+    # 60 cuts per minute at 1 FPS is one cut per frame.
+    auto_threshold = AutoThreshold(cuts_per_minute=60.0, frame_rate=1.0)
+    count_cuts = lambda threshold: int(numpy.sum(frame_scores >= threshold))
+    assert auto_threshold.calculate(frame_scores, 2, count_cuts) == 3.0
+    assert auto_threshold.calculate(frame_scores, 0, count_cuts) > 4.0
+    assert auto_threshold.calculate(frame_scores[:1], 1, count_cuts) is None
+
+
+def test_detectors_frame_cache(test_video_file):
+    """ Test that detectors sharing a FrameCache find the same cuts and metrics as when each
+    detector processes the video by itself. """
+    create_detectors = lambda: [
+        ContentDetector(),
+        ContentDetector(threshold=15.0),
+        ContentDetector(luma_only=True),
+        AdaptiveDetector(),
+        ThresholdDetector()
+    ]
+    end_time = 300
+
+    video = VideoStreamCv2(test_video_file)
+    shared_stats = StatsManager()
+    scene_manager = SceneManager(shared_stats)
+    detectors = create_detectors()
+    for detector in detectors:
+        scene_manager.add_detector(detector)
+    assert all(detector.frame_cache is detectors[0].frame_cache for detector in detectors)
+    scene_manager.detect_scenes(video=video, end_time=end_time)
+    shared_cuts = scene_manager.get_cut_list()
+
+    expected_cuts = []
+    for detector in create_detectors():
+        video.reset()
+        stats = StatsManager()
+        scene_manager = SceneManager(stats)
+        scene_manager.add_detector(detector)
+        scene_manager.detect_scenes(video=video, end_time=end_time)
+        expected_cuts += scene_manager.get_cut_list()
+        for frame_num in range(end_time):
+            assert shared_stats.get_metrics(frame_num, detector.get_metrics()) == (
+                stats.get_metrics(frame_num, detector.get_metrics()))
+    assert shared_cuts == sorted(set(expected_cuts))
+
+
+def test_frame_cache():
+    """ Test that values are only calculated once for each frame. """
+    frame_cache = FrameCache()
+    frame_img = numpy.zeros((4, 4, 3), dtype=numpy.uint8)
+    frame_img[0, 0] = (10, 20, 30)
+    assert not frame_cache.holds(0, frame_img)
+    with pytest.raises(ValueError):
+        frame_cache.hsv()
+
+    frame_cache.set_frame(0, frame_img)
+    assert frame_cache.holds(0, frame_img)
+    assert not frame_cache.holds(1, frame_img)
+    assert not frame_cache.holds(0, frame_img.copy())
+    hsv = frame_cache.hsv()
+    assert numpy.array_equal(hsv, cv2.cvtColor(frame_img, cv2.COLOR_BGR2HSV))
+    assert frame_cache.hsv() is hsv
+    assert frame_cache.luma()[0, 0] == 30
+    assert frame_cache.mean() == pytest.approx(60.0 / 48.0)
+    calls = []
+    calculate = lambda frame_img: calls.append(frame_img) or len(calls)
+    assert frame_cache.get('test', calculate) == 1
+    assert frame_cache.get('test', calculate) == 1
+
+    # The HSV image of the previous frame is kept until the frame after next.
+    frame_cache.set_frame(1, frame_img)
+    assert frame_cache.hsv() is not hsv
+    assert frame_cache.get('test', calculate) == 2
+    frame_cache.set_frame(2, frame_img)
+    assert frame_cache.hsv() is hsv
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+#         PySceneDetect: Python-Based Video Scene Detector
+#   ---------------------------------------------------------------
+#     [  Site:   http://www.scenedetect.scenedetect.com/         ]
+#     [  Docs:   http://manual.scenedetect.scenedetect.com/      ]
+#     [  Github: https://github.com/Breakthrough/PySceneDetect/  ]
+#
+# Copyright (C) 2014-2022 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+""" PySceneDetect scenedetect.prefilter Tests
+
+This file includes unit tests for the scenedetect.prefilter module, which finds likely scene
+changes from packet sizes and keyframe placement so that only frames near them are decoded.
+"""
+
+import numpy
+import pytest
+
+from scenedetect import SceneManager, StatsManager
+from scenedetect.backends.frame_index import FrameIndex
+from scenedetect.backends.opencv import VideoStreamCv2
+from scenedetect.detectors import ContentDetector
+from scenedetect.prefilter import Prefilter, find_candidates, score_frames
+
+NUM_FRAMES = 300
+KEYFRAME_INTERVAL = 100
+
+
+def _make_index(inserted_keyframes=(), size_spikes=()):
+    """Make an index with keyframes at a regular interval, which restarts after each inserted
+    keyframe (like x264), and with larger packets for each frame in `size_spikes`."""
+    keyframe = numpy.zeros(NUM_FRAMES, dtype=bool)
+    frame_num = 0
+    for inserted in sorted(inserted_keyframes) + [NUM_FRAMES]:
+        keyframe[frame_num:inserted:KEYFRAME_INTERVAL] = True
+        frame_num = inserted
+    packet_size = numpy.full(NUM_FRAMES, 1000, dtype=numpy.int64)
+    packet_size[keyframe] = 20000
+    packet_size[list(size_spikes)] = 5000
+    return FrameIndex(
+        pts=numpy.arange(NUM_FRAMES, dtype=numpy.int64), keyframe=keyframe, packet_size=packet_size)
+
+
+def test_score_frames():
+    """ Test that frames are scored relative to the non-keyframes around them. """
+    scores = score_frames(_make_index(size_spikes=[50]))
+    assert scores[50] == pytest.approx(5.0)
+    assert scores[51] == pytest.approx(1.0)
+    # Keyframes are always large, so they are excluded.
+    assert scores[0] == 0.0 and scores[100] == 0.0
+
+
+def test_score_frames_intra_only():
+    """ Test that frames are scored when every frame is a keyframe. """
+    index = _make_index(size_spikes=[50])
+    index = FrameIndex(index.pts, numpy.ones(NUM_FRAMES, dtype=bool), index.packet_size)
+    scores = score_frames(index)
+    assert numpy.count_nonzero(scores) == NUM_FRAMES
+    assert scores[50] == pytest.approx(5.0)
+
+
+def test_find_candidates():
+    """ Test that inserted keyframes and size spikes are candidates, but regular keyframes are
+    not. """
+    index = _make_index(inserted_keyframes=[130], size_spikes=[50, 220])
+    assert index.keyframe_nums.tolist() == [0, 100, 130, 230]
+    assert find_candidates(index).tolist() == [50, 130, 220]
+    assert find_candidates(index, size_ratio=10.0).tolist() == [130]
+
+
+def test_prefilter_windows():
+    """ Test that overlapping windows around each candidate are merged. """
+    index = _make_index(inserted_keyframes=[130], size_spikes=[2, 50, 56])
+    prefilter = Prefilter(margin=5)
+    assert prefilter.get_windows(index) == [(0, 8), (45, 62), (125, 136)]
+    with pytest.raises(ValueError):
+        Prefilter(size_ratio=1.0)
+    with pytest.raises(ValueError):
+        Prefilter(margin=0)
+
+
+def test_prefilter_detect_scenes(test_video_file, tmp_path):
+    """ Test that only frames near candidates are decoded, and the cuts found are among those
+    found when decoding every frame. """
+    cuts = {}
+    num_decoded = {}
+    for prefilter in (None, Prefilter(index_dir=str(tmp_path))):
+        stats_manager = StatsManager()
+        scene_manager = SceneManager(stats_manager)
+        scene_manager.prefilter = prefilter
+        scene_manager.add_detector(ContentDetector())
+        num_frames = scene_manager.detect_scenes(video=VideoStreamCv2(test_video_file))
+        cuts[prefilter is not None] = [cut.get_frames() for cut in scene_manager.get_cut_list()]
+        num_decoded[prefilter is not None] = numpy.count_nonzero(
+            stats_manager.metrics_exist_range([ContentDetector.FRAME_SCORE_KEY], 0, num_frames))
+    assert num_decoded[True] < num_decoded[False] // 2
+    assert cuts[True]
+    assert set(cuts[True]) <= set(cuts[False])
@@ -27,9 +27,11 @@ from typing import Iterable, Tuple
 import pytest
 
 from scenedetect.backends.opencv import VideoStreamCv2
-from scenedetect.detectors import ContentDetector
+from scenedetect.detectors import AdaptiveDetector, ContentDetector, ThresholdDetector
 from scenedetect.frame_timecode import FrameTimecode
 from scenedetect.scene_manager import SceneManager, save_images
+from scenedetect.stats_cache import StatsCache
+from scenedetect.stats_manager import StatsManager
 
 
 def test_scene_list(test_video_file):
@@ -166,3 +168,241 @@ def test_detect_scenes_callback(test_video_file):
     scene_list = sm.get_scene_list()
     assert scene_list
     assert fake_callback.num_invoked == (len(sm.get_scene_list()) - 1)
+
+
+def test_detect_scenes_workers(test_video_file):
+    """ Test SceneManager detect_scenes method produces the same results when split across
+    multiple worker processes. """
+    results = []
+    for workers in (1, 2):
+        video = VideoStreamCv2(test_video_file)
+        sm = SceneManager(StatsManager())
+        sm.add_detector(ContentDetector())
+        start_time = FrameTimecode('00:00:02', video.frame_rate)
+        video.seek(start_time)
+        num_frames = sm.detect_scenes(video=video, workers=workers)
+        metrics = [
+            sm.stats_manager.get_metrics(frame_num, ContentDetector.METRIC_KEYS)
+            for frame_num in range(start_time.get_frames(), video.frame_number)
+        ]
+        results.append((num_frames, video.frame_number, sm.get_scene_list(), metrics))
+    assert results[0][2]
+    assert results[0] == results[1]
+
+
+def test_detect_scenes_detector_threads(test_video_file):
+    """ Test SceneManager detect_scenes method produces the same results when running detectors
+    on each frame in parallel. """
+    results = []
+    for detector_threads in (1, 3):
+        video = VideoStreamCv2(test_video_file)
+        sm = SceneManager(StatsManager())
+        sm.detector_threads = detector_threads
+        detectors = [ContentDetector(), ContentDetector(threshold=15.0), ThresholdDetector()]
+        for detector in detectors:
+            sm.add_detector(detector)
+        callback_frames = []
+        num_frames = sm.detect_scenes(
+            video=video,
+            end_time=400,
+            callback=lambda frame_im, frame_num: callback_frames.append(frame_num))
+        metric_keys = [key for detector in detectors for key in detector.get_metrics()]
+        metrics = [
+            sm.stats_manager.get_metrics(frame_num, metric_keys) for frame_num in range(num_frames)
+        ]
+        results.append((num_frames, sm.get_cut_list(), callback_frames, metrics))
+    assert results[0][1]
+    assert results[0] == results[1]
+    with pytest.raises(ValueError):
+        sm.detector_threads = 0
+
+
+def test_detect_scenes_decode_process(test_video_file):
+    """ Test SceneManager detect_scenes method produces the same results when decoding frames in
+    a separate process. """
+    results = []
+    for decode_process in (False, True):
+        video = VideoStreamCv2(test_video_file)
+        sm = SceneManager(StatsManager())
+        sm.decode_process = decode_process
+        sm.add_detector(ContentDetector())
+        start_time = FrameTimecode('00:00:02', video.frame_rate)
+        video.seek(start_time)
+        num_frames = sm.detect_scenes(video=video, end_time=600)
+        metrics = [
+            sm.stats_manager.get_metrics(frame_num, ContentDetector.METRIC_KEYS)
+            for frame_num in range(start_time.get_frames(), video.frame_number)
+        ]
+        results.append((num_frames, video.frame_number, sm.get_scene_list(), metrics))
+    assert results[0][2]
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize('detector_type,detector_args', [
+    (ContentDetector, {}),
+    (ContentDetector, {
+        'luma_only': True
+    }),
+    (AdaptiveDetector, {}),
+    (ThresholdDetector, {}),
+])
+def test_detect_scenes_batch_size(test_video_file, detector_type, detector_args):
+    """ Test SceneManager detect_scenes method produces the same results when processing frames
+    in batches, including when the last batch is partial. """
+    results = []
+    for batch_size in (1, 16):
+        video = VideoStreamCv2(test_video_file)
+        sm = SceneManager(StatsManager())
+        sm.batch_size = batch_size
+        detector = detector_type(**detector_args)
+        sm.add_detector(detector)
+        start_time = FrameTimecode('00:00:02', video.frame_rate)
+        video.seek(start_time)
+        num_frames = sm.detect_scenes(video=video, end_time=600)
+        metrics = [
+            sm.stats_manager.get_metrics(frame_num, detector.get_metrics())
+            for frame_num in range(start_time.get_frames(), video.frame_number)
+        ]
+        results.append((num_frames, video.frame_number, sm.get_scene_list(), metrics))
+    assert results[0][2]
+    assert results[0] == results[1]
+    with pytest.raises(ValueError):
+        sm.batch_size = 0
+
+
+def test_detect_scenes_pixel_format(test_video_file):
+    """ Test SceneManager detect_scenes method produces the same results when frames are decoded
+    in the pixel format requested by detectors (greyscale for a luma-only ThresholdDetector), as
+    when they are decoded in BGR and converted by the detector. """
+    results = []
+    # Frames are always decoded in BGR when a callback is set.
+    for callback in (None, lambda frame_img, frame_num: None):
+        for batch_size in (1, 16):
+            video = VideoStreamCv2(test_video_file)
+            sm = SceneManager(StatsManager())
+            sm.batch_size = batch_size
+            detector = ThresholdDetector(threshold=100, luma_only=True)
+            sm.add_detector(detector)
+            num_frames = sm.detect_scenes(video=video, end_time=600, callback=callback)
+            metrics = [
+                sm.stats_manager.get_metrics(frame_num, detector.get_metrics())
+                for frame_num in range(num_frames)
+            ]
+            results.append((num_frames, sm.get_scene_list(), metrics))
+            # Frames read after detection are in BGR again.
+            assert video.read().ndim == 3
+    assert len(results[0][1]) > 1
+    assert all(result == results[0] for result in results)
+
+
+def test_detect_scenes_stats_cache(test_video_file, tmp_path):
+    """ Test SceneManager detect_scenes method loads frame metrics from a StatsCache, and saves
+    the metrics of each detector to it. """
+    end_time = 200
+    stats_cache = StatsCache(str(tmp_path))
+    for threshold in (27.0, 15.0):
+        video = VideoStreamCv2(test_video_file)
+        sm = SceneManager(StatsManager())
+        sm.add_detector(ContentDetector(threshold=threshold))
+        sm.detect_scenes(video=video, end_time=end_time)
+        expected = sm.get_scene_list()
+
+        video.reset()
+        sm = SceneManager(stats_cache=stats_cache)
+        sm.add_detector(ContentDetector(threshold=threshold))
+        sm.detect_scenes(video=video, end_time=end_time)
+        assert sm.get_scene_list() == expected
+        # A temporary StatsManager is used if none was provided.
+        assert sm.stats_manager is None
+
+    cache_path = stats_cache.get_path(video, sm._get_downscale_factor(video))
+    assert os.listdir(str(tmp_path)) == [os.path.basename(cache_path)]
+    cached = StatsManager()
+    cached.load_from_binary(cache_path)
+    assert cached.metrics_exist_range(ContentDetector.METRIC_KEYS, 1, end_time + 1).all()
+
+    # Metrics loaded from the cache are not recalculated.
+    video.reset()
+    stats = StatsManager()
+    assert stats_cache.load(cache_path, stats, ContentDetector.METRIC_KEYS) == 4 * end_time
+    sm = SceneManager(stats, stats_cache=stats_cache)
+    sm.add_detector(ContentDetector())
+    stats._metrics_updated = False
+    sm.detect_scenes(video=video, end_time=end_time)
+    assert not stats.is_save_required()
+
+    # Metrics of other detectors are added to the same file.
+    video.reset()
+    sm = SceneManager(stats_cache=stats_cache)
+    sm.add_detector(ThresholdDetector())
+    sm.detect_scenes(video=video, end_time=end_time)
+    assert os.listdir(str(tmp_path)) == [os.path.basename(cache_path)]
+    cached = StatsManager()
+    cached.load_from_binary(cache_path)
+    assert cached.metrics_exist_range(
+        ContentDetector.METRIC_KEYS + ThresholdDetector().get_metrics(), 1, end_time + 1).all()
+
+
+def test_detect_scenes_stats_only(test_video_file):
+    """ Test SceneManager detect_scenes method produces the same results from only the frame
+    metrics in a StatsManager, without decoding any frames. """
+    for detector_type in (ContentDetector, ThresholdDetector, AdaptiveDetector):
+        for end_time in (None, 200):
+            video = VideoStreamCv2(test_video_file)
+            stats = StatsManager()
+            sm = SceneManager(stats)
+            sm.add_detector(detector_type())
+            num_frames = sm.detect_scenes(video=video, end_time=end_time)
+            expected = sm.get_scene_list()
+
+            video.reset()
+            sm = SceneManager(stats)
+            sm.add_detector(detector_type())
+            assert sm.detect_scenes(video=video, end_time=end_time, stats_only=True) == num_frames
+            assert sm.get_scene_list() == expected
+            assert video.frame_number == 0
+
+    # Frame metrics must exist for every frame.
+    sm = SceneManager(StatsManager())
+    sm.add_detector(ContentDetector())
+    with pytest.raises(ValueError):
+        sm.detect_scenes(video=video, stats_only=True)
+    sm.stats_manager.update(stats, ContentDetector.METRIC_KEYS)
+    sm.stats_manager.set_metrics(300, {key: 0.0 for key in ContentDetector.METRIC_KEYS})
+    with pytest.raises(ValueError):
+        sm.detect_scenes(video=video, stats_only=True)
+
+
+def test_detect_scenes_partial_stats(test_video_file):
+    """ Test SceneManager detect_scenes method only decodes frames which are missing metrics in
+    the StatsManager (and the frames before them), and seeks past the rest. """
+
+    class CountingVideoStream(VideoStreamCv2):
+        """VideoStreamCv2 which counts the number of frames decoded."""
+        decoded_frames = 0
+
+        def read(self, decode: bool = True, advance: bool = True):
+            frame = super().read(decode, advance)
+            if decode and frame is not False:
+                self.decoded_frames += 1
+            return frame
+
+    video = VideoStreamCv2(test_video_file)
+    stats = StatsManager()
+    sm = SceneManager(stats)
+    sm.add_detector(ContentDetector())
+    sm.detect_scenes(video=video)
+    expected = sm.get_scene_list()
+
+    partial_stats = StatsManager()
+    partial_stats.update(stats)
+    for frame_num in range(300, 350):
+        partial_stats._column_set['content_val'][frame_num - partial_stats._frame_offset] = False
+    video = CountingVideoStream(test_video_file)
+    sm = SceneManager(partial_stats)
+    sm.add_detector(ContentDetector())
+    sm.detect_scenes(video=video)
+    assert sm.get_scene_list() == expected
+    assert partial_stats.metrics_exist_range(['content_val'], 1, video.frame_number).all()
+    # The first and last frames, and the frames missing metrics (plus the one before them).
+    assert video.decoded_frames == 2 + 51
@@ -35,6 +35,7 @@ import csv
 import os
 import random
 
+import numpy
 import pytest
 
 from scenedetect.scene_manager import SceneManager
@@ -98,6 +99,29 @@ def test_metrics():
         frame_key, metric_keys) == [metric_dict[metric_key] for metric_key in metric_keys]
 
 
+def test_metric_range():
+    """ Test querying metrics for a range of frames, including frames set out of order and
+    outside of the range stored by the StatsManager. """
+    stats = StatsManager()
+    stats.register_metrics(['a', 'b'])
+    for frame_num in (5000, 10, 3, 12):
+        stats.set_metrics(frame_num, {'a': frame_num / 2.0})
+    stats.set_metrics(10, {'b': 1.0})
+
+    assert stats.get_metrics(3, ['a']) == [1.5]
+    assert stats.get_metrics(5000, ['a', 'b']) == [2500.0, None]
+    assert stats.get_metrics(4, ['a']) == [None]
+    values = stats.get_metric_range('a', 0, 15)
+    assert values.shape == (15,)
+    assert numpy.flatnonzero(~numpy.isnan(values)).tolist() == [3, 10, 12]
+    assert values[[3, 10, 12]].tolist() == [1.5, 5.0, 6.0]
+    assert numpy.isnan(stats.get_metric_range('b', 20, 30)).all()
+    assert numpy.isnan(stats.get_metric_range('c', 0, 5)).all()
+    assert numpy.flatnonzero(stats.metrics_exist_range(['a'], 4990, 6000)).tolist() == [10]
+    assert numpy.flatnonzero(stats.metrics_exist_range(['a', 'b'], 0, 15)).tolist() == [10]
+    assert not stats.metrics_exist_range(['a'], -10, 0).any()
+
+
 def test_detector_metrics(test_video_file):
     """ Test passing StatsManager to a SceneManager and using it for storing the frame metrics
     from a ContentDetector.
@@ -118,10 +142,11 @@ def test_detector_metrics(test_video_file):
     scene_manager.detect_scenes(video=video, duration=duration)
 
     # Check that metrics were written to the StatsManager.
-    assert stats_manager._frame_metrics
-    frame_key = min(stats_manager._frame_metrics.keys())
-    assert stats_manager._frame_metrics[frame_key]
-    assert stats_manager.metrics_exist(frame_key, list(stats_manager._registered_metrics))
+    metric_keys = list(stats_manager._registered_metrics)
+    frames_with_metrics = stats_manager.metrics_exist_range(metric_keys, 0, duration.frame_num)
+    assert frames_with_metrics.any()
+    frame_key = int(numpy.flatnonzero(frames_with_metrics)[0])
+    assert stats_manager.metrics_exist(frame_key, metric_keys)
 
     # Since we only added 1 detector, the number of metrics from get_metrics
     # should equal the number of metric keys in _registered_metrics.
@@ -194,8 +219,9 @@ def test_save_load_from_video(test_video_file):
     stats_manager_new.load_from_csv(TEST_STATS_FILES[0])
 
     # Choose the first available frame key and compare all metrics in both.
-    frame_key = min(stats_manager._frame_metrics.keys())
     metric_keys = list(stats_manager._registered_metrics)
+    frame_key = int(
+        numpy.flatnonzero(stats_manager.metrics_exist_range(metric_keys, 0, duration.frame_num))[0])
 
     assert stats_manager.metrics_exist(frame_key, metric_keys)
     orig_metrics = stats_manager.get_metrics(frame_key, metric_keys)
@@ -231,3 +257,146 @@ def test_load_corrupt_stats():
 
         with pytest.raises(StatsFileCorrupt):
             stats_manager.load_from_csv(TEST_STATS_FILES[0])
+
+
+def test_save_load_binary(tmp_path):
+    """ Test saving metrics to a binary stats file, and that loading it (and converting it to and
+    from a CSV file) gives back the same metrics. """
+    metric_keys = ['some_metric', 'another_metric']
+    stats_manager = StatsManager(FrameTimecode(0, 29.97))
+    stats_manager.register_metrics(metric_keys)
+    for frame_num in range(10, 200):
+        stats_manager.set_metrics(frame_num, {'some_metric': frame_num / 3.0})
+        if frame_num % 2:
+            stats_manager.set_metrics(frame_num, {'another_metric': -frame_num / 7.0})
+
+    binary_path = str(tmp_path.joinpath('stats.stats'))
+    stats_manager.save_to_binary(binary_path)
+    loaded = StatsManager()
+    assert loaded.load_from_binary(binary_path) == 190
+    assert not loaded.is_save_required()
+    for frame_num in range(0, 210):
+        assert loaded.get_metrics(frame_num,
+                                  metric_keys) == stats_manager.get_metrics(frame_num, metric_keys)
+    # Metrics can still be modified after loading.
+    loaded.set_metrics(300, {'some_metric': 1.0})
+    assert loaded.get_metrics(300, ['some_metric']) == [1.0]
+
+    # Convert to CSV and back to make sure no precision is lost.
+    csv_path = str(tmp_path.joinpath('stats.csv'))
+    stats_manager.save_to_csv(csv_path)
+    from_csv = StatsManager(FrameTimecode(0, 29.97))
+    from_csv.load_from_csv(csv_path)
+    converted_path = str(tmp_path.joinpath('converted.stats'))
+    from_csv.save_to_binary(converted_path)
+    with open(binary_path, 'rb') as original, open(converted_path, 'rb') as converted:
+        assert original.read() == converted.read()
+
+    # Quantized files store metrics as 32-bit floats.
+    quantized_path = str(tmp_path.joinpath('quantized.stats'))
+    stats_manager.save_to_binary(quantized_path, quantize=True)
+    quantized = StatsManager()
+    quantized.load_from_binary(quantized_path)
+    assert quantized.get_metrics(11, metric_keys) == pytest.approx(
+        stats_manager.get_metrics(11, metric_keys))
+
+
+def test_save_binary_to_loaded_path(tmp_path):
+    """ Test saving a binary stats file to the same path it was loaded from, while the metrics are
+    still memory-mapped from it. """
+    stats_manager = StatsManager(FrameTimecode(0, 29.97))
+    stats_manager.register_metrics(['some_metric'])
+    for frame_num in range(100):
+        stats_manager.set_metrics(frame_num, {'some_metric': frame_num / 3.0})
+    binary_path = str(tmp_path.joinpath('stats.stats'))
+    stats_manager.save_to_binary(binary_path)
+
+    loaded = StatsManager()
+    loaded.load_from_binary(binary_path)
+    loaded.register_metrics(['another_metric'])
+    loaded.set_metrics(50, {'another_metric': 1.0})
+    loaded.save_to_binary(binary_path)
+    assert loaded.get_metrics(99, ['some_metric']) == [33.0]
+
+    reloaded = StatsManager()
+    assert reloaded.load_from_binary(binary_path) == 100
+    assert reloaded.get_metrics(50,
+                                ['some_metric', 'another_metric']) == pytest.approx([50 / 3.0, 1.0])
+    assert reloaded.get_metrics(99, ['some_metric']) == [33.0]
+    assert os.listdir(tmp_path) == ['stats.stats']
+
+
+def test_load_corrupt_binary_stats(tmp_path):
+    """ Test loading a file which is not a valid binary stats file. """
+    stats_path = tmp_path.joinpath('corrupt.stats')
+    stats_path.write_bytes(b'not a stats file')
+    with pytest.raises(StatsFileCorrupt):
+        StatsManager().load_from_binary(str(stats_path))
+    assert StatsManager().load_from_binary(str(tmp_path.joinpath('missing.stats'))) is None
+
+
+def test_save_load_csv(tmp_path):
+    """ Test the contents of a saved CSV file, and loading it with `StatsManager.load`. """
+    framerate = 30000 / 1001
+    stats_manager = StatsManager(FrameTimecode(0, framerate))
+    stats_manager.register_metrics(['b_metric', 'a_metric'])
+    frame_nums = [0, 1, 2, 1798, 1799, 107892, 107893]
+    for frame_num in frame_nums:
+        stats_manager.set_metrics(frame_num, {'a_metric': frame_num / 3.0})
+        if frame_num % 2:
+            stats_manager.set_metrics(frame_num, {'b_metric': 1e-7 * frame_num})
+
+    csv_path = str(tmp_path.joinpath('stats.csv'))
+    stats_manager.save(csv_path)
+    with open(csv_path, 'r') as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert rows[0] == [COLUMN_NAME_FRAME_NUMBER, COLUMN_NAME_TIMECODE, 'a_metric', 'b_metric']
+    expected_rows = [[
+        str(frame_num + 1),
+        FrameTimecode(frame_num, framerate).get_timecode(),
+        str(frame_num / 3.0),
+        str(1e-7 * frame_num) if frame_num % 2 else 'None'
+    ] for frame_num in frame_nums]
+    assert rows[1:] == expected_rows
+
+    loaded = StatsManager()
+    assert loaded.load(csv_path) == len(frame_nums)
+    assert not loaded.is_save_required()
+    for frame_num in range(0, 107900):
+        assert loaded.get_metrics(frame_num, ['a_metric', 'b_metric']) == stats_manager.get_metrics(
+            frame_num, ['a_metric', 'b_metric'])
+    assert StatsManager().load(str(tmp_path.joinpath('missing.csv'))) is None
+
+
+def test_stream_to_csv(tmp_path):
+    """ Test writing metrics to a CSV file during detection gives the same file as saving it
+    afterwards, and that written frames are evicted from memory. """
+    csv_path = str(tmp_path.joinpath('stats.csv'))
+    streamed_path = str(tmp_path.joinpath('streamed.csv'))
+    stats_manager = StatsManager(FrameTimecode(0, 29.97))
+    streamed = StatsManager(FrameTimecode(0, 29.97))
+    for stats in (stats_manager, streamed):
+        stats.register_metrics(['a', 'b'])
+    streamed.open_stream(streamed_path)
+
+    num_frames = 5000
+    delay = 3
+    for frame_num in range(num_frames):
+        for stats in (stats_manager, streamed):
+            stats.set_metrics(frame_num, {'a': frame_num * 0.5})
+            # Metric `b` is set a few frames later, like AdaptiveDetector's adaptive_ratio.
+            if frame_num >= delay:
+                stats.set_metrics(frame_num - delay, {'b': frame_num / 3.0})
+        streamed.stream_frames(frame_num + 1 - delay)
+        # Frames which were written should no longer be kept in memory.
+        assert streamed.get_metrics(frame_num, ['a']) == [frame_num * 0.5]
+        assert len(streamed._frame_set) <= 2048
+    assert not streamed.metrics_exist(0, ['a'])
+
+    # The file should already contain the frames which were written.
+    with open(streamed_path, 'r') as csv_file:
+        assert len(csv_file.readlines()) > 1
+    streamed.close_stream()
+    stats_manager.save_to_csv(csv_path)
+    with open(csv_path, 'r') as csv_file, open(streamed_path, 'r') as streamed_file:
+        assert csv_file.read() == streamed_file.read()
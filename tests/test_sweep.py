@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+#         PySceneDetect: Python-Based Video Scene Detector
+#   ---------------------------------------------------------------
+#     [  Site:   http://www.scenedetect.scenedetect.com/         ]
+#     [  Docs:   http://manual.scenedetect.scenedetect.com/      ]
+#     [  Github: https://github.com/Breakthrough/PySceneDetect/  ]
+#
+# Copyright (C) 2014-2022 Brandon Castellano <http://www.bcastell.com>.
+# PySceneDetect is licensed under the BSD 3-Clause License; see the
+# included LICENSE file, or visit one of the above pages for details.
+#
+""" PySceneDetect scenedetect.sweep Tests
+
+This file includes unit tests for the scenedetect.sweep module, which evaluates many
+combinations of detector parameters from frame metrics calculated once.
+"""
+
+import numpy
+import pytest
+
+from scenedetect import SceneManager, StatsManager
+from scenedetect.backends.opencv import VideoStreamCv2
+from scenedetect.detectors import AdaptiveDetector, ContentDetector, ThresholdDetector
+from scenedetect.sweep import evaluate_cuts, sweep_detector
+
+START_FRAME = 30
+END_FRAME = 400
+
+
+def _detect_cuts(video_path, detector, stats_manager=None):
+    video = VideoStreamCv2(video_path)
+    video.seek(START_FRAME)
+    scene_manager = SceneManager(stats_manager)
+    scene_manager.add_detector(detector)
+    scene_manager.detect_scenes(video=video, end_time=END_FRAME)
+    return [cut.get_frames() for cut in scene_manager.get_cut_list()]
+
+
+@pytest.mark.parametrize('detector_type,threshold_arg,thresholds',
+                         [(ContentDetector, 'threshold', [10.0, 27.0, 60.0]),
+                          (AdaptiveDetector, 'adaptive_threshold', [1.5, 3.0, 6.0])])
+def test_sweep_detector(test_video_file, detector_type, threshold_arg, thresholds):
+    """ Test that sweep_detector finds the same cuts as the detector does with each combination
+    of parameters. """
+    stats = StatsManager()
+    detector = detector_type()
+    _detect_cuts(test_video_file, detector, stats)
+    min_scene_lens = [0, 15, 60]
+    results = sweep_detector(detector, stats, START_FRAME, END_FRAME, thresholds, min_scene_lens)
+    assert [(result.threshold, result.min_scene_len) for result in results] == [
+        (threshold, min_scene_len) for threshold in thresholds for min_scene_len in min_scene_lens
+    ]
+    for result in results:
+        expected = _detect_cuts(
+            test_video_file,
+            detector_type(**{
+                threshold_arg: result.threshold,
+                'min_scene_len': result.min_scene_len
+            }))
+        assert result.cuts.tolist() == expected
+        assert result.precision is None and result.f1_score is None
+
+    # Metrics outside of the range which scenes were detected in are missing.
+    with pytest.raises(ValueError):
+        sweep_detector(detector, stats, 0, END_FRAME)
+    with pytest.raises(TypeError):
+        sweep_detector(ThresholdDetector(), stats, START_FRAME, END_FRAME)
+
+
+def test_sweep_detector_expected_cuts(test_video_file):
+    """ Test the precision and recall calculated when expected cuts are given. """
+    stats = StatsManager()
+    detector = ContentDetector()
+    cuts = _detect_cuts(test_video_file, detector, stats)
+    assert len(cuts) >= 2
+    expected_cuts = [cuts[0] + 1, cuts[1] + 10]
+    result = sweep_detector(detector, stats, START_FRAME, END_FRAME, expected_cuts=expected_cuts)[0]
+    assert result.precision == pytest.approx(0.0)
+    result = sweep_detector(
+        detector, stats, START_FRAME, END_FRAME, expected_cuts=expected_cuts, tolerance=1)[0]
+    assert result.precision == pytest.approx(1.0 / len(cuts))
+    assert result.recall == pytest.approx(0.5)
+
+
+def test_evaluate_cuts():
+    """ Test that each expected cut only matches a single cut. """
+    cuts = numpy.array([10, 11, 50, 100])
+    assert evaluate_cuts(cuts, numpy.array([10, 50, 100])) == (0.75, 1.0)
+    assert evaluate_cuts(cuts, numpy.array([12, 99]), tolerance=1) == (0.5, 1.0)
+    assert evaluate_cuts(cuts, numpy.array([12, 99])) == (0.0, 0.0)
+    assert evaluate_cuts(numpy.array([]), numpy.array([])) == (1.0, 1.0)
@@ -27,7 +27,7 @@ import os.path
 import numpy
 import pytest
 
-from scenedetect.video_stream import VideoStream
+from scenedetect.video_stream import VideoStream, PIXEL_FORMAT_BGR, PIXEL_FORMAT_GRAY
 from scenedetect.backends.opencv import VideoStreamCv2
 from scenedetect.backends.pyav import VideoStreamAv
 from scenedetect.video_manager import VideoManager
@@ -149,6 +149,34 @@ class TestVideoStream:
         stream.read(decode=False, advance=False)
         assert stream.frame_number == 1
 
+    def test_read_batch(self, vs_type: Type[VideoStream], test_video: VideoParameters):
+        """Validate `read_batch` returns the same frames as `read`."""
+        stream = vs_type(test_video.path)
+        expected = [stream.read().copy() for _ in range(5)]
+        stream.reset()
+        batch = stream.read_batch(3)
+        assert batch.shape == (3, test_video.height, test_video.width, 3)
+        assert stream.frame_number == 3
+        # Frames are read into `out` if set, and fewer frames can be read than it holds.
+        out = numpy.empty_like(batch)
+        assert stream.read_batch(2, out=out).base is out
+        assert stream.frame_number == 5
+        for frame, expected_frame in zip(list(batch) + list(out[:2]), expected):
+            assert numpy.array_equal(frame, expected_frame)
+        with pytest.raises(ValueError):
+            stream.read_batch(1, out=numpy.empty((1, 1, 1, 3), dtype=numpy.uint8))
+
+    def test_output_format(self, vs_type: Type[VideoStream], test_video: VideoParameters):
+        """Validate frames are returned in greyscale if the backend supports it."""
+        stream = vs_type(test_video.path)
+        assert not stream.set_output_format('invalid')
+        if not stream.set_output_format(PIXEL_FORMAT_GRAY):
+            pytest.skip('Backend does not support greyscale output.')
+        assert stream.read().shape == (test_video.height, test_video.width)
+        assert stream.read_batch(2).shape == (2, test_video.height, test_video.width)
+        assert stream.set_output_format(PIXEL_FORMAT_BGR)
+        assert stream.read().shape == (test_video.height, test_video.width, 3)
+
     def test_time_invariants(self, vs_type: Type[VideoStream], test_video: VideoParameters):
         """Validates basic time keeping identities/invariants on the `VideoStream.position`,
         `VideoStream.position_ms`, and `VideoStream.frame_number` properties."""